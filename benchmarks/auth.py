@@ -0,0 +1,76 @@
+"""
+Measures the overhead of authenticating a request.
+
+Times ``get_current_user`` for the same access token sent over and over, the
+way a polling client does, once with every call verifying the token in full
+(signature, claims, payload parsing) and once with the verified token cache.
+
+Usage:
+    python -m benchmarks.auth --calls 100000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+from benchmarks.transcription import environment
+from src.auth.security import token as token_module
+from src.auth.security.dependencies import get_current_user
+from src.auth.security.schemas import TokenPayload
+from src.auth.security.token import VerifiedTokenCache, create_access_token
+from src.config import settings
+from src.users.models import Role
+
+
+async def measure(token: str, calls: int) -> float:
+    """:return: Mean microseconds per call."""
+
+    await get_current_user(token)
+    started = time.perf_counter()
+    for _ in range(calls):
+        await get_current_user(token)
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--output", help="File to save the results to")
+    args = parser.parse_args()
+
+    token = create_access_token(TokenPayload(id=uuid.uuid4(), role=Role.USER))
+    results = {}
+    for name, size in (
+        ("uncached", 0),
+        ("cached", settings.ACCESS_TOKEN_CACHE_SIZE),
+    ):
+        token_module.access_token_cache = VerifiedTokenCache(size)
+        results[name] = {
+            "microseconds_per_call": round(
+                asyncio.run(measure(token, args.calls)), 2
+            )
+        }
+    results["speedup"] = round(
+        results["uncached"]["microseconds_per_call"]
+        / results["cached"]["microseconds_per_call"],
+        1,
+    )
+
+    report = {
+        "environment": environment(),
+        "calls": args.calls,
+        "algorithm": settings.JWT_ALGORITHM,
+        "results": results,
+    }
+    print(json.dumps(report, indent=2))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Compares per-request decoding with the dynamic batch scheduler.
+
+Simulates ``--requests`` concurrent transcriptions of ``--chunks`` speech
+chunks each and decodes them twice: once the way a single request does it on
+its own (batches of ``--batch-size`` made of its own chunks) and once through
+BatchScheduler, which mixes chunks of all in-flight requests.
+
+Usage:
+    python -m benchmarks.batching --model small --requests 16 --chunks 2
+    python -m benchmarks.batching --audio sample.wav --language en
+"""
+
+import argparse
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import whisperx
+from whisperx.audio import SAMPLE_RATE
+
+from src.transcription.batching import BatchScheduler
+from src.transcription.enums import Model
+from src.transcription.pipeline import decode, get_tokenizer
+
+
+def synthetic_chunk(seconds: float, seed: int) -> np.ndarray:
+    """Amplitude-modulated tones with a little noise, roughly speech-shaped."""
+
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    carrier = sum(
+        np.sin(2 * np.pi * freq * t) for freq in rng.uniform(120, 900, size=3)
+    )
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * rng.uniform(2, 5) * t))
+    noise = 0.05 * rng.standard_normal(t.shape)
+    return (0.1 * carrier * envelope + noise).astype(np.float32)
+
+
+def load_chunks(args: argparse.Namespace) -> list[np.ndarray]:
+    if args.audio is None:
+        return [
+            synthetic_chunk(args.chunk_seconds, seed)
+            for seed in range(args.requests * args.chunks)
+        ]
+
+    audio = whisperx.load_audio(args.audio)
+    size = int(args.chunk_seconds * SAMPLE_RATE)
+    pieces = [audio[i : i + size] for i in range(0, len(audio), size)]
+    pieces = [piece for piece in pieces if len(piece) == size] or [audio[:size]]
+    total = args.requests * args.chunks
+    return [pieces[i % len(pieces)] for i in range(total)]
+
+
+def run(requests: list[list[np.ndarray]], concurrency: int, transcribe) -> dict:
+    latencies: list[float] = []
+
+    def timed(chunks: list[np.ndarray]) -> None:
+        started = time.perf_counter()
+        transcribe(chunks)
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(timed, requests))
+    wall = time.perf_counter() - started
+
+    total_chunks = sum(len(chunks) for chunks in requests)
+    latencies.sort()
+    return {
+        "wall_seconds": round(wall, 3),
+        "chunks_per_second": round(total_chunks / wall, 3),
+        "latency_mean_seconds": round(statistics.fmean(latencies), 3),
+        "latency_p95_seconds": round(
+            latencies[int(0.95 * (len(latencies) - 1))], 3
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--model", default=Model.SMALL.value)
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--compute-type", default="float32")
+    parser.add_argument("--download-root", default="models")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--audio", help="Audio file to cut chunks from")
+    parser.add_argument("--requests", type=int, default=16)
+    parser.add_argument("--chunks", type=int, default=2)
+    parser.add_argument("--chunk-seconds", type=float, default=5.0)
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--max-batch-size", type=int, default=8)
+    parser.add_argument("--max-wait-ms", type=int, default=20)
+    args = parser.parse_args()
+
+    pipeline = whisperx.load_model(
+        whisper_arch=args.model,
+        device=args.device,
+        compute_type=args.compute_type,
+        download_root=args.download_root,
+    )
+    chunks = load_chunks(args)
+    tokenizer = get_tokenizer(pipeline, chunks[0], args.language)
+    requests = [
+        chunks[i : i + args.chunks] for i in range(0, len(chunks), args.chunks)
+    ]
+
+    def per_request(request_chunks: list[np.ndarray]) -> None:
+        for start in range(0, len(request_chunks), args.batch_size):
+            decode(
+                pipeline,
+                request_chunks[start : start + args.batch_size],
+                tokenizer,
+            )
+
+    scheduler = BatchScheduler(
+        max_batch_size=args.max_batch_size, max_wait=args.max_wait_ms / 1000
+    )
+
+    def scheduled(request_chunks: list[np.ndarray]) -> None:
+        scheduler.decode(pipeline, tokenizer, request_chunks)
+
+    # Warm up kernels and allocators so neither path pays for it.
+    per_request(requests[0])
+
+    results = {
+        "model": args.model,
+        "requests": args.requests,
+        "chunks_per_request": args.chunks,
+        "chunk_seconds": args.chunk_seconds,
+        "per_request": run(requests, args.requests, per_request),
+        "scheduled": run(requests, args.requests, scheduled),
+    }
+    scheduler.close()
+
+    results["speedup"] = round(
+        results["per_request"]["wall_seconds"]
+        / results["scheduled"]["wall_seconds"],
+        3,
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+Measures how a storm of logins affects the latency of other routes.
+
+Runs the application in-process and sends ``--logins`` logins,
+``--concurrency`` at a time, while probing ``/healthcheck`` every
+``--probe-interval`` seconds. The storm runs twice: once with passwords
+verified on the event loop, the way logins used to be handled, and once on
+the password hashing pool. The user store is replaced by a single in-memory
+user, so no database is needed and only the Argon2 work is measured.
+
+Usage:
+    python -m benchmarks.login_storm --logins 200 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+import uuid
+from types import SimpleNamespace
+
+from httpx import ASGITransport, AsyncClient
+
+from benchmarks.transcription import environment
+from src.auth import routes as auth_routes
+from src.auth.security.passwords import (
+    PasswordHashingPool,
+    hash_password,
+    verify_and_update_password,
+)
+from src.config import settings
+from src.main import app
+from src.users.dependencies import provide_user_service
+from src.users.models import Role
+
+USERNAME = "storm"
+PASSWORD = "storm-password"
+
+
+class InlinePool:
+    """Verifies on the event loop, as logins did before the pool."""
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        return verify_and_update_password(plain_password, hashed_password)
+
+
+class SingleUserService:
+    def __init__(self):
+        self._user = SimpleNamespace(
+            id=uuid.uuid4(),
+            username=USERNAME,
+            password=hash_password(PASSWORD),
+            role=Role.USER,
+        )
+
+    async def get_one_or_none(self, username: str):
+        return self._user if username == USERNAME else None
+
+    def __call__(self) -> "SingleUserService":
+        return self
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def latency_summary(values: list[float]) -> dict:
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 0.5) * 1000, 2),
+        "p99_ms": round(percentile(values, 0.99) * 1000, 2),
+        "max_ms": round(max(values) * 1000, 2),
+    }
+
+
+async def probe(
+    client: AsyncClient, interval: float, stop: asyncio.Event
+) -> list[float]:
+    """
+    Sends requests at a fixed rate and measures each one from the time it
+    was due, so time the event loop spent blocked counts as latency.
+    """
+
+    latencies = []
+    due = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        await client.get("/healthcheck")
+        latencies.append(time.perf_counter() - due)
+        due += interval
+    return latencies
+
+
+async def storm(args: argparse.Namespace) -> dict:
+    """Runs the probe alone, then during a login storm."""
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    logins: list[float] = []
+    statuses: dict[int, int] = {}
+
+    async def login(client: AsyncClient) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.post(
+                "/auth/login",
+                json={"username": USERNAME, "password": PASSWORD},
+            )
+            logins.append(time.perf_counter() - started)
+            statuses[response.status_code] = (
+                statuses.get(response.status_code, 0) + 1
+            )
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        stop = asyncio.Event()
+        idle = asyncio.create_task(probe(client, args.probe_interval, stop))
+        await asyncio.sleep(args.idle_seconds)
+        stop.set()
+        baseline = await idle
+
+        stop = asyncio.Event()
+        busy = asyncio.create_task(probe(client, args.probe_interval, stop))
+        started = time.perf_counter()
+        await asyncio.gather(*(login(client) for _ in range(args.logins)))
+        duration = time.perf_counter() - started
+        stop.set()
+        during = await busy
+
+    return {
+        "healthcheck_idle": latency_summary(baseline),
+        "healthcheck_during_storm": latency_summary(during),
+        "login": latency_summary(logins),
+        "login_statuses": statuses,
+        "logins_per_second": round(len(logins) / duration, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--probe-interval", type=float, default=0.01)
+    parser.add_argument("--idle-seconds", type=float, default=1.0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", help="File to save the results to")
+    args = parser.parse_args()
+
+    # Every probe would be logged otherwise.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    workers = args.workers or settings.PASSWORD_HASH_WORKERS
+    app.dependency_overrides[provide_user_service] = SingleUserService()
+    results = {}
+    for name, pool in (
+        ("event_loop", InlinePool()),
+        (
+            "pool",
+            PasswordHashingPool(max_workers=workers, max_pending=args.logins),
+        ),
+    ):
+        auth_routes.password_pool = pool
+        results[name] = asyncio.run(storm(args))
+
+    report = {
+        "environment": environment(),
+        "logins": args.logins,
+        "concurrency": args.concurrency,
+        "workers": workers,
+        "results": results,
+    }
+    print(json.dumps(report, indent=2))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Measures password verification latency at several Argon2 costs.
+
+Each ``--costs`` entry is ``time_cost:memory_cost_kb:parallelism``. For every
+cost a password is hashed once and verified ``--repeats`` times; pick the
+most expensive cost whose latency is acceptable for logins on the host and
+set it with the ``ARGON2_*`` settings.
+
+Usage:
+    python -m benchmarks.passwords --repeats 10
+    python -m benchmarks.passwords --costs 2:19456:1 3:65536:4 4:131072:4
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from benchmarks.transcription import environment
+from src.auth.security.passwords import create_password_context
+from src.config import settings
+
+DEFAULT_COSTS = ("2:19456:1", "2:65536:1", "3:65536:4", "4:131072:4")
+
+
+def parse_cost(value: str) -> tuple[int, int, int]:
+    time_cost, memory_cost_kb, parallelism = map(int, value.split(":"))
+    return time_cost, memory_cost_kb, parallelism
+
+
+def measure(cost: tuple[int, int, int], repeats: int) -> dict:
+    context = create_password_context(*cost)
+    hashed = context.hash("benchmark-password")
+    latencies = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        context.verify("benchmark-password", hashed)
+        latencies.append(time.perf_counter() - started)
+    return {
+        "time_cost": cost[0],
+        "memory_cost_kb": cost[1],
+        "parallelism": cost[2],
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2),
+        "min_ms": round(min(latencies) * 1000, 2),
+        "max_ms": round(max(latencies) * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--costs", nargs="+", default=list(DEFAULT_COSTS))
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--output", help="File to save the results to")
+    args = parser.parse_args()
+
+    report = {
+        "environment": environment(),
+        "repeats": args.repeats,
+        "configured": (
+            f"{settings.ARGON2_TIME_COST}:{settings.ARGON2_MEMORY_COST_KB}:"
+            f"{settings.ARGON2_PARALLELISM}"
+        ),
+        "results": [
+            measure(parse_cost(cost), args.repeats) for cost in args.costs
+        ],
+    }
+    print(json.dumps(report, indent=2))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Measures the latency of live transcription.
+
+Plays audio into a LiveTranscription session at ``--speed`` times real time,
+in frames of ``--frame-ms``, and runs a step whenever ``--step-ms`` of new
+audio has arrived, the way the WebSocket endpoint does. The latency of a
+segment is the time between the moment the audio up to its end was sent and
+the moment the segment was produced.
+
+Without ``--audio`` the input is synthetic: bursts of speech-shaped tones
+separated by silence. VAD may not treat tones as speech the way it treats a
+voice, so use a real recording for representative numbers.
+
+Usage:
+    python -m benchmarks.realtime --model small --seconds 30
+    python -m benchmarks.realtime --audio call.wav --language en --speed 2
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+
+import numpy as np
+
+from benchmarks.batching import synthetic_chunk
+from src.transcription.audio import SAMPLE_RATE, decode_audio
+from src.transcription.batching import BatchScheduler
+from src.transcription.enums import Language, Model
+from src.transcription.realtime import LiveSegment, LiveTranscription
+from src.transcription.speech_transcription import SpeechTranscription
+
+
+def synthetic_stream(seconds: float) -> np.ndarray:
+    """Alternates 2-4 s of speech-shaped audio with 0.6-1.2 s of silence."""
+
+    rng = np.random.default_rng(0)
+    parts: list[np.ndarray] = []
+    total = 0.0
+    while total < seconds:
+        speech = rng.uniform(2, 4)
+        silence = rng.uniform(0.6, 1.2)
+        parts.append(synthetic_chunk(speech, seed=len(parts)))
+        parts.append(np.zeros(int(silence * SAMPLE_RATE), dtype=np.float32))
+        total += speech + silence
+    return np.concatenate(parts)[: int(seconds * SAMPLE_RATE)]
+
+
+def summarize(values: list[float]) -> dict:
+    if not values:
+        return {"count": 0}
+    values = sorted(values)
+    return {
+        "count": len(values),
+        "mean_seconds": round(statistics.fmean(values), 3),
+        "p95_seconds": round(values[int(0.95 * (len(values) - 1))], 3),
+        "max_seconds": round(values[-1], 3),
+    }
+
+
+def run(
+    session: LiveTranscription,
+    audio: np.ndarray,
+    frame_ms: int,
+    step_ms: int,
+    speed: float,
+) -> dict:
+    frame = int(SAMPLE_RATE * frame_ms / 1000)
+    frames = [audio[i : i + frame] for i in range(0, len(audio), frame)]
+    fed = threading.Event()
+    started = time.perf_counter()
+
+    def feed() -> None:
+        for index, samples in enumerate(frames):
+            due = started + index * frame_ms / 1000 / speed
+            time.sleep(max(0.0, due - time.perf_counter()))
+            session.feed(samples)
+        fed.set()
+
+    produced: list[tuple[LiveSegment, float]] = []
+    step_seconds: list[float] = []
+
+    def step(final: bool = False) -> None:
+        step_started = time.perf_counter()
+        segments = session.step(final)
+        now = time.perf_counter()
+        step_seconds.append(now - step_started)
+        produced.extend((segment, now) for segment in segments)
+
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+    while not fed.is_set():
+        if session.pending_seconds >= step_ms / 1000:
+            step()
+        else:
+            time.sleep(0.005)
+    feeder.join()
+    step(final=True)
+    wall = time.perf_counter() - started
+
+    def latency(segment: LiveSegment, at: float) -> float:
+        return at - (started + segment.end / speed)
+
+    return {
+        "audio_seconds": round(len(audio) / SAMPLE_RATE, 3),
+        "wall_seconds": round(wall, 3),
+        "steps": summarize(step_seconds),
+        "final_latency": summarize(
+            [latency(s, at) for s, at in produced if s.final]
+        ),
+        "partial_latency": summarize(
+            [latency(s, at) for s, at in produced if not s.final]
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--model", default=Model.SMALL.value)
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--compute-type", default="float32")
+    parser.add_argument("--download-root", default="models")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--audio", help="Recording to play instead of tones")
+    parser.add_argument("--seconds", type=float, default=30.0)
+    parser.add_argument("--frame-ms", type=int, default=100)
+    parser.add_argument("--step-ms", type=int, default=1000)
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--batch-scheduler", action="store_true")
+    args = parser.parse_args()
+
+    model = Model(args.model)
+    scheduler = BatchScheduler() if args.batch_scheduler else None
+    transcriber = SpeechTranscription(
+        device=args.device,
+        compute_type=args.compute_type,
+        download_root=args.download_root,
+        init_models=[model],
+        batch_scheduler=scheduler,
+    )
+    audio = (
+        decode_audio(args.audio)[: int(args.seconds * SAMPLE_RATE)]
+        if args.audio
+        else synthetic_stream(args.seconds)
+    )
+    language = Language(args.language) if args.language else None
+
+    # Warm up so the first step does not pay for lazy initialization.
+    warmup = LiveTranscription(transcriber, model, language)
+    warmup.feed(audio[: 2 * SAMPLE_RATE])
+    warmup.step(final=True)
+
+    session = LiveTranscription(transcriber, model, language)
+    results = {
+        "model": args.model,
+        "step_ms": args.step_ms,
+        "speed": args.speed,
+        **run(session, audio, args.frame_ms, args.step_ms, args.speed),
+    }
+    transcriber.clean()
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
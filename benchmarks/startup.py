@@ -0,0 +1,159 @@
+"""
+Measures how long the API takes to start.
+
+Every repeat runs in fresh processes and measures:
+
+- the time to import ``src.main`` and which of the heavy ML modules (PyTorch,
+  CTranslate2, the WhisperX pipeline) that pulled in;
+- with ``--server``, the time from launching ``uvicorn`` until
+  ``/healthcheck`` answers (the server accepts requests) and until
+  ``/readiness`` answers 200 (the preloaded models are loaded).
+
+The server is started with the environment of this process, so it needs the
+same configuration (``.env``, a reachable database) as a regular run.
+
+Usage:
+    python -m benchmarks.startup --repeats 5
+    python -m benchmarks.startup --server --output startup.json
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+from benchmarks.transcription import environment
+
+HEAVY_MODULES = ("torch", "ctranslate2", "faster_whisper", "whisperx.asr")
+
+IMPORT_SCRIPT = f"""
+import json, sys, time
+started = time.perf_counter()
+import src.main
+print(json.dumps({{
+    "seconds": time.perf_counter() - started,
+    "heavy_modules": [m for m in {HEAVY_MODULES!r} if m in sys.modules],
+}}))
+"""
+
+
+def measure_import() -> dict:
+    """Imports the application in a fresh interpreter."""
+
+    output = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", IMPORT_SCRIPT],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(
+    client: httpx.Client, path: str, started: float, timeout: float
+) -> float:
+    """
+    Polls a path until it answers 200.
+
+    :return: Seconds from ``started`` until it did.
+    """
+
+    while time.perf_counter() - started < timeout:
+        try:
+            if client.get(path).status_code == 200:
+                return time.perf_counter() - started
+        except httpx.TransportError:
+            pass
+        time.sleep(0.05)
+    raise TimeoutError(f"{path} did not answer 200 within {timeout} s")
+
+
+def measure_server(timeout: float) -> dict:
+    """Starts the server and waits until it is alive and ready."""
+
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "src.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env={**os.environ, "PYTHONWARNINGS": "ignore"},
+    )
+    try:
+        with httpx.Client(
+            base_url=f"http://127.0.0.1:{port}", timeout=1
+        ) as client:
+            alive = wait_for(client, "/healthcheck", started, timeout)
+            ready = wait_for(client, "/readiness", started, timeout)
+    finally:
+        server.terminate()
+        server.wait()
+    return {"alive_seconds": alive, "ready_seconds": ready}
+
+
+def summarize(values: list[float]) -> dict:
+    return {
+        "mean_seconds": round(statistics.fmean(values), 3),
+        "min_seconds": round(min(values), 3),
+        "max_seconds": round(max(values), 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--server",
+        action="store_true",
+        help="Also start the server and time liveness and readiness",
+    )
+    parser.add_argument("--timeout", type=float, default=600.0)
+    parser.add_argument("--output", help="File to save the results to")
+    args = parser.parse_args()
+
+    imports = [measure_import() for _ in range(args.repeats)]
+    results = {
+        "import": {
+            **summarize([run["seconds"] for run in imports]),
+            "heavy_modules": imports[-1]["heavy_modules"],
+        },
+    }
+    if args.server:
+        servers = [measure_server(args.timeout) for _ in range(args.repeats)]
+        results["alive"] = summarize([run["alive_seconds"] for run in servers])
+        results["ready"] = summarize([run["ready_seconds"] for run in servers])
+
+    report = {
+        "environment": environment(),
+        "repeats": args.repeats,
+        "results": results,
+    }
+    print(json.dumps(report, indent=2))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main()
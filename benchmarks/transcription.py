@@ -0,0 +1,441 @@
+"""
+End-to-end benchmark suite of the transcription pipeline.
+
+For every combination of ``--models`` and ``--compute-types`` a fresh process
+loads the model and measures:
+
+- model load time and peak RSS of the process;
+- latency (mean, p50, p95) and real-time factor of ``SpeechTranscription``
+  on audio of each of ``--durations`` seconds;
+- throughput and latency of ``--throughput-seconds`` long transcriptions run
+  ``--concurrency`` at a time, directly and through the
+  ``/transcription/transcribe`` route (in-process ASGI, WAV uploads).
+
+Without ``--audio`` the input is synthetic: bursts of speech-shaped tones
+separated by silence, the same for every run, so results of two commits can
+be compared. A real recording gives more representative absolute numbers.
+
+Results are printed and, with ``--output``, saved as JSON; ``--compare``
+prints the relative change of every metric against an earlier result file.
+
+Usage:
+    python -m benchmarks.transcription --models small --output before.json
+    python -m benchmarks.transcription --models small --compare before.json
+    python -m benchmarks.transcription --models small medium \\
+        --compute-types int8 float32 --durations 10 60 --concurrency 1 4
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import tempfile
+import time
+import uuid
+import wave
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+
+import numpy as np
+from httpx import ASGITransport, AsyncClient
+
+from benchmarks.realtime import synthetic_stream
+from src.auth.security.dependencies import get_current_user
+from src.auth.security.schemas import TokenPayload
+from src.main import app
+from src.transcription.audio import SAMPLE_RATE, decode_audio
+from src.transcription.batching import BatchScheduler
+from src.transcription.dependencies import (
+    provide_transcription_service,
+    provide_upload_storage,
+)
+from src.transcription.enums import Language, Model
+from src.transcription.executor import InferenceExecutor
+from src.transcription.services import SpeechTranscriptionService
+from src.transcription.speech_transcription import SpeechTranscription
+from src.transcription.storage import TempStorage
+from src.users.models import Role
+
+# Leaves of a result that describe the workload rather than measure it.
+PARAMETERS = {"audio_seconds", "concurrency", "requests"}
+
+
+def summarize(latencies: list[float]) -> dict:
+    values = sorted(latencies)
+    return {
+        "mean_seconds": round(statistics.fmean(values), 3),
+        "p50_seconds": round(values[int(0.50 * (len(values) - 1))], 3),
+        "p95_seconds": round(values[int(0.95 * (len(values) - 1))], 3),
+    }
+
+
+def make_audio(seconds: float, recording: np.ndarray | None) -> np.ndarray:
+    if recording is None:
+        return synthetic_stream(seconds)
+    repeats = int(np.ceil(seconds * SAMPLE_RATE / len(recording)))
+    return np.tile(recording, repeats)[: int(seconds * SAMPLE_RATE)]
+
+
+def to_wav(audio: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes((np.clip(audio, -1, 1) * 32767).astype("<i2").tobytes())
+    return buffer.getvalue()
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    scale = 1024 * 1024 if platform.system() == "Darwin" else 1024
+    return round(peak / scale, 1)
+
+
+def measure_latency(
+    transcriber: SpeechTranscription,
+    model: Model,
+    language: Language | None,
+    audio: np.ndarray,
+    repeats: int,
+) -> dict:
+    latencies = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        transcriber.transcribe(audio, model, language=language)
+        latencies.append(time.perf_counter() - started)
+
+    seconds = len(audio) / SAMPLE_RATE
+    return {
+        "audio_seconds": round(seconds, 3),
+        **summarize(latencies),
+        "real_time_factor": round(statistics.fmean(latencies) / seconds, 4),
+    }
+
+
+def measure_throughput(
+    transcribe, requests: int, concurrency: int, audio_seconds: float
+) -> dict:
+    latencies: list[float] = []
+
+    def timed(_: int) -> None:
+        started = time.perf_counter()
+        transcribe()
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(timed, range(requests)))
+    wall = time.perf_counter() - started
+
+    return {
+        "concurrency": concurrency,
+        "requests": requests,
+        "wall_seconds": round(wall, 3),
+        "requests_per_second": round(requests / wall, 3),
+        "audio_seconds_per_second": round(requests * audio_seconds / wall, 3),
+        **summarize(latencies),
+    }
+
+
+def measure_route(
+    transcriber: SpeechTranscription,
+    wav: bytes,
+    model: Model,
+    language: Language | None,
+    requests: int,
+    concurrency: int,
+    audio_seconds: float,
+) -> dict:
+    """
+    Sends WAV uploads to ``/transcription/transcribe`` through the ASGI app,
+    without authentication and without the result cache, so that repeated
+    uploads of the same audio are transcribed every time.
+    """
+
+    executor = InferenceExecutor(max_workers=concurrency, max_pending=requests)
+    service = SpeechTranscriptionService(transcriber, executor)
+    user = TokenPayload(id=uuid.uuid4(), role=Role.USER)
+    data = {"model": model.value}
+    if language is not None:
+        data["language"] = language.value
+
+    async def run(directory: str) -> dict:
+        storage = TempStorage(directory)
+        app.dependency_overrides[provide_transcription_service] = (
+            lambda: service
+        )
+        app.dependency_overrides[provide_upload_storage] = lambda: storage
+        app.dependency_overrides[get_current_user] = lambda: user
+        latencies: list[float] = []
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def post(client: AsyncClient) -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.post(
+                    "/transcription/transcribe",
+                    files={"file": ("audio.wav", wav, "audio/wav")},
+                    data=data,
+                )
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://benchmark",
+            timeout=None,
+        ) as client:
+            started = time.perf_counter()
+            await asyncio.gather(*(post(client) for _ in range(requests)))
+            wall = time.perf_counter() - started
+        app.dependency_overrides.clear()
+
+        return {
+            "concurrency": concurrency,
+            "requests": requests,
+            "wall_seconds": round(wall, 3),
+            "requests_per_second": round(requests / wall, 3),
+            "audio_seconds_per_second": round(
+                requests * audio_seconds / wall, 3
+            ),
+            **summarize(latencies),
+        }
+
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            return asyncio.run(run(directory))
+    finally:
+        executor.shutdown()
+
+
+def run_config(model_name: str, compute_type: str, options: dict) -> dict:
+    """
+    Benchmarks one model and compute type. Runs in its own process so that
+    the peak RSS and load time belong to this configuration alone.
+    """
+
+    model = Model(model_name)
+    language = Language(options["language"]) if options["language"] else None
+    recording = decode_audio(options["audio"]) if options["audio"] else None
+    scheduler = BatchScheduler() if options["batch_scheduler"] else None
+
+    baseline_rss = peak_rss_mb()
+    started = time.perf_counter()
+    transcriber = SpeechTranscription(
+        device=options["device"],
+        compute_type=compute_type,
+        download_root=options["download_root"],
+        init_models=[model],
+        batch_scheduler=scheduler,
+    )
+    load_seconds = time.perf_counter() - started
+
+    try:
+        # Warm up so the first measurement does not pay for lazy setup.
+        transcriber.transcribe(
+            make_audio(2, recording), model, language=language
+        )
+
+        latency = [
+            measure_latency(
+                transcriber,
+                model,
+                language,
+                make_audio(seconds, recording),
+                options["repeats"],
+            )
+            for seconds in options["durations"]
+        ]
+
+        seconds = options["throughput_seconds"]
+        audio = make_audio(seconds, recording)
+        wav = to_wav(audio)
+        throughput = []
+        route = []
+        for concurrency in options["concurrency"]:
+            requests = concurrency * options["repeats"]
+            throughput.append(
+                measure_throughput(
+                    lambda: transcriber.transcribe(
+                        audio, model, language=language
+                    ),
+                    requests,
+                    concurrency,
+                    seconds,
+                )
+            )
+            if options["route"]:
+                route.append(
+                    measure_route(
+                        transcriber,
+                        wav,
+                        model,
+                        language,
+                        requests,
+                        concurrency,
+                        seconds,
+                    )
+                )
+    finally:
+        transcriber.clean()
+
+    return {
+        "model": model.value,
+        "compute_type": compute_type,
+        "load_seconds": round(load_seconds, 3),
+        "baseline_rss_mb": baseline_rss,
+        "peak_rss_mb": peak_rss_mb(),
+        "latency": latency,
+        "throughput": throughput,
+        "route": route,
+    }
+
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "measured_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def flatten(value, prefix: str = "") -> dict[str, float]:
+    """Maps every numeric leaf of a result to a dotted path."""
+
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = ((label(item, index), item) for index, item in enumerate(value))
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        return {prefix: float(value)}
+    else:
+        return {}
+
+    flat: dict[str, float] = {}
+    for key, item in items:
+        flat.update(flatten(item, f"{prefix}.{key}" if prefix else str(key)))
+    return flat
+
+
+def label(item, index: int) -> str:
+    """Names a list entry by what it measured rather than its position."""
+
+    if isinstance(item, dict) and "concurrency" in item:
+        return f"x{item['concurrency']}"
+    if isinstance(item, dict) and "audio_seconds" in item:
+        return f"{item['audio_seconds']:g}s"
+    return str(index)
+
+
+def compare(results: list[dict], baseline: list[dict]) -> None:
+    """Prints the relative change of every metric present in both runs."""
+
+    previous = {(r["model"], r["compute_type"]): r for r in baseline}
+    for result in results:
+        key = (result["model"], result["compute_type"])
+        if key not in previous:
+            print(f"{key[0]}/{key[1]}: no baseline")
+            continue
+
+        old = flatten(previous[key])
+        new = flatten(result)
+        print(f"{key[0]}/{key[1]}:")
+        for metric in sorted(new.keys() & old.keys()):
+            if old[metric] == 0 or metric.rsplit(".", 1)[-1] in PARAMETERS:
+                continue
+            change = (new[metric] - old[metric]) / old[metric] * 100
+            print(
+                f"  {metric:60} {old[metric]:>10.3f} -> "
+                f"{new[metric]:>10.3f} ({change:+.1f}%)"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--models", nargs="+", default=[Model.SMALL.value])
+    parser.add_argument("--compute-types", nargs="+", default=["float32"])
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--download-root", default="models")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--audio", help="Recording to use instead of tones")
+    parser.add_argument(
+        "--durations", type=float, nargs="+", default=[5.0, 30.0, 120.0]
+    )
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--throughput-seconds", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--batch-scheduler", action="store_true")
+    parser.add_argument(
+        "--no-route",
+        dest="route",
+        action="store_false",
+        help="Skip the HTTP route measurements",
+    )
+    parser.add_argument("--output", help="File to save the results to")
+    parser.add_argument("--compare", help="Earlier results to compare with")
+    args = parser.parse_args()
+
+    options = {
+        "device": args.device,
+        "download_root": args.download_root,
+        "language": args.language,
+        "audio": args.audio,
+        "durations": args.durations,
+        "repeats": args.repeats,
+        "throughput_seconds": args.throughput_seconds,
+        "concurrency": args.concurrency,
+        "batch_scheduler": args.batch_scheduler,
+        "route": args.route,
+    }
+
+    results = []
+    for model in args.models:
+        for compute_type in args.compute_types:
+            with ProcessPoolExecutor(
+                max_workers=1, mp_context=get_context("spawn")
+            ) as pool:
+                results.append(
+                    pool.submit(
+                        run_config, model, compute_type, options
+                    ).result()
+                )
+
+    report = {
+        "environment": environment(),
+        "options": options,
+        "results": results,
+    }
+    print(json.dumps(report, indent=2))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f)["results"])
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from alembic import context
 from sqlalchemy import engine_from_config, pool
 
 from src.config import settings
+from src.jobs.models import JobModel  # noqa
 from src.users.models import UserModel  # noqa
 
 config = context.config
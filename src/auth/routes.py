@@ -1,7 +1,8 @@
 from fastapi import APIRouter, HTTPException, status
 
+from src.auth import log
 from src.auth.schemas import Login, Refresh, Token
-from src.auth.security.passwords import verify_password
+from src.auth.security.passwords import password_pool
 from src.auth.security.schemas import TokenPayload
 from src.auth.security.token import (
     create_tokens,
@@ -25,14 +26,29 @@ router = APIRouter(prefix="/auth", tags=["Auth"])
     },
 )
 async def login(request: Login, user_service: UserServiceDep) -> Token:
+    # Read from the database, not the user cache, so a changed password
+    # stops working at once.
     user = await user_service.get_one_or_none(username=request.username)
+    verified, new_hash = (
+        await password_pool.verify_and_update(request.password, user.password)
+        if user
+        else (False, None)
+    )
 
-    if not user or not verify_password(request.password, user.password):
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
         )
 
+    if new_hash is not None:
+        # The hash was made with another Argon2 cost, store one with the
+        # configured cost. A failure only delays the upgrade.
+        try:
+            await user_service.update_password_hash(user.id, new_hash)
+        except Exception:
+            log.exception("Failed to rehash the password of %s", user.id)
+
     payload = TokenPayload(id=user.id, role=user.role)
     access_token, refresh_token = create_tokens(payload)
     return Token(
@@ -1,6 +1,63 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
+from prometheus_client import Gauge, Histogram
+
+from src.auth import log
+from src.config import settings
+
+T = TypeVar("T")
+
+RETRY_AFTER_SECONDS = 1
+
+
+def create_password_context(
+    time_cost: int, memory_cost_kb: int, parallelism: int
+) -> CryptContext:
+    """
+    Creates the context hashing new passwords with the given Argon2 cost.
+    Hashes made with any other cost, higher or lower, need an update.
+
+    :param time_cost: Number of passes over the memory.
+    :param memory_cost_kb: Memory used by one hash, in KiB.
+    :param parallelism: Number of lanes computed in parallel.
+    """
+
+    return CryptContext(
+        schemes=["argon2"],
+        deprecated="auto",
+        argon2__rounds=time_cost,
+        argon2__memory_cost=memory_cost_kb,
+        argon2__parallelism=parallelism,
+    )
+
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+pwd_context = create_password_context(
+    settings.ARGON2_TIME_COST,
+    settings.ARGON2_MEMORY_COST_KB,
+    settings.ARGON2_PARALLELISM,
+)
+
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "Time spent hashing or verifying a password.",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+PASSWORD_HASH_WAIT_SECONDS = Histogram(
+    "password_hash_wait_seconds",
+    "Time a password operation waited for a free hashing thread.",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+PASSWORD_HASH_ADMITTED = Gauge(
+    "password_hash_admitted",
+    "Password operations running or waiting for a hashing thread.",
+)
 
 
 def hash_password(password: str) -> str:
@@ -9,3 +66,126 @@ def hash_password(password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Verifies a password and rehashes it if its hash was made with a cost
+    other than the configured one.
+
+    :return: Whether the password is correct and its new hash, None if the
+        stored hash is up to date or the password is wrong.
+    """
+
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+class PasswordHashingPool:
+    """
+    Runs Argon2 hashing and verification on a small dedicated thread pool,
+    so a burst of logins keeps the event loop free for other requests.
+    Argon2 releases the GIL while it hashes.
+
+    Admission is bounded like the inference pool: at most ``max_workers``
+    operations run at once and at most ``max_pending`` more wait. Anything
+    beyond that is rejected with 503 instead of queueing without bound.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 64):
+        """
+        :param max_workers: Number of threads hashing concurrently.
+        :param max_pending: Number of operations allowed to wait for a free
+            thread.
+        """
+
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_pending < 0:
+            raise ValueError("max_pending must not be negative")
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password"
+        )
+        self._limit = max_workers + max_pending
+        self._admitted = 0
+        self._lock = threading.Lock()
+
+    @property
+    def admitted(self) -> int:
+        """Number of operations that are running or waiting for a thread."""
+
+        return self._admitted
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", hash_password, password)
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """See ``verify_and_update_password``."""
+
+        return await self._run(
+            "verify",
+            verify_and_update_password,
+            plain_password,
+            hashed_password,
+        )
+
+    async def _run(
+        self, operation: str, func: Callable[..., T], *args: str
+    ) -> T:
+        """
+        Admits an operation and waits for its result. The admission slot is
+        held until the thread finishes, even if the caller is cancelled.
+
+        :raises HTTPException: 503 if the pool is saturated.
+        """
+
+        with self._lock:
+            if self._admitted >= self._limit:
+                log.warning(
+                    "Password hashing pool saturated (%d operations admitted)",
+                    self._admitted,
+                )
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Authentication is busy, try again later",
+                    headers={
+                        "Retry-After": str(RETRY_AFTER_SECONDS),
+                        "X-Error-Code": "AUTH_BUSY",
+                    },
+                )
+            self._admitted += 1
+        PASSWORD_HASH_ADMITTED.inc()
+
+        submitted = time.perf_counter()
+
+        def timed() -> T:
+            started = time.perf_counter()
+            PASSWORD_HASH_WAIT_SECONDS.observe(started - submitted)
+            try:
+                return func(*args)
+            finally:
+                PASSWORD_HASH_SECONDS.labels(operation).observe(
+                    time.perf_counter() - started
+                )
+
+        future = self._executor.submit(timed)
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, _: Future) -> None:
+        with self._lock:
+            self._admitted -= 1
+        PASSWORD_HASH_ADMITTED.dec()
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+password_pool = PasswordHashingPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
@@ -1,10 +1,13 @@
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from src.users.models import Role
 
 
 class TokenPayload(BaseModel):
+    # Frozen because verified payloads are cached and shared by requests.
+    model_config = ConfigDict(frozen=True)
+
     id: UUID
     role: Role
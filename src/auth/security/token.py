@@ -1,3 +1,7 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any
 from uuid import UUID
@@ -66,19 +70,87 @@ def parse_token_payload(
     return TokenPayload(id=UUID(user_id), role=Role(role_value))
 
 
+class VerifiedTokenCache:
+    """
+    Bounded cache of the payloads of tokens that passed verification, so a
+    client polling with the same token is verified once. Entries are keyed by
+    the SHA-256 of the token, never served past the token's ``exp`` and
+    evicted least recently used first.
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        :param max_entries: Maximum number of cached tokens, 0 disables the
+            cache.
+        """
+
+        self._max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[TokenPayload, float]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> TokenPayload | None:
+        """Returns the payload of a cached token that has not expired."""
+
+        if not self._max_entries:
+            return None
+        key = _token_digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def put(self, token: str, payload: TokenPayload, expires_at: float) -> None:
+        if not self._max_entries:
+            return
+        key = _token_digest(token)
+        with self._lock:
+            self._entries[key] = (payload, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+access_token_cache = VerifiedTokenCache(settings.ACCESS_TOKEN_CACHE_SIZE)
+
+
 def _verify_jwt_token(
     token: str,
     secret: str,
     expired_error_msg: str,
     invalid_error_msg: str,
+    cache: VerifiedTokenCache | None = None,
 ) -> TokenPayload:
+    if cache is not None and (cached := cache.get(token)) is not None:
+        return cached
     try:
         payload = jwt.decode(
             token,
             secret,
             algorithms=[settings.JWT_ALGORITHM],
         )
-        return parse_token_payload(payload, invalid_error_msg)
+        token_payload = parse_token_payload(payload, invalid_error_msg)
+        if cache is not None and "exp" in payload:
+            cache.put(token, token_payload, payload["exp"])
+        return token_payload
     except jwt.ExpiredSignatureError as err:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail=expired_error_msg
@@ -104,4 +176,5 @@ def verify_token(token: str) -> TokenPayload:
         settings.SECRET_KEY,
         "Token expired",
         "Invalid token",
+        cache=access_token_cache,
     )
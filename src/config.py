@@ -1,5 +1,10 @@
+from typing import Literal
+
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from src.transcription.enums import Model
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env")
@@ -9,16 +14,86 @@ class Settings(BaseSettings):
     DB_NAME: str
     DB_USER: str
     DB_PASSWORD: str
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
 
     SECRET_KEY: str
     SECRET_REFRESH_KEY: str
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    ACCESS_TOKEN_CACHE_SIZE: int = 4096
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST_KB: int = 65536
+    ARGON2_PARALLELISM: int = 4
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    USER_CACHE_MAX_ENTRIES: int = 1024
+    USER_CACHE_TTL_SECONDS: float = 30.0
 
     DEVICE: str = "cpu"
     COMPUTE_TYPE: str = "float32"
     DOWNLOAD_ROOT: str = "models"
+    INIT_MODELS: list[Model] = [Model.SMALL]
+    MODEL_WARM_UP: bool = True
+    MODEL_CPU_THREADS: int = 4
+    MODEL_REPLICAS: int = 1
+    LONG_AUDIO_MIN_SECONDS: int | None = 300
+
+    TRANSCRIPTION_BATCH_SIZE: int = 4
+    TRANSCRIPTION_CHUNK_SIZE: int = 10
+    TRANSCRIPTION_BEAM_SIZE: int = 5
+    TRANSCRIPTION_MAX_BATCH_SIZE: int = 32
+    TRANSCRIPTION_MAX_CHUNK_SIZE: int = 30
+    TRANSCRIPTION_MAX_BEAM_SIZE: int = 10
+    INFERENCE_PROFILE_PATH: str | None = None
+    MODEL_CACHE_MAX_MODELS: int | None = 2
+    MODEL_CACHE_MEMORY_BUDGET_MB: int | None = None
+
+    UPLOAD_DIR: str = "files"
+    MAX_UPLOAD_SIZE_MB: int = 500
+    UPLOAD_MIN_FREE_MB: int = 100
+    UPLOAD_QUOTA_MB: int | None = None
+    UPLOAD_ORPHAN_MAX_AGE_HOURS: int = 24
+    BATCH_MAX_FILES: int = 100
+
+    RESULT_CACHE_BACKEND: Literal["none", "memory", "sqlite"] = "memory"
+    RESULT_CACHE_MAX_ENTRIES: int = 1024
+    RESULT_CACHE_TTL_SECONDS: int | None = 7 * 24 * 3600
+    RESULT_CACHE_PATH: str = "files/result_cache.sqlite3"
+
+    INFERENCE_SERVER_ADDRESS: str | None = None
+    INFERENCE_SERVER_AUTHKEY: str | None = None
+    INFERENCE_WORKERS: int = 1
+    INFERENCE_MAX_PENDING: int = 8
+
+    BATCH_SCHEDULER_ENABLED: bool | None = None
+    BATCH_SCHEDULER_MAX_BATCH_SIZE: int = 8
+    BATCH_SCHEDULER_MAX_WAIT_MS: int = 20
+
+    REALTIME_STEP_MS: int = 1000
+    REALTIME_MAX_BUFFERED_SECONDS: int = 20
+
+    PROFILE_DIR: str = "files/profiles"
+    PROFILE_SAMPLE_RATE: float = 0.0
+    PROFILE_INTERVAL_MS: int = 5
+    PROFILE_MAX_KEPT: int = 50
+
+    JOB_WORKERS: int = 1
+    JOB_LEASE_SECONDS: int = 3600
+    JOB_RECOVERY_INTERVAL_SECONDS: int = 60
+    JOBS_DIR: str = "files/jobs"
+
+    @model_validator(mode="after")
+    def check_inference_server_authkey(self) -> "Settings":
+        if self.INFERENCE_SERVER_ADDRESS and not self.INFERENCE_SERVER_AUTHKEY:
+            raise ValueError(
+                "INFERENCE_SERVER_AUTHKEY must be set with "
+                "INFERENCE_SERVER_ADDRESS"
+            )
+        return self
 
     @property
     def DB_URL(self) -> str:
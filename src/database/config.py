@@ -1,12 +1,23 @@
 from advanced_alchemy.extensions.fastapi import (
     AsyncSessionConfig,
+    EngineConfig,
     SQLAlchemyAsyncConfig,
 )
 
 from src.config import settings
 
 session_config = AsyncSessionConfig(expire_on_commit=False)
+engine_config = EngineConfig(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    # Connections dropped by the server or a proxy while idle are replaced
+    # instead of failing the request that picks them up.
+    pool_pre_ping=True,
+)
 sqlalchemy_config = SQLAlchemyAsyncConfig(
     connection_string=settings.DB_URL,
     session_config=session_config,
+    engine_config=engine_config,
 )
@@ -0,0 +1,36 @@
+from typing import Annotated, AsyncGenerator
+
+from fastapi import Depends, Request
+
+from src.database.config import sqlalchemy_config
+from src.jobs.services import JobService
+from src.jobs.worker import JobWorker
+from src.transcription.storage import TempStorage
+
+
+async def provide_job_service() -> AsyncGenerator[JobService, None]:
+    async with JobService.new(config=sqlalchemy_config) as service:
+        yield service
+
+
+def provide_job_worker(request: Request) -> JobWorker:
+    """
+    Dependency function that retrieves the JobWorker instance
+    from the FastAPI app state.
+    """
+
+    return request.app.state.job_worker
+
+
+def provide_job_storage(request: Request) -> TempStorage:
+    """
+    Dependency function that retrieves the storage for the audio of queued
+    jobs from the FastAPI app state.
+    """
+
+    return request.app.state.job_storage
+
+
+JobServiceDep = Annotated[JobService, Depends(provide_job_service)]
+JobWorkerDep = Annotated[JobWorker, Depends(provide_job_worker)]
+JobStorageDep = Annotated[TempStorage, Depends(provide_job_storage)]
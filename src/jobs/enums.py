@@ -0,0 +1,18 @@
+from src.enums import BaseEnum
+
+
+class JobStatus(BaseEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+    @classmethod
+    def finished(cls) -> list["JobStatus"]:
+        """
+        Returns the statuses a job can no longer leave.
+
+        :return: A list of terminal statuses.
+        """
+
+        return [cls.COMPLETED, cls.FAILED]
@@ -0,0 +1,44 @@
+from datetime import datetime
+from uuid import UUID
+
+from advanced_alchemy.base import UUIDAuditBase
+from advanced_alchemy.types import DateTimeUTC, JsonB
+from sqlalchemy import Enum as SQLAlchemyEnum
+from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.jobs.enums import JobStatus
+from src.transcription.enums import Language, Model, ResultFormat
+
+
+class JobModel(UUIDAuditBase):
+    """Transcription job model."""
+
+    __tablename__ = "transcription_jobs"
+
+    user_id: Mapped[UUID] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), index=True
+    )
+    status: Mapped[JobStatus] = mapped_column(
+        SQLAlchemyEnum(JobStatus), default=JobStatus.PENDING, index=True
+    )
+    # Stored as plain strings so adding a model or language does not need
+    # a migration of a native enum type.
+    model: Mapped[Model] = mapped_column(
+        SQLAlchemyEnum(Model, native_enum=False, length=32)
+    )
+    language: Mapped[Language | None] = mapped_column(
+        SQLAlchemyEnum(Language, native_enum=False, length=16), nullable=True
+    )
+    result_format: Mapped[ResultFormat] = mapped_column(
+        SQLAlchemyEnum(ResultFormat, native_enum=False, length=16)
+    )
+    audio_path: Mapped[str | None] = mapped_column(String, nullable=True)
+    segments: Mapped[list[dict] | None] = mapped_column(JsonB, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTimeUTC(timezone=True), nullable=True
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTimeUTC(timezone=True), nullable=True
+    )
@@ -0,0 +1,68 @@
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from advanced_alchemy.extensions.fastapi import repository
+from sqlalchemy import update
+
+from src.jobs.enums import JobStatus
+from src.jobs.models import JobModel
+
+
+class JobRepository(repository.SQLAlchemyAsyncRepository[JobModel]):
+    """Transcription job repository"""
+
+    model_type = JobModel
+
+    async def update_if(
+        self,
+        job_id: UUID,
+        status: JobStatus,
+        values: dict[str, Any],
+        started_at: datetime | None = None,
+    ) -> bool:
+        """
+        Updates a job only while it is in the given status, in a single
+        statement, so two processes can never both move it out of it.
+
+        :param job_id: Identifier of the job.
+        :param status: Status the job must be in.
+        :param values: Values to set.
+        :param started_at: Start time the job must have, None to skip this
+            condition.
+        :return: Whether the job was updated.
+        """
+
+        statement = (
+            update(JobModel)
+            .where(JobModel.id == job_id, JobModel.status == status)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if started_at is not None:
+            statement = statement.where(JobModel.started_at == started_at)
+        result = await self.session.execute(statement)
+        return result.rowcount == 1
+
+    async def requeue_started_before(
+        self, started_before: datetime
+    ) -> Sequence[UUID]:
+        """
+        Moves running jobs started before a time back to pending.
+
+        :param started_before: Jobs started before this time are moved.
+        :return: Identifiers of the moved jobs.
+        """
+
+        result = await self.session.execute(
+            update(JobModel)
+            .where(
+                JobModel.status == JobStatus.RUNNING,
+                JobModel.started_at < started_before,
+            )
+            .values(status=JobStatus.PENDING, started_at=None)
+            .returning(JobModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.scalars())
@@ -0,0 +1,165 @@
+from typing import Union
+from uuid import UUID, uuid4
+
+from fastapi import APIRouter, HTTPException, Request, status
+
+from src.auth.security.dependencies import CurrentUserDep
+from src.auth.security.schemas import TokenPayload
+from src.config import settings
+from src.jobs.dependencies import JobServiceDep, JobStorageDep, JobWorkerDep
+from src.jobs.enums import JobStatus
+from src.jobs.models import JobModel
+from src.jobs.schemas import Job
+from src.jobs.services import JobService
+from src.transcription.dependencies import SpeechTranscriptionServiceDep
+from src.transcription.schemas import (
+    TranscriptionForm,
+    TranscriptionSrtResult,
+    TranscriptionTextResult,
+)
+from src.transcription.uploads import (
+    multipart_request_body,
+    receive_form,
+    require_file,
+    validate_form,
+)
+from src.users.models import Role
+
+router = APIRouter(prefix="/transcription/jobs", tags=["Transcription Jobs"])
+
+
+async def _get_user_job(
+    job_service: JobService, job_id: UUID, user: TokenPayload
+) -> JobModel:
+    job = await job_service.get_one_or_none(id=job_id)
+    if not job or (job.user_id != user.id and user.role != Role.ADMIN):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+            headers={"X-Error-Code": "JOB_NOT_FOUND"},
+        )
+    return job
+
+
+@router.post(
+    "",
+    summary="Submit a transcription job",
+    status_code=status.HTTP_202_ACCEPTED,
+    description="""
+    Uploads an audio file and queues it for transcription.
+    Returns the job immediately; poll its status and fetch the result once it is completed.
+    """,
+    responses={
+        status.HTTP_202_ACCEPTED: {
+            "description": "Job accepted",
+        },
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {
+            "description": "Audio file is too large",
+        },
+        status.HTTP_507_INSUFFICIENT_STORAGE: {
+            "description": "Not enough storage for the upload",
+        },
+    },
+    openapi_extra=multipart_request_body(TranscriptionForm.openapi_fields()),
+)
+async def submit_job(
+    request: Request,
+    job_service: JobServiceDep,
+    job_worker: JobWorkerDep,
+    storage: JobStorageDep,
+    user: CurrentUserDep,
+) -> Job:
+    """
+    Submit an audio file for asynchronous transcription.
+
+    Takes the same multipart form as ``/transcription/transcribe``; the audio
+    is streamed to the jobs directory and kept until the job finishes.
+
+    :param request: Incoming request with the multipart body.
+    :param job_service: Injected job service.
+    :param job_worker: Injected background job worker.
+    :param storage: Storage for the audio of queued jobs (injected).
+    :param user: Authenticated user (injected).
+
+    :return: The created job.
+    """
+
+    form = await receive_form(
+        request,
+        storage=storage,
+        max_file_size=settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024,
+    )
+    try:
+        file = require_file(form)
+        options = validate_form(TranscriptionForm, form)
+        job = await job_service.create_job(
+            JobModel(
+                id=uuid4(),
+                user_id=user.id,
+                model=options.model,
+                language=options.language,
+                result_format=options.result_format,
+                audio_path=file.path,
+            )
+        )
+    except BaseException:
+        form.cleanup()
+        raise
+
+    job_worker.submit(job.id)
+    return job
+
+
+@router.get(
+    "/{job_id}",
+    summary="Get job status",
+    description="Returns the current status of a transcription job.",
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Job found",
+        },
+    },
+)
+async def get_job(
+    job_id: UUID, job_service: JobServiceDep, user: CurrentUserDep
+) -> Job:
+    return await _get_user_job(job_service, job_id, user)
+
+
+@router.get(
+    "/{job_id}/result",
+    summary="Get job result",
+    description="Returns the transcription result of a completed job in the format requested on submission.",
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Transcription result",
+        },
+        status.HTTP_409_CONFLICT: {
+            "description": "Job is not completed",
+        },
+    },
+)
+async def get_job_result(
+    job_id: UUID,
+    job_service: JobServiceDep,
+    transcription_service: SpeechTranscriptionServiceDep,
+    user: CurrentUserDep,
+) -> Union[TranscriptionSrtResult, TranscriptionTextResult]:
+    job = await _get_user_job(job_service, job_id, user)
+
+    if job.status == JobStatus.FAILED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job failed: {job.error}",
+            headers={"X-Error-Code": "JOB_FAILED"},
+        )
+    if job.status != JobStatus.COMPLETED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Job is not completed yet",
+            headers={"X-Error-Code": "JOB_NOT_COMPLETED"},
+        )
+
+    return transcription_service.format_result(
+        job.segments or [], job.result_format
+    )
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from pydantic import UUID4
+
+from src.jobs.enums import JobStatus
+from src.schemas import BaseSchema
+from src.transcription.enums import Language, Model, ResultFormat
+
+
+class Job(BaseSchema):
+    id: UUID4
+    status: JobStatus
+    model: Model
+    language: Language | None
+    result_format: ResultFormat
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
@@ -0,0 +1,114 @@
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from advanced_alchemy.extensions.fastapi import service
+from whisperx.types import SingleSegment
+
+from src.jobs.enums import JobStatus
+from src.jobs.models import JobModel
+from src.jobs.repositories import JobRepository
+
+
+class JobService(
+    service.SQLAlchemyAsyncRepositoryService[JobModel, JobRepository]
+):
+    """Transcription job service"""
+
+    repository_type = JobRepository
+
+    async def create_job(self, job_obj: JobModel) -> JobModel:
+        job_obj.status = JobStatus.PENDING
+        return await self.create(job_obj, auto_commit=True)
+
+    async def list_pending(self) -> Sequence[JobModel]:
+        """
+        Returns jobs waiting to be claimed, oldest first, e.g. because the
+        server stopped while they were queued.
+        """
+
+        return await self.list(
+            JobModel.status == JobStatus.PENDING,
+            order_by=[(JobModel.created_at, False)],
+        )
+
+    async def claim(self, job_id: UUID) -> JobModel | None:
+        """
+        Marks a pending job as running.
+
+        The status is checked and changed in one statement, so when several
+        workers or processes pick up the same job only one of them gets it.
+
+        :param job_id: Identifier of the job.
+        :return: The claimed job, None if it is not pending anymore.
+        """
+
+        claimed = await self.repository.update_if(
+            job_id,
+            JobStatus.PENDING,
+            {"status": JobStatus.RUNNING, "started_at": _now()},
+        )
+        await self.repository.session.commit()
+        if not claimed:
+            return None
+        return await self.get(job_id)
+
+    async def requeue_stale(self, lease: float) -> Sequence[UUID]:
+        """
+        Moves jobs that have been running for longer than their lease back
+        to pending, e.g. because the process running them stopped.
+
+        :param lease: Seconds a job may run before it is requeued.
+        :return: Identifiers of the requeued jobs.
+        """
+
+        job_ids = await self.repository.requeue_started_before(
+            _now() - timedelta(seconds=lease)
+        )
+        await self.repository.session.commit()
+        return job_ids
+
+    async def mark_completed(
+        self, job: JobModel, segments: list[SingleSegment]
+    ) -> bool:
+        """
+        Stores the result of a claimed job.
+
+        :param job: The job, as returned by ``claim``.
+        :param segments: Transcribed segments.
+        :return: Whether the result was stored, False if the claim expired
+            and the job was requeued.
+        """
+
+        return await self._finish(
+            job,
+            {
+                "status": JobStatus.COMPLETED,
+                "segments": [dict(segment) for segment in segments],
+            },
+        )
+
+    async def mark_failed(self, job: JobModel, error: str) -> bool:
+        """
+        Stores the error of a claimed job, see ``mark_completed``.
+        """
+
+        return await self._finish(
+            job, {"status": JobStatus.FAILED, "error": error}
+        )
+
+    async def _finish(self, job: JobModel, values: dict) -> bool:
+        # The start time identifies the claim, a job requeued and claimed
+        # again has another one.
+        finished = await self.repository.update_if(
+            job.id,
+            JobStatus.RUNNING,
+            {**values, "audio_path": None, "finished_at": _now()},
+            started_at=job.started_at,
+        )
+        await self.repository.session.commit()
+        return finished
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
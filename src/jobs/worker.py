@@ -0,0 +1,181 @@
+import asyncio
+from uuid import UUID
+
+from whisperx.types import SingleSegment
+
+from src.database.config import sqlalchemy_config
+from src.jobs import log
+from src.jobs.models import JobModel
+from src.jobs.services import JobService
+from src.transcription.exceptions import (
+    AudioDecodeError,
+    InferenceQueueFullError,
+)
+from src.transcription.services import SpeechTranscriptionService
+from src.transcription.utils import delete_file
+
+
+class JobWorker:
+    """
+    Consumes queued transcription jobs in the background.
+
+    Job ids are pulled from an in-process queue by a fixed number of worker
+    tasks; each job is claimed in the database, transcribed on the shared
+    inference executor and its outcome is persisted. A job is only run by
+    the worker that claimed it, so several processes can share the jobs.
+
+    Pending jobs are queued again on start. A running job is only taken
+    back once it has been running for longer than its lease, which is when
+    the process running it is assumed to have stopped, so the lease must
+    exceed the longest transcription.
+    """
+
+    def __init__(
+        self,
+        transcription_service: SpeechTranscriptionService,
+        workers: int = 1,
+        retry_delay: float = 1.0,
+        lease: float = 3600.0,
+        recovery_interval: float = 60.0,
+    ):
+        """
+        :param transcription_service: Service used to run the transcriptions.
+        :param workers: Number of jobs processed concurrently.
+        :param retry_delay: Seconds to wait before retrying when the inference
+            pool is saturated.
+        :param lease: Seconds a job may run before it is requeued.
+        :param recovery_interval: Seconds between two checks for jobs
+            running past their lease.
+        """
+
+        self._transcription_service = transcription_service
+        self._workers = workers
+        self._retry_delay = retry_delay
+        self._lease = lease
+        self._recovery_interval = recovery_interval
+        self._queue: asyncio.Queue[UUID] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def queue_size(self) -> int:
+        """Number of jobs waiting to be picked up."""
+
+        return self._queue.qsize()
+
+    async def start(self) -> None:
+        """
+        Requeues stale jobs, queues the pending ones and starts the worker
+        tasks.
+        """
+
+        async with JobService.new(config=sqlalchemy_config) as service:
+            await service.requeue_stale(self._lease)
+            jobs = await service.list_pending()
+
+        for job in jobs:
+            self.submit(job.id)
+        if jobs:
+            log.info("Queued %d pending jobs", len(jobs))
+
+        self._tasks = [
+            asyncio.create_task(self._run(), name=f"job-worker-{index}")
+            for index in range(self._workers)
+        ]
+        self._tasks.append(
+            asyncio.create_task(self._recover(), name="job-recovery")
+        )
+
+    async def stop(self) -> None:
+        """
+        Stops the worker tasks. Jobs in progress stay running and are
+        requeued once their lease expires.
+        """
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, job_id: UUID) -> None:
+        """
+        Queues a stored job for processing.
+
+        :param job_id: Identifier of the job.
+        """
+
+        self._queue.put_nowait(job_id)
+
+    async def _run(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._process(job_id)
+            except Exception as e:
+                log.error("Failed to process job %s: %s", job_id, e)
+            finally:
+                self._queue.task_done()
+
+    async def _recover(self) -> None:
+        while True:
+            await asyncio.sleep(self._recovery_interval)
+            try:
+                async with JobService.new(config=sqlalchemy_config) as service:
+                    job_ids = await service.requeue_stale(self._lease)
+            except Exception as e:
+                log.error("Failed to requeue stale jobs: %s", e)
+                continue
+            for job_id in job_ids:
+                self.submit(job_id)
+            if job_ids:
+                log.warning(
+                    "Requeued %d jobs running past their lease", len(job_ids)
+                )
+
+    async def _process(self, job_id: UUID) -> None:
+        async with JobService.new(config=sqlalchemy_config) as service:
+            job = await service.claim(job_id)
+        if job is None:
+            log.debug("Job %s was claimed elsewhere, skipping", job_id)
+            return
+
+        log.debug("Processing job %s...", job_id)
+        try:
+            segments = await self._transcribe(job)
+        except Exception as e:
+            log.exception("Job %s failed", job_id)
+            async with JobService.new(config=sqlalchemy_config) as service:
+                finished = await service.mark_failed(job, _public_error(e))
+        else:
+            async with JobService.new(config=sqlalchemy_config) as service:
+                finished = await service.mark_completed(job, segments)
+            log.debug("Processed job %s", job_id)
+
+        # A job requeued after its lease expired is run again elsewhere,
+        # which still needs its audio.
+        if not finished:
+            log.warning("Job %s was requeued while running", job_id)
+        elif job.audio_path:
+            delete_file(job.audio_path)
+
+    async def _transcribe(self, job: JobModel) -> list[SingleSegment]:
+        if not job.audio_path:
+            raise RuntimeError("Job audio file is missing")
+
+        while True:
+            try:
+                return await self._transcription_service.transcribe_file(
+                    job.audio_path, job.model, job.language
+                )
+            except InferenceQueueFullError:
+                await asyncio.sleep(self._retry_delay)
+
+
+def _public_error(error: Exception) -> str:
+    """
+    Error shown to the owner of a failed job. The exception itself may hold
+    ffmpeg output or server paths, so it is only logged.
+    """
+
+    if isinstance(error, AudioDecodeError):
+        return "Failed to decode audio"
+    return "Transcription failed"
@@ -1,25 +1,91 @@
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from prometheus_client import REGISTRY
 
+from src.auth.security.passwords import password_pool
 from src.config import settings
-from src.transcription.enums import Model
+from src.jobs.worker import JobWorker
+from src.transcription.collector import TranscriptionCollector
+from src.transcription.executor import InferenceExecutor
+from src.transcription.profiling import TranscriptionProfiler
+from src.transcription.remote import RemoteTranscriber
+from src.transcription.result_cache import create_result_cache
+from src.transcription.server import create_transcriber
 from src.transcription.services import SpeechTranscriptionService
-from src.transcription.speech_transcription import SpeechTranscription
+from src.transcription.storage import TempStorage
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    transcriber = SpeechTranscription(
-        device=settings.DEVICE,
-        compute_type=settings.COMPUTE_TYPE,
-        download_root=settings.DOWNLOAD_ROOT,
-        init_models=[Model.SMALL],
+    upload_storage = TempStorage(
+        settings.UPLOAD_DIR,
+        min_free_mb=settings.UPLOAD_MIN_FREE_MB,
+        quota_mb=settings.UPLOAD_QUOTA_MB,
+    )
+    upload_storage.sweep(max_age=settings.UPLOAD_ORPHAN_MAX_AGE_HOURS * 3600)
+    app.state.upload_storage = upload_storage
+    app.state.job_storage = TempStorage(
+        settings.JOBS_DIR, min_free_mb=settings.UPLOAD_MIN_FREE_MB
+    )
+
+    if settings.INFERENCE_SERVER_ADDRESS:
+        transcriber = RemoteTranscriber(
+            settings.INFERENCE_SERVER_ADDRESS,
+            authkey=settings.INFERENCE_SERVER_AUTHKEY.encode(),
+            models=settings.INIT_MODELS,
+        )
+    else:
+        transcriber = create_transcriber(preload_in_background=True)
+
+    executor = InferenceExecutor(
+        max_workers=settings.INFERENCE_WORKERS,
+        max_pending=settings.INFERENCE_MAX_PENDING,
     )
 
-    transcription_service = SpeechTranscriptionService(transcriber=transcriber)
+    result_cache = create_result_cache(
+        settings.RESULT_CACHE_BACKEND,
+        max_entries=settings.RESULT_CACHE_MAX_ENTRIES,
+        ttl=settings.RESULT_CACHE_TTL_SECONDS,
+        path=settings.RESULT_CACHE_PATH,
+    )
+
+    profiler = TranscriptionProfiler(
+        settings.PROFILE_DIR,
+        sample_rate=settings.PROFILE_SAMPLE_RATE,
+        interval=settings.PROFILE_INTERVAL_MS / 1000,
+        max_kept=settings.PROFILE_MAX_KEPT,
+    )
+    app.state.profiler = profiler
+
+    transcription_service = SpeechTranscriptionService(
+        transcriber=transcriber,
+        executor=executor,
+        result_cache=result_cache,
+        profiler=profiler,
+    )
     app.state.transcription_service = transcription_service
 
+    job_worker = JobWorker(
+        transcription_service=transcription_service,
+        workers=settings.JOB_WORKERS,
+        lease=settings.JOB_LEASE_SECONDS,
+        recovery_interval=settings.JOB_RECOVERY_INTERVAL_SECONDS,
+    )
+    await job_worker.start()
+    app.state.job_worker = job_worker
+
+    collector = TranscriptionCollector(
+        transcriber,
+        executor,
+        result_cache,
+        job_queue_size=lambda: job_worker.queue_size,
+    )
+    REGISTRY.register(collector)
+
     yield
 
+    REGISTRY.unregister(collector)
+    await job_worker.stop()
     transcription_service.clean()
+    password_pool.shutdown()
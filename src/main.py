@@ -4,6 +4,7 @@ from starlette.middleware.cors import CORSMiddleware
 from src.auth.routes import router as auth_router
 from src.exceptions.handlers import setup_exception_handlers
 from src.exceptions.responses import error_responses
+from src.jobs.routes import router as job_router
 from src.lifecycle import lifespan
 from src.routes import router
 from src.transcription.routes import router as transcription_router
@@ -34,3 +35,4 @@ app.include_router(router=router)
 app.include_router(router=user_router)
 app.include_router(router=auth_router)
 app.include_router(router=transcription_router)
+app.include_router(router=job_router)
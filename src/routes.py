@@ -1,9 +1,13 @@
 from datetime import datetime
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response, status
+from fastapi.concurrency import run_in_threadpool
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from scalar_fastapi import get_scalar_api_reference
 
-from src.schemas import HealthCheck
+from src.schemas import HealthCheck, Readiness
+from src.transcription.dependencies import SpeechTranscriptionServiceDep
+from src.transcription.enums import ModelState
 
 router = APIRouter(tags=["Monitoring"])
 
@@ -24,6 +28,57 @@ async def healthcheck() -> HealthCheck:
     return HealthCheck(timestamp=datetime.utcnow().isoformat())
 
 
+@router.get(
+    "/readiness",
+    summary="Readiness Check",
+    description="""
+        Reports which of the models preloaded at startup are loaded. Answers
+        503 until all of them are, so load balancers can hold traffic back
+        while the models load in the background
+    """,
+    responses={
+        200: {
+            "description": "Every preloaded model is loaded",
+        },
+        503: {
+            "description": "Preloaded models are still loading or failed",
+        },
+    },
+)
+async def readiness(
+    transcription_service: SpeechTranscriptionServiceDep, response: Response
+) -> Readiness:
+    # The states of a remote inference server are read over its socket.
+    states = await run_in_threadpool(transcription_service.model_states)
+    ready = all(state == ModelState.READY for state in states.values())
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return Readiness(
+        ready=ready,
+        models={model.value: state for model, state in states.items()},
+    )
+
+
+@router.get(
+    "/metrics",
+    summary="Metrics",
+    description="""
+        Exposes metrics in the Prometheus text format: time spent in each
+        transcription stage, audio duration, real-time factor, inference and
+        job queue depth, cache hit counters and loaded models
+    """,
+    response_class=Response,
+    responses={
+        200: {
+            "description": "Metrics in the Prometheus text format",
+            "content": {CONTENT_TYPE_LATEST: {}},
+        },
+    },
+)
+def metrics() -> Response:
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 @router.get("/docs", include_in_schema=False)
 async def scalar_html():
     return get_scalar_api_reference(
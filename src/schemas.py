@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from src.transcription.enums import ModelState
 
 
 class BaseSchema(BaseModel):
@@ -8,3 +10,12 @@ class BaseSchema(BaseModel):
 class HealthCheck(BaseSchema):
     status: str = "ok"
     timestamp: str
+
+
+class Readiness(BaseSchema):
+    ready: bool = Field(
+        ..., description="Whether every preloaded model is loaded"
+    )
+    models: dict[str, ModelState] = Field(
+        ..., description="Loading state of every preloaded model"
+    )
@@ -0,0 +1,178 @@
+"""
+In-memory audio decoding.
+
+Audio is decoded to the 16 kHz mono float32 waveform the models expect.
+WAV files holding PCM or float samples at 16 kHz are parsed directly with
+NumPy, without a subprocess. Everything else goes through ffmpeg, which
+writes raw samples to stdout; audio that is already in memory is fed to it
+over stdin instead of being written to a temporary file first.
+
+Synthetic speech-shaped audio is generated for measurements and model
+warm-up, where no recording is at hand.
+"""
+
+import os
+import struct
+import subprocess
+from typing import BinaryIO, Union
+
+import numpy as np
+
+from src.transcription import log
+from src.transcription.exceptions import AudioDecodeError
+
+SAMPLE_RATE = 16000
+
+AudioSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def decode_audio(source: AudioSource, sr: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Decodes audio into a mono float32 waveform.
+
+    :param source: Path to an audio file, its raw bytes, or a binary
+        file-like object positioned at the start of the audio.
+    :param sr: Sample rate of the returned waveform.
+
+    :return: Waveform with samples in [-1, 1].
+    :raises AudioDecodeError: If the audio cannot be decoded.
+    """
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            if f.read(4) != b"RIFF":
+                # Let ffmpeg seek in the file: containers such as MP4 may keep
+                # their index at the end, which a pipe cannot reach.
+                return _decode_ffmpeg(os.fspath(source), None, sr)
+            f.seek(0)
+            data = f.read()
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        data = source
+    else:
+        data = source.read()
+
+    audio = _decode_wav(memoryview(data), sr)
+    if audio is not None:
+        log.debug("Decoded %d WAV samples without ffmpeg", len(audio))
+        return audio
+
+    return _decode_ffmpeg("pipe:0", data, sr)
+
+
+def _decode_wav(data: memoryview, sr: int) -> np.ndarray | None:
+    """
+    Parses a RIFF/WAVE file at the target sample rate.
+
+    :return: The waveform, or None if the data needs ffmpeg (not WAV, a
+        compressed codec, another sample rate, or a data size that is unknown
+        or larger than the file).
+    """
+
+    if len(data) < 12 or data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        return None
+
+    fmt = None
+    samples = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = bytes(data[offset : offset + 4])
+        (chunk_size,) = struct.unpack_from("<I", data, offset + 4)
+        body = data[offset + 8 : offset + 8 + chunk_size]
+        if chunk_id == b"fmt " and len(body) >= 16:
+            fmt = struct.unpack_from("<HHIIHH", body)
+            if fmt[0] == _WAVE_FORMAT_EXTENSIBLE and len(body) >= 26:
+                # The actual format is the first field of the sub-format GUID.
+                (subformat,) = struct.unpack_from("<H", body, 24)
+                fmt = (subformat, *fmt[1:])
+        elif chunk_id == b"data":
+            # Streaming writers leave the size at 0 or 0xFFFFFFFF until they
+            # are done; ffmpeg reads such data up to the end of the file.
+            if chunk_size == 0 or offset + 8 + chunk_size > len(data):
+                return None
+            samples = body
+            break
+        offset += 8 + chunk_size + (chunk_size & 1)
+
+    if fmt is None or samples is None:
+        return None
+
+    format_tag, channels, sample_rate, _, _, bits = fmt
+    if sample_rate != sr or channels == 0:
+        return None
+
+    if format_tag == _WAVE_FORMAT_PCM and bits == 16:
+        audio = np.frombuffer(samples, "<i2", len(samples) // 2)
+        audio = audio.astype(np.float32) / 32768.0
+    elif format_tag == _WAVE_FORMAT_PCM and bits == 32:
+        audio = np.frombuffer(samples, "<i4", len(samples) // 4)
+        audio = (audio / 2147483648.0).astype(np.float32)
+    elif format_tag == _WAVE_FORMAT_PCM and bits == 8:
+        audio = np.frombuffer(samples, np.uint8)
+        audio = (audio.astype(np.float32) - 128.0) / 128.0
+    elif format_tag == _WAVE_FORMAT_IEEE_FLOAT and bits == 32:
+        audio = np.frombuffer(samples, "<f4", len(samples) // 4)
+        audio = audio.astype(np.float32)
+    else:
+        return None
+
+    frames = len(audio) // channels
+    if channels > 1:
+        audio = audio[: frames * channels].reshape(frames, channels).mean(1)
+    return np.ascontiguousarray(audio, dtype=np.float32)
+
+
+def _decode_ffmpeg(
+    input_path: str, data: bytes | bytearray | memoryview | None, sr: int
+) -> np.ndarray:
+    """
+    Decodes any format ffmpeg understands into raw samples read from stdout.
+
+    :param input_path: File to read, or ``pipe:0`` to read ``data`` from stdin.
+    :param data: Audio fed to stdin, if any.
+    """
+
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-threads",
+        "0",
+        "-i",
+        input_path,
+        "-f",
+        "s16le",
+        "-ac",
+        "1",
+        "-acodec",
+        "pcm_s16le",
+        "-ar",
+        str(sr),
+        "-",
+    ]
+    try:
+        out = subprocess.run(
+            cmd, input=data, capture_output=True, check=True
+        ).stdout
+    except FileNotFoundError as e:
+        raise AudioDecodeError("ffmpeg is not installed") from e
+    except subprocess.CalledProcessError as e:
+        raise AudioDecodeError(
+            f"Failed to load audio: {e.stderr.decode(errors='replace')}"
+        ) from e
+
+    return np.frombuffer(out, np.int16).astype(np.float32) / 32768.0
+
+
+def synthetic_speech(seconds: float, seed: int = 0) -> np.ndarray:
+    """Noise shaped by a few drifting harmonics, roughly like a voice."""
+
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    pitch = 120 + 40 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / SAMPLE_RATE
+    voice = sum(np.sin(k * phase) / k for k in range(1, 6))
+    audio = 0.2 * voice + 0.02 * rng.standard_normal(len(t))
+    return audio.astype(np.float32)
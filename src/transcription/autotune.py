@@ -0,0 +1,270 @@
+"""
+Measures the throughput-optimal inference tuning of each model on this host.
+
+For every model, each split of the CPU cores into replicas of
+``cores / replicas`` threads is loaded in turn, and chunks of audio are
+decoded in batches of every candidate size, spread across the replicas the
+way long audio is. The combination that transcribes the most audio seconds
+per wall-clock second is written to a JSON profile, which the server loads
+when ``INFERENCE_PROFILE_PATH`` points at it. Long audio is decoded in
+batches of the tuned size; with the batch scheduler enabled, batches of
+concurrent requests are capped at ``BATCH_SCHEDULER_MAX_BATCH_SIZE``.
+
+Chunk size and beam size change the transcript, not just its speed, so
+they are not tuned and keep their configured values.
+
+Without ``--audio`` the input is synthetic speech-shaped noise, which the
+model decodes into fewer tokens than real speech; pass a recording for
+representative numbers.
+
+Usage:
+    python -m src.transcription.autotune --models small medium
+    python -m src.transcription.autotune --audio call.wav --output profile.json
+"""
+
+import argparse
+import os
+import platform
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import numpy as np
+
+from src.config import settings
+from src.transcription import log
+from src.transcription.audio import (
+    SAMPLE_RATE,
+    decode_audio,
+    synthetic_speech,
+)
+from src.transcription.enums import Language, Model
+from src.transcription.pipeline import decode, get_tokenizer
+from src.transcription.speech_transcription import SpeechTranscription
+from src.transcription.tuning import (
+    InferenceOptions,
+    ModelTuning,
+    save_inference_profile,
+)
+
+
+def replica_splits(cores: int) -> list[tuple[int, int]]:
+    """Returns the ``(cpu_threads, replicas)`` pairs that use every core."""
+
+    splits = []
+    replicas = 1
+    while replicas <= cores:
+        splits.append((max(1, cores // replicas), replicas))
+        replicas *= 2
+    return splits
+
+
+def measure(
+    transcriber: SpeechTranscription,
+    model: Model,
+    chunks: list[np.ndarray],
+    batch_size: int,
+    replicas: int,
+    language: str,
+) -> float:
+    """
+    Decodes the chunks in batches spread across the replicas.
+
+    :return: Seconds of audio transcribed per wall-clock second.
+    """
+
+    with transcriber.acquire_model(model) as pipeline:
+        tokenizer = get_tokenizer(pipeline, chunks[0], language)
+        batches = [
+            chunks[start : start + batch_size]
+            for start in range(0, len(chunks), batch_size)
+        ]
+        with ThreadPoolExecutor(max_workers=replicas) as pool:
+            # Warm up every replica before timing.
+            list(
+                pool.map(
+                    lambda batch: decode(pipeline, batch, tokenizer),
+                    batches[:replicas],
+                )
+            )
+            started = time.perf_counter()
+            list(
+                pool.map(
+                    lambda batch: decode(pipeline, batch, tokenizer), batches
+                )
+            )
+            elapsed = time.perf_counter() - started
+
+    audio_seconds = sum(len(chunk) for chunk in chunks) / SAMPLE_RATE
+    return audio_seconds / elapsed
+
+
+def tune_model(
+    model: Model,
+    chunks: list[np.ndarray],
+    batch_sizes: list[int],
+    splits: list[tuple[int, int]],
+    args: argparse.Namespace,
+) -> tuple[ModelTuning | None, list[dict]]:
+    """
+    Tries every split and batch size for one model. A failing trial, e.g. a
+    batch too large for the device memory, is skipped.
+
+    :return: The fastest tuning, None if every trial failed, and every
+        successful measurement.
+    :raises ValueError: If there is no batch size or split to try.
+    """
+
+    if not batch_sizes or not splits:
+        raise ValueError("At least one batch size and one split are needed")
+
+    trials = []
+    best: tuple[float, ModelTuning] | None = None
+    for cpu_threads, replicas in splits:
+        transcriber = SpeechTranscription(
+            device=args.device,
+            compute_type=args.compute_type,
+            download_root=args.download_root,
+            init_models=[model],
+            cpu_threads=cpu_threads,
+            replicas=replicas,
+        )
+        try:
+            for batch_size in batch_sizes:
+                try:
+                    throughput = measure(
+                        transcriber,
+                        model,
+                        chunks,
+                        batch_size,
+                        replicas,
+                        args.language,
+                    )
+                except Exception:
+                    log.warning(
+                        "Trial of %s with %d threads, %d replicas and batch "
+                        "size %d failed",
+                        model.value,
+                        cpu_threads,
+                        replicas,
+                        batch_size,
+                        exc_info=True,
+                    )
+                    continue
+                trials.append(
+                    {
+                        "model": model.value,
+                        "cpu_threads": cpu_threads,
+                        "replicas": replicas,
+                        "batch_size": batch_size,
+                        "audio_seconds_per_second": round(throughput, 3),
+                    }
+                )
+                log.info("Measured %s", trials[-1])
+                if best is None or throughput > best[0]:
+                    best = (
+                        throughput,
+                        ModelTuning(
+                            cpu_threads=cpu_threads,
+                            replicas=replicas,
+                            options=InferenceOptions(batch_size=batch_size),
+                        ),
+                    )
+        finally:
+            transcriber.clean()
+
+    return (best[1] if best is not None else None), trials
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--models",
+        nargs="+",
+        default=[Model.SMALL.value],
+        choices=Model.values(),
+    )
+    parser.add_argument("--device", default=settings.DEVICE)
+    parser.add_argument("--compute-type", default=settings.COMPUTE_TYPE)
+    parser.add_argument("--download-root", default=settings.DOWNLOAD_ROOT)
+    parser.add_argument(
+        "--language", default=Language.ENGLISH.value, choices=Language.values()
+    )
+    parser.add_argument("--audio", help="Recording to decode instead of noise")
+    parser.add_argument("--chunks", type=int, default=32)
+    parser.add_argument(
+        "--chunk-size", type=int, default=settings.TRANSCRIPTION_CHUNK_SIZE
+    )
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8, 16]
+    )
+    parser.add_argument("--cores", type=int, default=os.cpu_count() or 1)
+    parser.add_argument(
+        "--output",
+        default=settings.INFERENCE_PROFILE_PATH or "inference_profile.json",
+    )
+    args = parser.parse_args()
+
+    samples = args.chunk_size * SAMPLE_RATE
+    audio = (
+        decode_audio(args.audio)
+        if args.audio
+        else synthetic_speech(args.chunks * args.chunk_size)
+    )
+    chunks = [
+        audio[start : start + samples]
+        for start in range(0, len(audio) - samples + 1, samples)
+    ][: args.chunks]
+    if not chunks:
+        parser.error(f"--audio must be at least {args.chunk_size} s long")
+
+    batch_sizes = [
+        size
+        for size in args.batch_sizes
+        if size <= settings.TRANSCRIPTION_MAX_BATCH_SIZE
+    ]
+    if not batch_sizes:
+        parser.error(
+            "--batch-sizes needs a size of at most "
+            f"{settings.TRANSCRIPTION_MAX_BATCH_SIZE}"
+        )
+    # Replicas of a GPU share its compute, so only CPUs are split.
+    splits = (
+        replica_splits(args.cores)
+        if args.device == "cpu"
+        else [(settings.MODEL_CPU_THREADS, 1)]
+    )
+
+    tunings: dict[Model, ModelTuning] = {}
+    trials: list[dict] = []
+    for name in args.models:
+        model = Model(name)
+        tuning, model_trials = tune_model(
+            model, chunks, batch_sizes, splits, args
+        )
+        trials.extend(model_trials)
+        if tuning is None:
+            log.warning("Every trial of %s failed, skipping it", name)
+        else:
+            tunings[model] = tuning
+    if not tunings:
+        parser.exit(1, "Every trial failed, no profile written\n")
+
+    save_inference_profile(
+        args.output,
+        tunings,
+        host={
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "cores": args.cores,
+            "device": args.device,
+            "compute_type": args.compute_type,
+        },
+        measured_at=datetime.now(timezone.utc).isoformat(),
+        trials=trials,
+    )
+    print(f"Wrote inference profile for {len(tunings)} models to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
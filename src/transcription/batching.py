@@ -0,0 +1,233 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.transcription import log
+from src.transcription.pipeline import decode
+from src.transcription.profiling import Profile, current_profile, sampled
+
+if TYPE_CHECKING:
+    from faster_whisper.tokenizer import Tokenizer
+    from whisperx.asr import FasterWhisperPipeline
+
+
+@dataclass
+class _Item:
+    chunk: np.ndarray
+    future: Future
+    enqueued_at: float
+    profile: Profile | None = None
+
+
+@dataclass
+class _Group:
+    pipeline: "FasterWhisperPipeline"
+    tokenizer: "Tokenizer"
+    batch_size: int
+    beam_size: int | None = None
+    items: deque[_Item] = field(default_factory=deque)
+
+
+class BatchScheduler:
+    """
+    Decodes audio chunks from concurrent transcriptions in shared batches.
+
+    Chunks are grouped by pipeline, tokenizer (language) and beam size, since
+    one model call uses a single prompt and decoding options, and by the
+    batch size their caller asked for, e.g. the one tuned for the model. A
+    group is dispatched as soon as it holds that many chunks, at most
+    ``max_batch_size``, or once its oldest chunk has waited ``max_wait``
+    seconds. Batches run one at a time on a dedicated thread.
+    """
+
+    def __init__(self, max_batch_size: int = 8, max_wait: float = 0.02):
+        """
+        :param max_batch_size: Maximum number of chunks decoded in one call.
+        :param max_wait: Seconds a chunk may wait for the batch to fill up.
+        """
+
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._groups: dict[tuple, _Group] = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="batch-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def max_batch_size(self) -> int:
+        return self._max_batch_size
+
+    def decode(
+        self,
+        pipeline: "FasterWhisperPipeline",
+        tokenizer: "Tokenizer",
+        chunks: list[np.ndarray],
+        beam_size: int | None = None,
+        batch_size: int | None = None,
+    ) -> list[str]:
+        """
+        Decodes the chunks, possibly batched with chunks of other callers.
+        Blocks until every chunk is decoded.
+
+        :param pipeline: Pipeline to decode with.
+        :param tokenizer: Tokenizer for the language of the chunks.
+        :param chunks: Waveforms of at most 30 seconds each.
+        :param beam_size: Beam size, the pipeline's own when None.
+        :param batch_size: Maximum number of chunks in a batch, capped at
+            ``max_batch_size``, which is also the default.
+
+        :return: Decoded text of every chunk, in order.
+        """
+
+        futures = self.submit(
+            pipeline, tokenizer, chunks, beam_size, batch_size
+        )
+        return [future.result() for future in futures]
+
+    def submit(
+        self,
+        pipeline: "FasterWhisperPipeline",
+        tokenizer: "Tokenizer",
+        chunks: list[np.ndarray],
+        beam_size: int | None = None,
+        batch_size: int | None = None,
+    ) -> list[Future]:
+        """
+        Queues the chunks for decoding without waiting for them, see
+        ``decode``.
+
+        :return: One future per chunk resolving to its decoded text.
+        """
+
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        batch_size = min(
+            batch_size or self._max_batch_size, self._max_batch_size
+        )
+        key = (
+            id(pipeline),
+            tokenizer.task,
+            tokenizer.language_code,
+            beam_size,
+            batch_size,
+        )
+        now = time.monotonic()
+        profile = current_profile()
+        items = [_Item(chunk, Future(), now, profile) for chunk in chunks]
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Batch scheduler is closed")
+
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = _Group(
+                    pipeline, tokenizer, batch_size, beam_size
+                )
+            group.items.extend(items)
+            self._condition.notify()
+
+        return [item.future for item in items]
+
+    def close(self) -> None:
+        """
+        Stops the scheduler. Chunks that were not decoded yet fail.
+        """
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                batch = self._next_batch()
+            if batch is None:
+                return
+            self._decode(*batch)
+
+    def _next_batch(self) -> tuple[_Group, list[_Item]] | None:
+        """
+        Waits until a group is ready and pops its next batch.
+        Must be called with the condition held.
+        """
+
+        while not self._closed:
+            now = time.monotonic()
+            ready: tuple | None = None
+            timeout: float | None = None
+
+            for key, group in self._groups.items():
+                oldest = group.items[0].enqueued_at
+                deadline = oldest + self._max_wait
+                if len(group.items) >= group.batch_size or deadline <= now:
+                    if ready is None or oldest < ready[1]:
+                        ready = (key, oldest)
+                else:
+                    remaining = deadline - now
+                    timeout = (
+                        remaining
+                        if timeout is None
+                        else min(timeout, remaining)
+                    )
+
+            if ready is not None:
+                key = ready[0]
+                group = self._groups[key]
+                size = min(len(group.items), group.batch_size)
+                batch = [group.items.popleft() for _ in range(size)]
+                if not group.items:
+                    del self._groups[key]
+                # Callers that stopped waiting cancel their futures; their
+                # chunks are dropped instead of decoded.
+                batch = [
+                    item
+                    for item in batch
+                    if item.future.set_running_or_notify_cancel()
+                ]
+                if batch:
+                    return group, batch
+                continue
+
+            self._condition.wait(timeout)
+
+        error = RuntimeError("Batch scheduler is closed")
+        for group in self._groups.values():
+            for item in group.items:
+                if item.future.set_running_or_notify_cancel():
+                    item.future.set_exception(error)
+        self._groups.clear()
+        return None
+
+    @staticmethod
+    def _decode(group: _Group, batch: list[_Item]) -> None:
+        log.debug("Decoding batch of %d chunks", len(batch))
+        profiles = {item.profile for item in batch if item.profile is not None}
+        try:
+            with sampled(profiles):
+                texts = decode(
+                    group.pipeline,
+                    [item.chunk for item in batch],
+                    group.tokenizer,
+                    group.beam_size,
+                )
+        except Exception as e:
+            log.error("Failed to decode batch: %s", e)
+            for item in batch:
+                item.future.set_exception(e)
+            return
+
+        for item, text in zip(batch, texts, strict=True):
+            item.future.set_result(text)
@@ -0,0 +1,119 @@
+"""
+Prometheus collector of the state of the running transcription components.
+"""
+
+from typing import Callable
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+from src.transcription import log
+from src.transcription.executor import InferenceExecutor
+from src.transcription.remote import RemoteTranscriber
+from src.transcription.result_cache import ResultCache
+from src.transcription.speech_transcription import SpeechTranscription
+
+
+class TranscriptionCollector(Collector):
+    """
+    Exposes the counters of the model and result caches, the models in
+    memory, and the depth of the inference and job queues at scrape time.
+    """
+
+    def __init__(
+        self,
+        transcriber: SpeechTranscription | RemoteTranscriber,
+        executor: InferenceExecutor,
+        result_cache: ResultCache | None = None,
+        job_queue_size: Callable[[], int] | None = None,
+    ):
+        """
+        :param transcriber: Transcriber owning the model cache.
+        :param executor: Inference pool.
+        :param result_cache: Result cache, if enabled.
+        :param job_queue_size: Returns the number of queued background jobs.
+        """
+
+        self._transcriber = transcriber
+        self._executor = executor
+        self._result_cache = result_cache
+        self._job_queue_size = job_queue_size
+
+    def collect(self):
+        yield from self._collect_executor()
+        yield from self._collect_models()
+        if self._result_cache is not None:
+            yield from self._collect_result_cache()
+        if self._job_queue_size is not None:
+            yield GaugeMetricFamily(
+                "transcription_job_queue_size",
+                "Background jobs waiting for a worker.",
+                value=self._job_queue_size(),
+            )
+
+    def _collect_executor(self):
+        yield GaugeMetricFamily(
+            "inference_jobs_admitted",
+            "Inference jobs running or waiting for a worker.",
+            value=self._executor.admitted,
+        )
+        yield GaugeMetricFamily(
+            "inference_jobs_limit",
+            "Inference jobs admitted at most before requests are rejected.",
+            value=self._executor.limit,
+        )
+        yield GaugeMetricFamily(
+            "inference_workers",
+            "Inference jobs that run at the same time.",
+            value=self._executor.max_workers,
+        )
+
+    def _collect_models(self):
+        try:
+            stats = self._transcriber.model_cache_stats()
+            model_memory = self._transcriber.model_memory()
+        except (OSError, EOFError) as e:
+            # The inference server of a remote transcriber is down.
+            log.warning("Cannot collect model metrics: %r", e)
+            return
+
+        for name, value, documentation in (
+            ("hits", stats.hits, "Model lookups served from memory."),
+            ("misses", stats.misses, "Model lookups that loaded the model."),
+            ("evictions", stats.evictions, "Models unloaded to make room."),
+            ("loads", stats.loads, "Models loaded."),
+            ("load_failures", stats.load_failures, "Failed model loads."),
+            ("load_seconds", stats.load_seconds, "Time spent loading models."),
+            ("waits", stats.waits, "Lookups that waited for another load."),
+            ("wait_seconds", stats.wait_seconds, "Time spent waiting."),
+        ):
+            yield CounterMetricFamily(
+                f"model_cache_{name}", documentation, value=value
+            )
+
+        memory = GaugeMetricFamily(
+            "model_memory_bytes",
+            "Estimated memory of each loaded model.",
+            labels=["model"],
+        )
+        for model, size in model_memory.items():
+            memory.add_metric([model], size)
+        yield memory
+
+    def _collect_result_cache(self):
+        stats = self._result_cache.stats()
+        for name, value, documentation in (
+            ("hits", stats.hits, "Transcriptions served from the cache."),
+            ("misses", stats.misses, "Lookups without a cached result."),
+            ("stores", stats.stores, "Results added to the cache."),
+            ("evictions", stats.evictions, "Results evicted by the limit."),
+            ("expirations", stats.expirations, "Results dropped by the TTL."),
+        ):
+            yield CounterMetricFamily(
+                f"result_cache_{name}", documentation, value=value
+            )
+        yield GaugeMetricFamily(
+            "result_cache_entries",
+            "Results currently cached.",
+            value=len(self._result_cache),
+        )
@@ -1,12 +1,15 @@
 from typing import Annotated
 
 from fastapi import Depends, Request
+from starlette.requests import HTTPConnection
 
+from src.transcription.profiling import TranscriptionProfiler
 from src.transcription.services import SpeechTranscriptionService
+from src.transcription.storage import TempStorage
 
 
 def provide_transcription_service(
-    request: Request,
+    request: HTTPConnection,
 ) -> SpeechTranscriptionService:
     """
     Dependency function that retrieves the SpeechTranscriptionService instance
@@ -16,6 +19,26 @@ def provide_transcription_service(
     return request.app.state.transcription_service
 
 
+def provide_upload_storage(request: Request) -> TempStorage:
+    """
+    Dependency function that retrieves the temporary storage for uploads
+    from the FastAPI app state.
+    """
+
+    return request.app.state.upload_storage
+
+
+def provide_profiler(request: Request) -> TranscriptionProfiler:
+    """
+    Dependency function that retrieves the transcription profiler from the
+    FastAPI app state.
+    """
+
+    return request.app.state.profiler
+
+
 SpeechTranscriptionServiceDep = Annotated[
     SpeechTranscriptionService, Depends(provide_transcription_service)
 ]
+UploadStorageDep = Annotated[TempStorage, Depends(provide_upload_storage)]
+ProfilerDep = Annotated[TranscriptionProfiler, Depends(provide_profiler)]
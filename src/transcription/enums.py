@@ -17,3 +17,11 @@ class Model(BaseEnum):
 class ResultFormat(BaseEnum):
     TEXT = "text"
     SRT = "srt"
+
+
+class ModelState(BaseEnum):
+    PENDING = "pending"
+    LOADING = "loading"
+    WARMING_UP = "warming_up"
+    READY = "ready"
+    FAILED = "failed"
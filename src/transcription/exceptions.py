@@ -0,0 +1,6 @@
+class InferenceQueueFullError(Exception):
+    """Raised when the inference executor cannot admit any more work."""
+
+
+class AudioDecodeError(RuntimeError):
+    """Raised when audio cannot be decoded."""
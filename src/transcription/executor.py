@@ -0,0 +1,179 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncGenerator, Callable, Iterator, TypeVar
+
+from src.transcription import log
+from src.transcription.exceptions import InferenceQueueFullError
+from src.transcription.profiling import follow
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class InferenceExecutor:
+    """
+    Runs blocking inference work on a dedicated thread pool so the event loop
+    stays responsive while a model is busy.
+
+    Admission is bounded: at most ``max_workers`` jobs run at once and at most
+    ``max_pending`` more may wait for a free worker. Anything beyond that is
+    rejected immediately with InferenceQueueFullError.
+    """
+
+    def __init__(self, max_workers: int = 1, max_pending: int = 8):
+        """
+        :param max_workers: Number of threads that run inference concurrently.
+        :param max_pending: Number of jobs allowed to wait for a free worker.
+        """
+
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_pending < 0:
+            raise ValueError("max_pending must not be negative")
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="inference"
+        )
+        self._max_workers = max_workers
+        self._limit = max_workers + max_pending
+        self._admitted = 0
+
+    @property
+    def admitted(self) -> int:
+        """Number of jobs that are running or waiting for a worker."""
+
+        return self._admitted
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def limit(self) -> int:
+        """Maximum number of jobs that may be admitted at the same time."""
+
+        return self._limit
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Runs ``func`` on the inference pool and waits for its result.
+
+        A job keeps its admission slot until the worker thread finishes it,
+        even if the awaiting coroutine is cancelled (e.g. client disconnect),
+        so the limit always reflects the real load on the pool.
+
+        :param func: Blocking callable to execute.
+        :return: The callable's return value.
+        :raises InferenceQueueFullError: If the pool is saturated.
+        """
+
+        future = self._submit(partial(func, *args, **kwargs))
+        return await asyncio.wrap_future(future)
+
+    def stream(
+        self, func: Callable[..., Iterator[T]], *args: Any, **kwargs: Any
+    ) -> AsyncGenerator[T, None]:
+        """
+        Runs the generator function ``func`` on the inference pool and yields
+        its items as soon as the worker thread produces them.
+
+        Admission is decided immediately, before the first item is awaited,
+        so callers can still report saturation before they start streaming.
+        Closing the returned iterator early stops the generator at its next
+        item and closes it on the worker thread.
+
+        :param func: Blocking generator function to execute.
+        :return: Async iterator over the generated items.
+        :raises InferenceQueueFullError: If the pool is saturated.
+        """
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[tuple[Any, BaseException | None]] = asyncio.Queue()
+        stop = threading.Event()
+
+        def put(item: Any, error: BaseException | None = None) -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(queue.put_nowait, (item, error))
+
+        def produce() -> None:
+            iterator = func(*args, **kwargs)
+            try:
+                for item in iterator:
+                    if stop.is_set():
+                        break
+                    put(item)
+            except BaseException as e:
+                put(_DONE, e)
+                return
+            finally:
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+            put(_DONE)
+
+        def on_done(future: Future) -> None:
+            # A job cancelled by shutdown never runs produce().
+            if future.cancelled():
+                put(_DONE, RuntimeError("Inference pool is shut down"))
+
+        self._submit(produce).add_done_callback(on_done)
+        return self._consume(queue, stop)
+
+    @staticmethod
+    async def _consume(
+        queue: asyncio.Queue, stop: threading.Event
+    ) -> AsyncGenerator[Any, None]:
+        try:
+            while True:
+                item, error = await queue.get()
+                if item is _DONE:
+                    if error is not None:
+                        raise error
+                    return
+                yield item
+        finally:
+            stop.set()
+
+    def _submit(self, func: Callable[[], T]) -> Future:
+        """
+        Admits a job and submits it to the pool. The admission slot is
+        released when the job finishes.
+
+        :raises InferenceQueueFullError: If the pool is saturated.
+        """
+
+        if self._admitted >= self._limit:
+            log.warning(
+                "Inference pool saturated (%d/%d jobs admitted)",
+                self._admitted,
+                self._limit,
+            )
+            raise InferenceQueueFullError(
+                f"Inference pool is saturated ({self._limit} jobs admitted)"
+            )
+
+        loop = asyncio.get_running_loop()
+        future = self._executor.submit(follow(func))
+        self._admitted += 1
+
+        def release(_: Future) -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._release)
+
+        future.add_done_callback(release)
+        return future
+
+    def _release(self) -> None:
+        self._admitted -= 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the pool. Pending jobs that have not started are cancelled.
+
+        :param wait: Whether to block until running jobs finish.
+        """
+
+        self._executor.shutdown(wait=wait, cancel_futures=True)
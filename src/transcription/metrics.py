@@ -0,0 +1,107 @@
+"""
+Prometheus metrics recorded while transcribing.
+
+Stage timings and audio statistics are observed as they happen. Cache, pool
+and queue state is read when ``/metrics`` is scraped instead, see
+``src.transcription.collector``.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from prometheus_client import Gauge, Histogram
+
+from src.transcription import log
+from src.transcription.enums import Model
+
+STAGES = ("upload", "decode", "model_acquire", "inference", "format")
+
+STAGE_SECONDS = Histogram(
+    "transcription_stage_seconds",
+    "Time spent in each stage of a transcription.",
+    ["stage"],
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300),
+)
+AUDIO_SECONDS = Histogram(
+    "transcription_audio_seconds",
+    "Duration of the transcribed audio.",
+    ["model"],
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600, 7200),
+)
+REAL_TIME_FACTOR = Histogram(
+    "transcription_real_time_factor",
+    "Processing time of a transcription divided by its audio duration.",
+    ["model"],
+    buckets=(0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5),
+)
+MODEL_PRELOAD_SECONDS = Gauge(
+    "model_preload_seconds",
+    "Time it took to load a model preloaded at startup.",
+    ["model"],
+)
+MODEL_WARM_UP_SECONDS = Gauge(
+    "model_warm_up_seconds",
+    "Time the warm-up inference of a preloaded model took.",
+    ["model"],
+)
+
+
+@contextmanager
+def timed(
+    stage: str, timings: dict[str, float] | None = None
+) -> Iterator[None]:
+    """
+    Measures a stage of a transcription.
+
+    :param stage: One of ``STAGES``.
+    :param timings: Per-transcription timings the duration is added to, for
+        the structured log line of that transcription.
+    """
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - started, timings)
+
+
+def record_stage(
+    stage: str, seconds: float, timings: dict[str, float] | None = None
+) -> None:
+    """Records the duration of a stage measured by the caller."""
+
+    STAGE_SECONDS.labels(stage).observe(seconds)
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + seconds
+
+
+def observe_transcription(
+    name: str, model: Model, audio_seconds: float, timings: dict[str, float]
+) -> None:
+    """
+    Records the audio duration and real-time factor of a finished
+    transcription and logs its stage timings as structured fields.
+
+    :param name: Audio file name, for the log.
+    :param model: Model that transcribed it.
+    :param audio_seconds: Duration of the audio.
+    :param timings: Seconds spent in each stage.
+    """
+
+    processing = sum(timings.values())
+    AUDIO_SECONDS.labels(model.value).observe(audio_seconds)
+    if audio_seconds > 0:
+        REAL_TIME_FACTOR.labels(model.value).observe(processing / audio_seconds)
+
+    fields = {
+        "model": model.value,
+        "audio_seconds": round(audio_seconds, 3),
+        **{f"{stage}_seconds": round(t, 3) for stage, t in timings.items()},
+    }
+    log.info(
+        "Transcribed %s %s",
+        name,
+        " ".join(f"{key}={value}" for key, value in fields.items()),
+        extra={"timings": fields},
+    )
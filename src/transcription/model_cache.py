@@ -0,0 +1,297 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Callable, Generic, Iterator, TypeVar
+
+from src.transcription import log
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Entry(Generic[T]):
+    value: T
+    size: int
+    refs: int = 0
+
+
+@dataclass
+class ModelCacheStats:
+    """Cumulative counters of a ModelCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    loads: int = 0
+    load_failures: int = 0
+    load_seconds: float = 0.0
+    waits: int = 0
+    wait_seconds: float = 0.0
+
+
+class ModelCache(Generic[T]):
+    """
+    Bounded, thread-safe cache of loaded models.
+
+    Models are kept in least-recently-used order and evicted when the cache
+    holds more than ``max_models`` models or more than ``memory_budget`` bytes.
+    Pinned models and models currently acquired by a caller are never
+    evicted; if only such models remain, the cache stays over its limits until
+    one of them is released.
+
+    Loads are single-flight: when several callers miss on the same model at
+    once, the first one loads it and the others wait for that load instead of
+    loading their own copy.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], T],
+        size_of: Callable[[str, T], int] | None = None,
+        max_models: int | None = None,
+        memory_budget: int | None = None,
+        on_evict: Callable[[str], None] | None = None,
+    ):
+        """
+        :param loader: Loads the model for a key.
+        :param size_of: Estimates the memory used by a loaded model, in bytes.
+        :param max_models: Maximum number of cached models (unbounded if None).
+        :param memory_budget: Maximum estimated memory of cached models in
+            bytes (unbounded if None).
+        :param on_evict: Called after a model has been evicted.
+        """
+
+        if max_models is not None and max_models < 1:
+            raise ValueError("max_models must be at least 1")
+
+        self._loader = loader
+        self._size_of = size_of or (lambda key, value: 0)
+        self._max_models = max_models
+        self._memory_budget = memory_budget
+        self._on_evict = on_evict
+        self._entries: OrderedDict[str, _Entry[T]] = OrderedDict()
+        self._pinned: set[str] = set()
+        self._loading: dict[str, Future] = {}
+        self._stats = ModelCacheStats()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def memory_usage(self) -> int:
+        """Estimated memory used by the cached models, in bytes."""
+
+        with self._lock:
+            return sum(entry.size for entry in self._entries.values())
+
+    def stats(self) -> ModelCacheStats:
+        """Returns a snapshot of the cache counters."""
+
+        with self._lock:
+            return replace(self._stats)
+
+    def keys(self) -> list[str]:
+        """Returns the cached keys, least recently used first."""
+
+        with self._lock:
+            return list(self._entries)
+
+    def sizes(self) -> dict[str, int]:
+        """Returns the estimated memory of every cached model, in bytes."""
+
+        with self._lock:
+            return {key: entry.size for key, entry in self._entries.items()}
+
+    @contextmanager
+    def acquire(self, key: str) -> Iterator[T]:
+        """
+        Yields the model for ``key``, loading it if needed. The model cannot
+        be evicted until the context exits.
+
+        :param key: Model key (e.g., "small").
+        """
+
+        entry = self._checkout(key)
+        try:
+            yield entry.value
+        finally:
+            self._release(entry)
+
+    def load(self, key: str, pin: bool = False) -> None:
+        """
+        Makes sure the model for ``key`` is cached.
+
+        :param key: Model key.
+        :param pin: Whether to protect the model from eviction.
+        """
+
+        if pin:
+            self.pin(key)
+        with self.acquire(key):
+            pass
+
+    def pin(self, key: str) -> None:
+        """Protects a model from eviction, whether it is loaded or not."""
+
+        with self._lock:
+            self._pinned.add(key)
+
+    def unpin(self, key: str) -> None:
+        """Makes a pinned model evictable again."""
+
+        with self._lock:
+            self._pinned.discard(key)
+            evicted = self._evict()
+        self._notify(evicted)
+
+    def clear(self) -> None:
+        """Drops every cached model, including pinned and acquired ones."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def _checkout(self, key: str) -> _Entry[T]:
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refs += 1
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return entry
+
+                pending = self._loading.get(key)
+                if pending is None:
+                    pending = self._loading[key] = Future()
+                    self._stats.misses += 1
+                    # Make room before loading so two models never peak
+                    # together when the cache is already full.
+                    evicted = self._evict(reserve=1)
+                    break
+
+            self._wait_for_load(key, pending)
+
+        return self._load_entry(key, pending, evicted)
+
+    def _wait_for_load(self, key: str, pending: Future) -> None:
+        """
+        Blocks until another caller finishes loading ``key``. Raises the
+        loader's exception if that load failed.
+        """
+
+        log.debug("Waiting for model %s to load...", key)
+        started = time.perf_counter()
+        try:
+            pending.result()
+        finally:
+            waited = time.perf_counter() - started
+            with self._lock:
+                self._stats.waits += 1
+                self._stats.wait_seconds += waited
+            log.info("Waited %.2fs for model %s to load", waited, key)
+
+    def _load_entry(
+        self, key: str, pending: Future, evicted: list[str]
+    ) -> _Entry[T]:
+        """
+        Loads ``key`` on behalf of every caller waiting on ``pending`` and
+        returns the new entry acquired once. However the load ends, ``key``
+        stops being marked as loading and the waiters are woken up.
+
+        :param evicted: Keys evicted to make room, notified first.
+        """
+
+        started = time.perf_counter()
+        loaded = False
+        try:
+            self._notify(evicted)
+            value = self._loader(key)
+            size = self._size_of(key, value)
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                entry = self._entries[key] = _Entry(
+                    value=value, size=size, refs=1
+                )
+                del self._loading[key]
+                self._stats.loads += 1
+                self._stats.load_seconds += elapsed
+                evicted = self._evict()
+            pending.set_result(None)
+            loaded = True
+        finally:
+            if not loaded:
+                with self._lock:
+                    self._loading.pop(key, None)
+                    self._stats.load_failures += 1
+                # Interruptions such as KeyboardInterrupt are not raised
+                # again in the threads of the waiters.
+                error = sys.exc_info()[1]
+                if not isinstance(error, Exception):
+                    error = RuntimeError(f"Loading model {key} was interrupted")
+                pending.set_exception(error)
+
+        log.info("Loaded model %s in %.2fs", key, elapsed)
+        self._notify(evicted)
+        return entry
+
+    def _release(self, entry: _Entry[T]) -> None:
+        with self._lock:
+            entry.refs -= 1
+            evicted = self._evict() if entry.refs == 0 else []
+        self._notify(evicted)
+
+    def _notify(self, evicted: list[str]) -> None:
+        if self._on_evict is None:
+            return
+        for key in evicted:
+            self._on_evict(key)
+
+    def _within_limits(self, reserve: int = 0) -> bool:
+        if (
+            self._max_models is not None
+            and len(self._entries) + reserve > self._max_models
+        ):
+            return False
+        if self._memory_budget is not None:
+            used = sum(entry.size for entry in self._entries.values())
+            return used <= self._memory_budget
+        return True
+
+    def _evict(self, reserve: int = 0) -> list[str]:
+        """
+        Evicts idle, unpinned models in LRU order until the cache fits its
+        limits. Must be called with the lock held.
+
+        :param reserve: Number of models about to be added.
+        :return: Keys of the evicted models.
+        """
+
+        evicted: list[str] = []
+        for key in list(self._entries):
+            if self._within_limits(reserve):
+                return evicted
+
+            entry = self._entries[key]
+            if entry.refs or key in self._pinned:
+                continue
+
+            del self._entries[key]
+            self._stats.evictions += 1
+            evicted.append(key)
+            log.info("Evicted model %s from cache", key)
+
+        if not self._within_limits(reserve):
+            log.warning(
+                "Model cache is over its limits; remaining models are "
+                "pinned or in use: %s",
+                ", ".join(self._entries),
+            )
+        return evicted
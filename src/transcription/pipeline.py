@@ -0,0 +1,189 @@
+"""
+Stateless building blocks of a WhisperX transcription.
+
+``FasterWhisperPipeline.transcribe`` swaps the tokenizer and options stored on
+the pipeline for the duration of a call, so two threads sharing one cached
+pipeline can corrupt each other's language. The helpers below perform the same
+steps (VAD, language selection, batched decoding) without mutating the
+pipeline, which lets several requests share it concurrently and lets their
+chunks be decoded in the same batch.
+
+PyTorch, CTranslate2 and the WhisperX pipeline take seconds to import, so they
+are imported by the functions that need them; importing the application
+does not pay for them before a model is loaded.
+"""
+
+from dataclasses import replace
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+import numpy as np
+from whisperx.types import SingleSegment
+
+from src.transcription.audio import SAMPLE_RATE
+
+if TYPE_CHECKING:
+    from faster_whisper.tokenizer import Tokenizer
+    from whisperx.asr import FasterWhisperPipeline
+
+TASK = "transcribe"
+
+
+def detect_speech(
+    pipeline: "FasterWhisperPipeline", audio: np.ndarray, chunk_size: int
+) -> list[dict]:
+    """
+    Runs voice activity detection and merges speech into chunks.
+
+    :param pipeline: Loaded pipeline whose VAD model is used.
+    :param audio: 16 kHz mono waveform.
+    :param chunk_size: Maximum chunk length in seconds.
+
+    :return: List of chunks with "start" and "end" in seconds.
+    """
+
+    from whisperx.vads import Pyannote, Vad
+
+    vad_model = pipeline.vad_model
+    if isinstance(vad_model, Vad):
+        waveform = vad_model.preprocess_audio(audio)
+        merge_chunks = vad_model.merge_chunks
+    else:
+        waveform = Pyannote.preprocess_audio(audio)
+        merge_chunks = Pyannote.merge_chunks
+
+    segments = vad_model({"waveform": waveform, "sample_rate": SAMPLE_RATE})
+    if not segments:
+        return []
+
+    return merge_chunks(
+        segments,
+        chunk_size,
+        onset=pipeline._vad_params["vad_onset"],
+        offset=pipeline._vad_params["vad_offset"],
+    )
+
+
+def get_tokenizer(
+    pipeline: "FasterWhisperPipeline",
+    audio: np.ndarray,
+    language: str | None = None,
+) -> "Tokenizer":
+    """
+    Returns a tokenizer for the given language, detecting the language from
+    the first 30 seconds of audio when it is not given.
+
+    :param pipeline: Loaded pipeline.
+    :param audio: 16 kHz mono waveform.
+    :param language: Optional language code.
+
+    :return: Tokenizer configured for transcription in that language.
+    """
+
+    from faster_whisper.tokenizer import Tokenizer
+
+    preset = pipeline.tokenizer
+    if preset is not None and language in (None, preset.language_code):
+        return preset
+
+    language = language or pipeline.detect_language(audio)
+    return Tokenizer(
+        pipeline.model.hf_tokenizer,
+        pipeline.model.model.is_multilingual,
+        task=TASK,
+        language=language,
+    )
+
+
+def split_audio(audio: np.ndarray, chunks: list[dict]) -> list[np.ndarray]:
+    """
+    Cuts the waveform into the given chunks.
+
+    :param audio: 16 kHz mono waveform.
+    :param chunks: Chunks with "start" and "end" in seconds.
+
+    :return: Waveform of every chunk.
+    """
+
+    return [
+        audio[
+            int(chunk["start"] * SAMPLE_RATE) : int(chunk["end"] * SAMPLE_RATE)
+        ]
+        for chunk in chunks
+    ]
+
+
+def decode(
+    pipeline: "FasterWhisperPipeline",
+    chunks: list[np.ndarray],
+    tokenizer: "Tokenizer",
+    beam_size: int | None = None,
+) -> list[str]:
+    """
+    Decodes a batch of audio chunks (each at most 30 seconds) in one model call.
+
+    :param pipeline: Loaded pipeline.
+    :param chunks: Waveforms to decode together.
+    :param tokenizer: Tokenizer shared by every chunk of the batch.
+    :param beam_size: Beam size of the decoding, the pipeline's own when
+        None.
+
+    :return: Decoded text of every chunk, in order.
+    """
+
+    import torch
+    from whisperx.audio import N_SAMPLES, log_mel_spectrogram
+
+    n_mels = pipeline.model.feat_kwargs.get("feature_size")
+    features = torch.stack(
+        [
+            log_mel_spectrogram(
+                chunk,
+                n_mels=n_mels if n_mels is not None else 80,
+                padding=N_SAMPLES - chunk.shape[0],
+            )
+            for chunk in chunks
+        ]
+    )
+    options = pipeline.options
+    if beam_size is not None and beam_size != options.beam_size:
+        options = replace(options, beam_size=beam_size)
+    return pipeline.model.generate_segment_batched(features, tokenizer, options)
+
+
+def to_segments(chunks: list[dict], texts: list[str]) -> list[SingleSegment]:
+    """
+    Pairs decoded texts with the timestamps of their chunks.
+
+    :param chunks: Chunks with "start" and "end" in seconds.
+    :param texts: Decoded text of every chunk.
+
+    :return: List of transcribed segments.
+    """
+
+    return list(iter_segments(chunks, texts))
+
+
+def iter_segments(
+    chunks: list[dict], texts: Iterable[str]
+) -> Iterator[SingleSegment]:
+    """
+    Pairs decoded texts with the timestamps of their chunks as the texts
+    become available.
+
+    VAD pads speech regions, so neighbouring chunks can overlap by a few
+    hundred milliseconds; each segment starts no earlier than the previous
+    one ends, which keeps the timeline monotonic once chunks decoded apart
+    are stitched back together.
+
+    :param chunks: Chunks with "start" and "end" in seconds.
+    :param texts: Decoded text of every chunk, in order.
+
+    :return: Iterator over the transcribed segments.
+    """
+
+    previous_end = 0.0
+    for chunk, text in zip(chunks, texts, strict=True):
+        start = max(round(chunk["start"], 3), previous_end)
+        end = max(round(chunk["end"], 3), start)
+        previous_end = end
+        yield {"text": text, "start": start, "end": end}
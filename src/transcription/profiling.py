@@ -0,0 +1,310 @@
+"""
+On-demand profiling of single transcriptions.
+
+A profiled transcription is sampled by a background thread that reads the
+stacks of the threads working on it (the event loop thread that awaits it
+and every inference, replica or batch thread it is handed to) every few
+milliseconds. The samples are written as folded stacks, one
+``frame;frame;frame count`` line per distinct stack, which flame graph
+tools such as speedscope or ``flamegraph.pl`` render directly. Python
+allocations made while it runs are traced with ``tracemalloc`` and written
+as a report of the lines that allocated the most.
+
+The event loop thread is shared with other requests, so its samples include
+their work as well. Memory allocated by native code (CTranslate2, PyTorch,
+FFmpeg) is not seen by ``tracemalloc``.
+"""
+
+import json
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import Counter
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, TypeVar
+
+from anyio import to_thread
+
+from src.enums import BaseEnum
+from src.transcription import log
+
+T = TypeVar("T")
+
+MEMORY_TOP_LINES = 50
+
+_current: ContextVar["Profile | None"] = ContextVar(
+    "transcription_profile", default=None
+)
+
+
+class ProfileArtifact(BaseEnum):
+    CPU = "cpu"
+    MEMORY = "memory"
+
+
+_SUFFIXES = {
+    ProfileArtifact.CPU: ".folded",
+    ProfileArtifact.MEMORY: ".memory.txt",
+}
+
+
+class Profile:
+    """Samples the stacks of the threads working on one transcription."""
+
+    def __init__(self, interval: float):
+        """
+        :param interval: Seconds between two samples.
+        """
+
+        self.stacks: Counter[str] = Counter()
+        self._interval = interval
+        self._threads: dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(
+            target=self._sample, name="profile-sampler", daemon=True
+        )
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def start(self) -> None:
+        self._sampler.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._sampler.join()
+
+    def add_thread(self) -> None:
+        """Includes the calling thread in the samples."""
+
+        thread = threading.current_thread()
+        with self._lock:
+            self._threads[thread.ident] = thread.name
+
+    def remove_thread(self) -> None:
+        with self._lock:
+            self._threads.pop(threading.get_ident(), None)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self._interval):
+            with self._lock:
+                threads = list(self._threads.items())
+            frames = sys._current_frames()
+            for ident, name in threads:
+                frame = frames.get(ident)
+                if frame is not None:
+                    self.stacks[_fold(name, frame)] += 1
+
+
+def current_profile() -> Profile | None:
+    """Returns the profile of the calling context, None if not profiled."""
+
+    return _current.get()
+
+
+@contextmanager
+def sampled(profiles: Iterable[Profile]) -> Iterator[None]:
+    """Makes the profiles sample the calling thread while the block runs."""
+
+    profiles = list(profiles)
+    for profile in profiles:
+        profile.add_thread()
+    try:
+        yield
+    finally:
+        for profile in profiles:
+            profile.remove_thread()
+
+
+def follow(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Makes the profile of the calling context, if any, sample the thread that
+    later runs ``func``. Used when work is handed to another thread.
+    """
+
+    profile = _current.get()
+    if profile is None:
+        return func
+
+    @wraps(func)
+    def run(*args: Any, **kwargs: Any) -> T:
+        token = _current.set(profile)
+        try:
+            with sampled([profile]):
+                return func(*args, **kwargs)
+        finally:
+            _current.reset(token)
+
+    return run
+
+
+class TranscriptionProfiler:
+    """
+    Profiles the transcriptions it is asked to or a random fraction of all of
+    them, one at a time, and keeps the most recent profiles on disk.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        sample_rate: float = 0.0,
+        interval: float = 0.005,
+        max_kept: int = 50,
+    ):
+        """
+        :param directory: Directory the profiles are written to.
+        :param sample_rate: Fraction of transcriptions profiled without
+            being asked to.
+        :param interval: Seconds between two stack samples.
+        :param max_kept: Number of profiles kept, older ones are deleted.
+        """
+
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._sample_rate = sample_rate
+        self._interval = interval
+        self._max_kept = max_kept
+        self._busy = threading.Lock()
+
+    @asynccontextmanager
+    async def profile(
+        self, force: bool = False, **details: Any
+    ) -> AsyncIterator[str | None]:
+        """
+        Profiles the enclosed transcription if it is forced or sampled.
+
+        Tracing allocations is process-wide, so a transcription that starts
+        while another one is profiled is not profiled.
+
+        :param force: Profile regardless of the sample rate.
+        :param details: Description of the transcription stored with the
+            profile, e.g. the model.
+        :return: ID of the profile, None if not profiled.
+        """
+
+        if not (force or random.random() < self._sample_rate):
+            yield None
+            return
+        if not self._busy.acquire(blocking=False):
+            log.info("Skipping profile, another transcription is profiled")
+            yield None
+            return
+
+        profile_id = uuid.uuid4().hex
+        profile = Profile(self._interval)
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
+        started = time.perf_counter()
+        profile.add_thread()
+        profile.start()
+        token = _current.set(profile)
+        try:
+            yield profile_id
+        finally:
+            _current.reset(token)
+            profile.stop()
+            duration = time.perf_counter() - started
+            try:
+                await to_thread.run_sync(
+                    self._save, profile_id, profile, duration, details, tracing
+                )
+            finally:
+                self._busy.release()
+
+    def profiles(self) -> list[dict[str, Any]]:
+        """Returns the metadata of the kept profiles, newest first."""
+
+        profiles = []
+        for name in os.listdir(self._directory):
+            if name.endswith(".json"):
+                try:
+                    with open(os.path.join(self._directory, name)) as f:
+                        profiles.append(json.load(f))
+                except (OSError, ValueError):
+                    continue
+        return sorted(profiles, key=lambda p: p["created_at"], reverse=True)
+
+    def path(self, profile_id: str, artifact: ProfileArtifact) -> str | None:
+        """Returns the file of a profile artifact, None if it does not exist."""
+
+        path = os.path.join(
+            self._directory, uuid.UUID(profile_id).hex + _SUFFIXES[artifact]
+        )
+        return path if os.path.isfile(path) else None
+
+    def _save(
+        self,
+        profile_id: str,
+        profile: Profile,
+        duration: float,
+        details: dict[str, Any],
+        tracing: bool,
+    ) -> None:
+        try:
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(False, tracemalloc.__file__)]
+            )
+        finally:
+            if not tracing:
+                tracemalloc.stop()
+
+        base = os.path.join(self._directory, profile_id)
+        with open(base + _SUFFIXES[ProfileArtifact.CPU], "w") as f:
+            for stack, count in profile.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        with open(base + _SUFFIXES[ProfileArtifact.MEMORY], "w") as f:
+            f.write(f"Peak traced memory: {peak / 1024 / 1024:.1f} MiB\n")
+            f.write(f"Top {MEMORY_TOP_LINES} allocating lines:\n")
+            for stat in snapshot.statistics("lineno")[:MEMORY_TOP_LINES]:
+                f.write(f"{stat}\n")
+
+        metadata = {
+            "id": profile_id,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "duration_seconds": round(duration, 3),
+            "samples": profile.samples,
+            "peak_memory_bytes": peak,
+            **details,
+        }
+        with open(base + ".json", "w") as f:
+            json.dump(metadata, f)
+        log.info("Saved profile %s of %s", profile_id, details)
+        self._prune()
+
+    def _prune(self) -> None:
+        for metadata in self.profiles()[self._max_kept :]:
+            base = os.path.join(self._directory, metadata["id"])
+            for suffix in (".json", *_SUFFIXES.values()):
+                try:
+                    os.remove(base + suffix)
+                except FileNotFoundError:
+                    pass
+
+
+def _fold(thread_name: str, frame) -> str:
+    """Formats a stack as ``thread;outermost;...;innermost``."""
+
+    frames = []
+    while frame is not None:
+        code = frame.f_code
+        filename = code.co_filename.rsplit("site-packages" + os.sep, 1)[-1]
+        frames.append(f"{code.co_name} ({filename}:{code.co_firstlineno})")
+        frame = frame.f_back
+    frames.append(thread_name)
+    return ";".join(reversed(frames))
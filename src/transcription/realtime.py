@@ -0,0 +1,336 @@
+"""
+Incremental transcription of live audio.
+
+Audio arrives in small frames and is transcribed in steps. Each step runs VAD
+over the audio that has not been finalized yet: speech chunks followed by
+enough silence (or by another chunk) are decoded as final segments and their
+audio is dropped, while the chunk that is still being spoken is decoded as a
+partial segment that later steps refine.
+"""
+
+import asyncio
+import json
+import threading
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import numpy as np
+from fastapi import WebSocket, WebSocketDisconnect, status
+
+from src.transcription import log
+from src.transcription.audio import SAMPLE_RATE
+from src.transcription.enums import Language, Model
+from src.transcription.exceptions import InferenceQueueFullError
+from src.transcription.pipeline import detect_speech, get_tokenizer, split_audio
+from src.transcription.speech_transcription import SpeechTranscription
+
+
+@dataclass
+class LiveSegment:
+    """A segment of live audio, with times relative to the stream start."""
+
+    final: bool
+    text: str
+    start: float
+    end: float
+
+    def to_message(self) -> dict:
+        return {
+            "type": "final" if self.final else "partial",
+            "text": self.text.strip(),
+            "start": round(self.start, 3),
+            "end": round(self.end, 3),
+        }
+
+
+class LiveTranscription:
+    """
+    Transcription state of one live audio stream.
+
+    ``feed`` may be called from the event loop while ``step`` runs on an
+    inference thread; steps themselves must not overlap.
+    """
+
+    def __init__(
+        self,
+        transcriber: SpeechTranscription,
+        model: Model = Model.SMALL,
+        language: Language | None = None,
+        chunk_size: int = 10,
+        min_silence: float = 0.5,
+        batch_size: int = 4,
+        beam_size: int | None = None,
+    ):
+        """
+        :param transcriber: Transcriber whose cached pipelines are used.
+        :param model: Model to transcribe with.
+        :param language: Language of the stream, detected on the first step
+            with speech when not given.
+        :param chunk_size: Maximum length of a segment in seconds.
+        :param min_silence: Seconds of silence after speech that close a
+            segment.
+        :param batch_size: Maximum number of chunks decoded in one call.
+        :param beam_size: Beam size, the pipeline's own when None.
+        """
+
+        self._transcriber = transcriber
+        self._model = model
+        self._language = language.value if language else None
+        self._chunk_size = chunk_size
+        self._min_silence = min_silence
+        self._batch_size = batch_size
+        self._beam_size = beam_size
+
+        self._audio = np.zeros(0, dtype=np.float32)
+        self._offset = 0
+        self._incoming: list[np.ndarray] = []
+        self._incoming_samples = 0
+        self._odd_byte = b""
+        self._lock = threading.Lock()
+
+    @property
+    def language(self) -> str | None:
+        """Language of the stream, once given or detected."""
+
+        return self._language
+
+    @property
+    def pending_seconds(self) -> float:
+        """Seconds of audio received since the last step started."""
+
+        with self._lock:
+            return self._incoming_samples / SAMPLE_RATE
+
+    @property
+    def buffered_seconds(self) -> float:
+        """Seconds of audio that are not part of a final segment yet."""
+
+        with self._lock:
+            return (len(self._audio) + self._incoming_samples) / SAMPLE_RATE
+
+    def feed(self, samples: np.ndarray) -> None:
+        """
+        Appends audio to the stream.
+
+        :param samples: 16 kHz mono float32 samples.
+        """
+
+        with self._lock:
+            self._incoming.append(samples)
+            self._incoming_samples += len(samples)
+
+    def feed_pcm16(self, frame: bytes) -> None:
+        """
+        Appends a frame of 16 kHz mono signed 16-bit little-endian PCM.
+        Frames need not hold whole samples: a trailing odd byte is kept and
+        completed by the next frame.
+        """
+
+        frame = self._odd_byte + frame
+        size = len(frame) - len(frame) % 2
+        self._odd_byte = frame[size:]
+        samples = np.frombuffer(frame, "<i2", size // 2)
+        self.feed(samples.astype(np.float32) / 32768.0)
+
+    def step(self, final: bool = False) -> list[LiveSegment]:
+        """
+        Transcribes the audio received so far.
+
+        :param final: Whether the stream has ended; every remaining chunk is
+            then finalized.
+
+        :return: Final segments completed by this step, in order, followed by
+            the partial segment still being spoken, if any.
+        """
+
+        with self._lock:
+            if self._incoming:
+                self._audio = np.concatenate([self._audio, *self._incoming])
+                self._incoming.clear()
+                self._incoming_samples = 0
+        audio = self._audio
+        duration = len(audio) / SAMPLE_RATE
+        if not len(audio):
+            return []
+
+        with self._transcriber.acquire_model(self._model) as pipeline:
+            chunks = detect_speech(pipeline, audio, self._chunk_size)
+            if not chunks:
+                # Keep a little trailing audio: speech may start right at it.
+                self._drop(duration - (0 if final else self._min_silence))
+                return []
+
+            tokenizer = get_tokenizer(pipeline, audio, self._language)
+            self._language = tokenizer.language_code
+
+            # Merged VAD chunks are split at silences or at chunk_size, so
+            # only the last one can still grow.
+            closed = len(chunks)
+            if not final and chunks[-1]["end"] > duration - self._min_silence:
+                closed -= 1
+
+            texts = list(
+                self._transcriber.decode_chunks(
+                    pipeline,
+                    tokenizer,
+                    split_audio(audio, chunks),
+                    self._batch_size,
+                    self._beam_size,
+                )
+            )
+
+        offset = self._offset / SAMPLE_RATE
+        segments = [
+            LiveSegment(
+                final=index < closed,
+                text=text,
+                start=offset + chunk["start"],
+                end=offset + chunk["end"],
+            )
+            for index, (chunk, text) in enumerate(
+                zip(chunks, texts, strict=True)
+            )
+        ]
+        if final:
+            self._drop(duration)
+        elif closed:
+            self._drop(chunks[closed - 1]["end"])
+        return segments
+
+    def _drop(self, seconds: float) -> None:
+        """Discards the first ``seconds`` of the buffered audio."""
+
+        samples = max(0, min(int(seconds * SAMPLE_RATE), len(self._audio)))
+        self._audio = self._audio[samples:]
+        self._offset += samples
+
+
+async def serve_live_transcription(
+    websocket: WebSocket,
+    session: LiveTranscription,
+    step: Callable[[LiveTranscription, bool], Awaitable[list[LiveSegment]]],
+    step_interval: float = 1.0,
+    max_buffered: float = 20.0,
+    retry_delay: float = 0.1,
+) -> None:
+    """
+    Runs the protocol of a live transcription WebSocket.
+
+    The client sends binary frames of 16 kHz mono 16-bit PCM and finally the
+    text message ``{"type": "end"}``. Every ``step_interval`` seconds of new
+    audio a step runs in the background and its segments are sent as
+    ``{"type": "partial" | "final", "text", "start", "end"}``; the stream is
+    closed with ``{"type": "done", "language"}`` after the last segment.
+
+    Backpressure: while a step runs, frames keep being buffered, but once
+    more than ``max_buffered`` seconds are waiting the socket is not read
+    until the step finishes, so a client sending faster than real time is
+    slowed down by TCP flow control instead of growing the buffer. Steps
+    rejected by a saturated inference pool are skipped; their audio is
+    transcribed by the next step. If the buffer is still over the limit and
+    no step can run, the stream is closed with code 1013 (try again later)
+    after an ``{"type": "error"}`` message. A step failing for any other
+    reason closes the stream with code 1011 (internal error) the same way.
+
+    :param websocket: Accepted WebSocket connection.
+    :param session: Transcription state of the stream.
+    :param step: Runs a step of the session, off the event loop.
+    :param step_interval: Seconds of new audio that trigger a step.
+    :param max_buffered: Seconds of unfinalized audio before reading pauses
+        and, if no step can run, the stream is closed.
+    :param retry_delay: Seconds between attempts of the final step when the
+        inference pool is saturated.
+    """
+
+    async def advance(final: bool = False) -> bool:
+        while True:
+            try:
+                segments = await step(session, final)
+                break
+            except InferenceQueueFullError:
+                if not final:
+                    log.debug("Inference pool busy, skipping live step")
+                    return False
+                await asyncio.sleep(retry_delay)
+            except Exception as err:
+                raise _StepFailedError from err
+
+        for segment in segments:
+            await websocket.send_json(segment.to_message())
+        return True
+
+    running: asyncio.Task | None = None
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+
+            if message.get("bytes") is not None:
+                session.feed_pcm16(message["bytes"])
+            elif _is_end_message(message.get("text")):
+                break
+            else:
+                await websocket.send_json(
+                    {"type": "error", "detail": "Unexpected message"}
+                )
+
+            if running is not None and running.done():
+                running.result()
+                running = None
+
+            if session.buffered_seconds > max_buffered:
+                if running is not None:
+                    await running
+                    running = None
+                # Without a step the buffer only grows, e.g. while the
+                # inference pool keeps rejecting them.
+                if session.buffered_seconds > max_buffered and not (
+                    await advance()
+                ):
+                    log.warning("Live transcription fell behind, closing")
+                    await websocket.send_json(
+                        {
+                            "type": "error",
+                            "detail": "Transcription is falling behind, "
+                            "try again later",
+                        }
+                    )
+                    await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+                    return
+            elif running is None and session.pending_seconds >= step_interval:
+                running = asyncio.create_task(advance())
+
+        if running is not None:
+            await running
+            running = None
+        await advance(final=True)
+        await websocket.send_json(
+            {"type": "done", "language": session.language}
+        )
+        await websocket.close()
+    except WebSocketDisconnect:
+        log.debug("Live transcription client disconnected")
+    except _StepFailedError:
+        log.exception("Live transcription step failed, closing")
+        await websocket.send_json(
+            {"type": "error", "detail": "Transcription failed"}
+        )
+        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+    finally:
+        if running is not None and not running.done():
+            running.cancel()
+
+
+class _StepFailedError(Exception):
+    """Raised when a live step fails other than by a saturated pool."""
+
+
+def _is_end_message(text: str | None) -> bool:
+    if text is None:
+        return False
+    try:
+        message = json.loads(text)
+    except ValueError:
+        return False
+    return isinstance(message, dict) and message.get("type") == "end"
@@ -0,0 +1,518 @@
+"""
+Inference in a separate process shared by every API worker.
+
+Each uvicorn worker that loads its own models multiplies model memory by the
+number of workers. With ``INFERENCE_SERVER_ADDRESS`` set, a single
+``InferenceServer`` process (``python -m src.transcription.server``) owns
+the models and the API workers use a ``RemoteTranscriber`` in place of
+``SpeechTranscription``. It forwards calls over a Unix socket with
+``multiprocessing.connection``, which authenticates both ends with a shared
+key and pickles arguments and results.
+
+Audio files are passed by path, so the workers and the server must share
+the upload directories, i.e. run on the same host. Chunks of requests from
+different workers meet in the server's batch scheduler and are decoded in
+shared batches.
+"""
+
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Callable, Iterator
+
+import numpy as np
+
+from src.transcription import log
+from src.transcription.audio import AudioSource
+from src.transcription.enums import Language, Model, ModelState
+from src.transcription.model_cache import ModelCacheStats
+from src.transcription.realtime import LiveSegment, LiveTranscription
+from src.transcription.speech_transcription import SpeechTranscription
+from src.transcription.tuning import InferenceOptions
+
+_RESULT = "result"
+_ITEM = "item"
+_DONE = "done"
+_ERROR = "error"
+# Raised by a pooled connection whose server end was closed, e.g. because
+# the server restarted since it was last used.
+_CLOSED_ERRORS = (EOFError, BrokenPipeError, ConnectionResetError)
+
+LIVE_SESSION_TTL_SECONDS = 300
+
+
+class InferenceServer:
+    """
+    Serves the models of a ``SpeechTranscription`` to other processes.
+
+    Every client connection is handled by its own thread and carries one
+    call at a time, so the number of concurrent calls is bounded by the
+    inference pools of the clients.
+    """
+
+    def __init__(
+        self,
+        transcriber: SpeechTranscription,
+        address: str,
+        authkey: bytes,
+        live_session_ttl: float = LIVE_SESSION_TTL_SECONDS,
+    ):
+        """
+        :param transcriber: Transcriber that owns the models.
+        :param address: Path of the Unix socket to listen on.
+        :param authkey: Key clients must know to connect.
+        :param live_session_ttl: Seconds after which a live session without
+            steps is dropped, e.g. when its client disconnected.
+        """
+
+        self._transcriber = transcriber
+        self._address = address
+        self._authkey = authkey
+        self._live_session_ttl = live_session_ttl
+        self._live_sessions: dict[str, tuple[LiveTranscription, float]] = {}
+        self._live_lock = threading.Lock()
+        if os.path.exists(address):
+            # Left behind by a server that did not shut down cleanly.
+            os.remove(address)
+        self._listener = Listener(address, family="AF_UNIX", authkey=authkey)
+        self._closed = threading.Event()
+        self._calls: dict[str, Callable[..., Any]] = {
+            "transcribe": transcriber.transcribe,
+            "transcribe_many": transcriber.transcribe_many,
+            "model_states": transcriber.model_states,
+            "inference_params": transcriber.inference_params,
+            "resolve_options": transcriber.resolve_options,
+            "model_cache_stats": transcriber.model_cache_stats,
+            "model_memory": transcriber.model_memory,
+            "live_step": self._live_step,
+        }
+        self._streams: dict[str, Callable[..., Iterator[Any]]] = {
+            "transcribe_iter": transcriber.transcribe_iter,
+        }
+
+    def serve_forever(self) -> None:
+        """Accepts connections until ``close`` is called."""
+
+        log.info("Inference server listening on %s", self._address)
+        try:
+            while not self._closed.is_set():
+                try:
+                    connection = self._listener.accept()
+                except OSError as e:
+                    if self._closed.is_set():
+                        break
+                    log.warning("Rejected inference client: %s", e)
+                    continue
+                threading.Thread(
+                    target=self._serve,
+                    args=(connection,),
+                    name="inference-client",
+                    daemon=True,
+                ).start()
+        finally:
+            self._listener.close()
+
+    def close(self) -> None:
+        """Stops accepting connections."""
+
+        self._closed.set()
+        # Wake up the blocking accept.
+        try:
+            Client(
+                self._address, family="AF_UNIX", authkey=self._authkey
+            ).close()
+        except OSError:
+            pass
+
+    def _serve(self, connection: Connection) -> None:
+        with connection:
+            while True:
+                try:
+                    method, args, kwargs = connection.recv()
+                except (EOFError, OSError):
+                    return
+                try:
+                    self._dispatch(connection, method, args, kwargs)
+                except _Disconnected:
+                    return
+
+    def _dispatch(
+        self, connection: Connection, method: str, args: tuple, kwargs: dict
+    ) -> None:
+        """
+        Runs a call and sends its result or error. Items of a stream are
+        sent as they are produced; a client that goes away closes the
+        generator, which stops its work.
+        """
+
+        try:
+            if method in self._streams:
+                items = self._streams[method](*args, **kwargs)
+                try:
+                    for item in items:
+                        _send(connection, _ITEM, item)
+                finally:
+                    items.close()
+                status, value = _DONE, None
+            elif method in self._calls:
+                status, value = _RESULT, self._calls[method](*args, **kwargs)
+            else:
+                raise ValueError(f"Unknown method {method!r}")
+        except _Disconnected:
+            raise
+        except Exception as e:
+            status, value = _ERROR, e
+        _send(connection, status, value)
+
+    def _live_step(
+        self,
+        session_id: str,
+        audio: np.ndarray,
+        final: bool,
+        model: Model,
+        language: Language | None,
+        chunk_size: int,
+        batch_size: int,
+        beam_size: int | None,
+    ) -> tuple[list[LiveSegment], str | None, float]:
+        """
+        Feeds new audio to a live session, creating it on its first step,
+        and runs a step.
+
+        :return: Segments of the step, language and buffered seconds of the
+            session.
+        """
+
+        now = time.monotonic()
+        with self._live_lock:
+            for key, (_, last_step) in list(self._live_sessions.items()):
+                if now - last_step > self._live_session_ttl:
+                    del self._live_sessions[key]
+            session, _ = self._live_sessions.get(session_id, (None, now))
+            if session is None:
+                session = LiveTranscription(
+                    self._transcriber,
+                    model,
+                    language,
+                    chunk_size=chunk_size,
+                    batch_size=batch_size,
+                    beam_size=beam_size,
+                )
+            self._live_sessions[session_id] = (session, now)
+
+        session.feed(audio)
+        try:
+            segments = session.step(final)
+        finally:
+            if final:
+                with self._live_lock:
+                    self._live_sessions.pop(session_id, None)
+        return segments, session.language, session.buffered_seconds
+
+
+class RemoteTranscriber:
+    """
+    Client of an ``InferenceServer`` with the interface of
+    ``SpeechTranscription`` that the transcription service uses.
+
+    Calls block like their local counterparts and are meant to run on the
+    inference pool. Connections are opened on demand and reused.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        authkey: bytes,
+        models: list[Model] | None = None,
+        call_timeout: float = 2.0,
+    ):
+        """
+        :param address: Path of the Unix socket of the server.
+        :param authkey: Key shared with the server.
+        :param models: Models the server preloads, reported as pending while
+            the server cannot be reached.
+        :param call_timeout: Seconds to wait for the answer to calls other
+            than transcriptions, such as model states and tunings, so a stuck
+            server fails them instead of hanging their callers.
+        """
+
+        self._address = address
+        self._authkey = authkey
+        self._models = models or []
+        self._call_timeout = call_timeout
+        self._idle: list[Connection] = []
+        self._lock = threading.Lock()
+        self._options: dict[tuple, Any] = {}
+
+    def transcribe(self, audio_file: AudioSource | np.ndarray, *args, **kwargs):
+        return self._call("transcribe", _portable(audio_file), *args, **kwargs)
+
+    def transcribe_iter(
+        self, audio_file: AudioSource | np.ndarray, *args, **kwargs
+    ):
+        return self._stream(
+            "transcribe_iter", _portable(audio_file), *args, **kwargs
+        )
+
+    def transcribe_many(self, audio_files: list[AudioSource], *args, **kwargs):
+        return self._call(
+            "transcribe_many",
+            [_portable(audio) for audio in audio_files],
+            *args,
+            **kwargs,
+        )
+
+    def model_states(self) -> dict[Model, ModelState]:
+        try:
+            return self._request(
+                "model_states", (), {}, timeout=self._call_timeout
+            )
+        except (OSError, EOFError) as e:
+            log.warning("Inference server is unreachable: %r", e)
+            return dict.fromkeys(self._models, ModelState.PENDING)
+
+    def model_cache_stats(self) -> ModelCacheStats:
+        return self._request(
+            "model_cache_stats", (), {}, timeout=self._call_timeout
+        )
+
+    def model_memory(self) -> dict[str, int]:
+        return self._request("model_memory", (), {}, timeout=self._call_timeout)
+
+    def resolve_options(
+        self, model: Model, options: InferenceOptions | None = None
+    ) -> InferenceOptions:
+        return self._cached("resolve_options", model, options)
+
+    def inference_params(
+        self, model: Model, options: InferenceOptions | None = None
+    ) -> dict:
+        return self._cached("inference_params", model, options)
+
+    def start_live(
+        self,
+        model: Model,
+        language: Language | None,
+        chunk_size: int,
+        batch_size: int,
+        beam_size: int | None,
+    ) -> "RemoteLiveTranscription":
+        """Creates a live session whose steps run in the server."""
+
+        return RemoteLiveTranscription(
+            self,
+            model,
+            language,
+            chunk_size=chunk_size,
+            batch_size=batch_size,
+            beam_size=beam_size,
+        )
+
+    def live_step(self, *args) -> tuple[list[LiveSegment], str | None, float]:
+        return self._call("live_step", *args)
+
+    def clean(self) -> None:
+        """Closes the idle connections. The server keeps its models."""
+
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    def _cached(self, method: str, *args) -> Any:
+        """
+        Calls a method whose result depends only on the server's tunings,
+        which do not change while it runs, once per arguments.
+        """
+
+        key = (method, *args)
+        if key not in self._options:
+            self._options[key] = self._request(
+                method, args, {}, timeout=self._call_timeout
+            )
+        return self._options[key]
+
+    @contextmanager
+    def _connection(self) -> Iterator[tuple[Connection, bool]]:
+        """
+        Lends a connection, along with whether it was used before. It is
+        returned for reuse unless the call was interrupted, which leaves
+        unread messages on it, or failed, which may have closed it.
+        """
+
+        with self._lock:
+            connection = self._idle.pop() if self._idle else None
+        reused = connection is not None
+        if connection is None:
+            connection = Client(
+                self._address, family="AF_UNIX", authkey=self._authkey
+            )
+        try:
+            yield connection, reused
+        except BaseException:
+            connection.close()
+            raise
+        with self._lock:
+            self._idle.append(connection)
+
+    def _call(self, method: str, *args, **kwargs) -> Any:
+        return self._request(method, args, kwargs)
+
+    def _request(
+        self,
+        method: str,
+        args: tuple,
+        kwargs: dict,
+        timeout: float | None = None,
+    ) -> Any:
+        """
+        Sends one call and returns its result.
+
+        A pooled connection found closed is dropped and the call is sent
+        again, once, on a new connection.
+
+        :param timeout: Seconds to wait for the answer, None to wait for as
+            long as the call takes.
+        :raises TimeoutError: If the answer did not arrive in time.
+        """
+
+        for retry in (True, False):
+            reused = False
+            try:
+                with self._connection() as (connection, reused):
+                    connection.send((method, args, kwargs))
+                    if timeout is not None and not connection.poll(timeout):
+                        # Closes the connection, the answer is still due.
+                        raise TimeoutError(
+                            "No answer from the inference server"
+                        )
+                    status, value = connection.recv()
+                break
+            except _CLOSED_ERRORS:
+                if not (retry and reused):
+                    raise
+                log.info("Inference server connection was closed, reconnecting")
+        if status == _ERROR:
+            raise value
+        return value
+
+    def _stream(self, method: str, *args, **kwargs) -> Iterator[Any]:
+        """
+        Sends a call answered with several items and yields them. A closed
+        pooled connection is replaced like in ``_request`` as long as no
+        item was received.
+        """
+
+        for retry in (True, False):
+            reused = received = False
+            try:
+                with self._connection() as (connection, reused):
+                    connection.send((method, args, kwargs))
+                    while True:
+                        status, value = connection.recv()
+                        if status != _ITEM:
+                            break
+                        received = True
+                        yield value
+                break
+            except _CLOSED_ERRORS:
+                if not (retry and reused) or received:
+                    raise
+                log.info("Inference server connection was closed, reconnecting")
+        if status == _ERROR:
+            raise value
+
+
+class RemoteLiveTranscription(LiveTranscription):
+    """
+    Live session whose audio is transcribed in the inference server. Frames
+    are buffered here and sent with the next step; the session state lives
+    in the server.
+    """
+
+    def __init__(
+        self,
+        transcriber: RemoteTranscriber,
+        model: Model,
+        language: Language | None,
+        chunk_size: int,
+        batch_size: int,
+        beam_size: int | None,
+    ):
+        super().__init__(
+            transcriber,
+            model,
+            language,
+            chunk_size=chunk_size,
+            batch_size=batch_size,
+            beam_size=beam_size,
+        )
+        self._id = uuid.uuid4().hex
+        self._language_hint = language
+        self._remote_buffered = 0.0
+
+    @property
+    def buffered_seconds(self) -> float:
+        return self._remote_buffered + self.pending_seconds
+
+    def step(self, final: bool = False) -> list[LiveSegment]:
+        with self._lock:
+            audio = (
+                np.concatenate(self._incoming)
+                if self._incoming
+                else np.zeros(0, dtype=np.float32)
+            )
+            self._incoming.clear()
+            self._incoming_samples = 0
+
+        segments, self._language, self._remote_buffered = (
+            self._transcriber.live_step(
+                self._id,
+                audio,
+                final,
+                self._model,
+                self._language_hint,
+                self._chunk_size,
+                self._batch_size,
+                self._beam_size,
+            )
+        )
+        return segments
+
+
+class _Disconnected(Exception):
+    """The client of a connection went away."""
+
+
+def _send(connection: Connection, status: str, value: Any) -> None:
+    """
+    Sends a message. A result or error that cannot be pickled is replaced
+    by an error describing it.
+    """
+
+    try:
+        connection.send((status, value))
+    except OSError as e:
+        raise _Disconnected() from e
+    except Exception as e:
+        if status == _ITEM:
+            raise
+        error = value if status == _ERROR else e
+        _send(
+            connection,
+            _ERROR,
+            RuntimeError(f"{type(error).__name__}: {error}"),
+        )
+
+
+def _portable(audio: AudioSource | np.ndarray) -> Any:
+    """Turns audio into a value that can be sent to the server."""
+
+    if hasattr(audio, "read"):
+        return audio.read()
+    if isinstance(audio, memoryview):
+        return audio.tobytes()
+    return audio
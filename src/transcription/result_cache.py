@@ -0,0 +1,303 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any
+
+from whisperx.types import SingleSegment
+
+from src.transcription import log
+from src.transcription.enums import Language, Model
+
+
+@dataclass
+class ResultCacheStats:
+    """Cumulative counters of a result cache."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+def result_cache_key(
+    sha256: str, model: Model, language: Language | None, **params: Any
+) -> str:
+    """
+    Builds the cache key of a transcription.
+
+    :param sha256: SHA-256 of the audio content.
+    :param model: Model used for the transcription.
+    :param language: Requested language, None for auto-detection.
+    :param params: Inference parameters that influence the result.
+
+    :return: Hex digest identifying the audio and everything that shaped its
+        transcript.
+    """
+
+    payload = json.dumps(
+        {
+            "audio": sha256,
+            "model": model.value,
+            "language": language.value if language else None,
+            "params": params,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def file_sha256(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Computes the SHA-256 of a file without reading it into memory."""
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache(ABC):
+    """
+    Thread-safe cache of transcription segments with a TTL and a bounded
+    number of entries, evicted least recently used first.
+
+    Subclasses implement the storage; counting is done here.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float | None = None):
+        """
+        :param max_entries: Maximum number of cached results.
+        :param ttl: Seconds after which a result expires (never if None).
+        """
+
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._stats = ResultCacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> list[SingleSegment] | None:
+        """Returns the cached segments for ``key``, or None on a miss."""
+
+        with self._lock:
+            segments = self._get(key)
+            if segments is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+            return segments
+
+    def set(self, key: str, segments: list[SingleSegment]) -> None:
+        """Stores the segments of a transcription under ``key``."""
+
+        with self._lock:
+            self._set(key, segments)
+            self._stats.stores += 1
+            self._stats.evictions += self._evict()
+
+    def clear(self) -> None:
+        """Removes every cached result."""
+
+        with self._lock:
+            self._clear()
+
+    def stats(self) -> ResultCacheStats:
+        """Returns a snapshot of the cache counters."""
+
+        with self._lock:
+            return replace(self._stats)
+
+    @abstractmethod
+    def close(self) -> None:
+        """Releases resources held by the backend."""
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._len()
+
+    @abstractmethod
+    def _get(self, key: str) -> list[SingleSegment] | None:
+        """Looks up a live entry and marks it as recently used."""
+
+    @abstractmethod
+    def _set(self, key: str, segments: list[SingleSegment]) -> None:
+        """Stores an entry as the most recently used one."""
+
+    @abstractmethod
+    def _evict(self) -> int:
+        """Drops least recently used entries above the limit, returns count."""
+
+    @abstractmethod
+    def _clear(self) -> None: ...
+
+    @abstractmethod
+    def _len(self) -> int: ...
+
+
+class MemoryResultCache(ResultCache):
+    """Result cache held in process memory."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float | None = None):
+        super().__init__(max_entries, ttl)
+        self._entries: OrderedDict[str, tuple[float, list[SingleSegment]]] = (
+            OrderedDict()
+        )
+
+    def _get(self, key: str) -> list[SingleSegment] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, segments = entry
+        if self._ttl is not None and time.monotonic() - stored_at > self._ttl:
+            del self._entries[key]
+            self._stats.expirations += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return segments
+
+    def _set(self, key: str, segments: list[SingleSegment]) -> None:
+        self._entries[key] = (time.monotonic(), segments)
+        self._entries.move_to_end(key)
+
+    def _evict(self) -> int:
+        evicted = 0
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def _clear(self) -> None:
+        self._entries.clear()
+
+    def _len(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> None:
+        self.clear()
+
+
+class SQLiteResultCache(ResultCache):
+    """
+    Result cache stored in an SQLite database, shared by the worker processes
+    of one host and kept across restarts.
+    """
+
+    def __init__(
+        self, path: str, max_entries: int = 1024, ttl: float | None = None
+    ):
+        """
+        :param path: Database file, created if missing.
+        :param max_entries: Maximum number of cached results.
+        :param ttl: Seconds after which a result expires (never if None).
+        """
+
+        super().__init__(max_entries, ttl)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None, timeout=5.0
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, "
+            "segments TEXT NOT NULL, "
+            "stored_at REAL NOT NULL, "
+            "used_at REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS ix_results_used_at ON results (used_at)"
+        )
+
+    def _get(self, key: str) -> list[SingleSegment] | None:
+        row = self._connection.execute(
+            "SELECT segments, stored_at FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        segments, stored_at = row
+        now = time.time()
+        if self._ttl is not None and now - stored_at > self._ttl:
+            self._connection.execute(
+                "DELETE FROM results WHERE key = ?", (key,)
+            )
+            self._stats.expirations += 1
+            return None
+
+        self._connection.execute(
+            "UPDATE results SET used_at = ? WHERE key = ?", (now, key)
+        )
+        return json.loads(segments)
+
+    def _set(self, key: str, segments: list[SingleSegment]) -> None:
+        now = time.time()
+        self._connection.execute(
+            "INSERT OR REPLACE INTO results (key, segments, stored_at, used_at) "
+            "VALUES (?, ?, ?, ?)",
+            (key, json.dumps(segments), now, now),
+        )
+
+    def _evict(self) -> int:
+        cursor = self._connection.execute(
+            "DELETE FROM results WHERE key IN ("
+            "SELECT key FROM results ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+            (self._max_entries,),
+        )
+        return max(cursor.rowcount, 0)
+
+    def _clear(self) -> None:
+        self._connection.execute("DELETE FROM results")
+
+    def _len(self) -> int:
+        (count,) = self._connection.execute(
+            "SELECT COUNT(*) FROM results"
+        ).fetchone()
+        return count
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def create_result_cache(
+    backend: str,
+    max_entries: int = 1024,
+    ttl: float | None = None,
+    path: str = "files/result_cache.sqlite3",
+) -> ResultCache | None:
+    """
+    Builds the result cache configured by ``backend``.
+
+    :param backend: ``memory``, ``sqlite`` or ``none``.
+    :param max_entries: Maximum number of cached results.
+    :param ttl: Seconds after which a result expires (never if None).
+    :param path: Database file of the ``sqlite`` backend.
+
+    :return: The cache, or None when caching is disabled.
+    """
+
+    if backend == "none":
+        return None
+    if backend == "memory":
+        cache: ResultCache = MemoryResultCache(max_entries, ttl)
+    elif backend == "sqlite":
+        cache = SQLiteResultCache(path, max_entries, ttl)
+    else:
+        raise ValueError(f"Unknown result cache backend: {backend}")
+
+    log.info("Result cache: %s backend, up to %d entries", backend, max_entries)
+    return cache
@@ -1,21 +1,63 @@
-from typing import Union
+import os
+from typing import AsyncGenerator, Union
+from uuid import UUID
 
-from fastapi import APIRouter, File, Form, UploadFile
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Query,
+    Request,
+    WebSocket,
+    status,
+)
+from fastapi.responses import FileResponse, StreamingResponse
+from whisperx.types import SingleSegment
 
-from src.auth.security.dependencies import CurrentUserDep
-from src.transcription.dependencies import SpeechTranscriptionServiceDep
+from src.auth.security.dependencies import CurrentAdminDep, CurrentUserDep
+from src.auth.security.token import verify_token
+from src.config import settings
+from src.transcription import log
+from src.transcription.dependencies import (
+    ProfilerDep,
+    SpeechTranscriptionServiceDep,
+    UploadStorageDep,
+)
 from src.transcription.enums import Language
 from src.transcription.enums import Model as Model
-from src.transcription.enums import ResultFormat
+from src.transcription.exceptions import (
+    AudioDecodeError,
+    InferenceQueueFullError,
+)
+from src.transcription.profiling import ProfileArtifact
+from src.transcription.realtime import serve_live_transcription
 from src.transcription.schemas import (
+    BatchTranscriptionItem,
+    BatchTranscriptionResult,
     LanguageList,
     ModelList,
+    ProfileList,
     TranscriptionSrtResult,
     TranscriptionTextResult,
+    TunedTranscriptionForm,
+    TunedTranscriptionOptionsForm,
+)
+from src.transcription.services import SpeechTranscriptionService
+from src.transcription.uploads import (
+    UploadedForm,
+    multipart_request_body,
+    receive_form,
+    require_file,
+    require_files,
+    validate_form,
 )
+from src.users.models import Role
 
 router = APIRouter(prefix="/transcription", tags=["Transcription"])
 
+RETRY_AFTER_SECONDS = 5
+
+PROFILE_HEADER = "X-Profile"
+
 
 @router.get(
     "/models",
@@ -65,29 +107,378 @@ async def get_languages() -> LanguageList:
         200: {
             "description": "Transcription result",
         },
+        413: {
+            "description": "Audio file is too large",
+        },
+        503: {
+            "description": "Too many transcriptions in progress, retry later",
+        },
+        507: {
+            "description": "Not enough temporary storage for the upload",
+        },
     },
+    openapi_extra=multipart_request_body(
+        TunedTranscriptionForm.openapi_fields()
+    ),
 )
 async def transcribe(
+    request: Request,
     transcription_service: SpeechTranscriptionServiceDep,
+    storage: UploadStorageDep,
     user: CurrentUserDep,
-    file: UploadFile = File(...),
-    language: Language | None = Form(None),
-    model: Model = Form(Model.SMALL),
-    result_format: ResultFormat = Form(ResultFormat.TEXT),
 ) -> Union[TranscriptionSrtResult, TranscriptionTextResult]:
     """
     Transcribe speech from uploaded audio file.
 
-    :param file: Audio file in supported format (e.g., .mp3, .wav).
-    :param language: Optional language hint for transcription.
-    :param model: Transcription model to use.
-    :param result_format: Desired format of the result.
+    The multipart body is streamed straight to disk and carries:
+    ``file`` (audio in a supported format, e.g. .mp3, .wav), an optional
+    ``language`` hint, the ``model`` to use and the desired ``result_format``.
+    ``batch_size``, ``chunk_size`` and ``beam_size`` optionally override the
+    tuned values of the model, within the limits set by the server.
+
+    Admins may send an ``X-Profile: true`` header to profile the
+    transcription; the profile is then listed at ``/transcription/profiles``.
+
+    :param request: Incoming request with the multipart body.
     :param transcription_service: Injected transcription service.
+    :param storage: Temporary storage for the upload (injected).
     :param user: Authenticated user (injected).
 
     :return: Transcription result as plain text or SRT.
     """
 
-    return transcription_service.transcribe(
-        file, model, language, result_format
+    form = await receive_form(
+        request,
+        storage=storage,
+        max_file_size=settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024,
+    )
+    try:
+        file = require_file(form)
+        options = validate_form(TunedTranscriptionForm, form)
+        return await transcription_service.transcribe(
+            file.path,
+            options.model,
+            options.language,
+            options.result_format,
+            sha256=file.sha256,
+            options=options.inference_options(),
+            profile=user.role == Role.ADMIN
+            and request.headers.get(PROFILE_HEADER, "").lower() == "true",
+        )
+    except InferenceQueueFullError as err:
+        raise _busy_error() from err
+    finally:
+        form.cleanup()
+
+
+@router.post(
+    "/transcribe/batch",
+    summary="Transcribe speech from many audio files",
+    description="Uploads several audio files in one request and returns a result or an error for each of them, in upload order.",
+    responses={
+        200: {
+            "description": "Per-file transcription results",
+        },
+        413: {
+            "description": "An audio file is too large",
+        },
+        503: {
+            "description": "Too many transcriptions in progress, retry later",
+        },
+        507: {
+            "description": "Not enough temporary storage for the upload",
+        },
+    },
+    openapi_extra=multipart_request_body(
+        TunedTranscriptionForm.openapi_fields(),
+        file_field="files",
+        multiple=True,
+    ),
+)
+async def transcribe_batch(
+    request: Request,
+    transcription_service: SpeechTranscriptionServiceDep,
+    storage: UploadStorageDep,
+    user: CurrentUserDep,
+) -> BatchTranscriptionResult:
+    """
+    Transcribe speech from many uploaded audio files.
+
+    Takes the same multipart body as ``/transcribe`` with the audio sent as
+    repeated ``files`` parts. The files are decoded in parallel and their
+    speech chunks are transcribed in shared batches; a file that fails does
+    not fail the others.
+
+    :param request: Incoming request with the multipart body.
+    :param transcription_service: Injected transcription service.
+    :param storage: Temporary storage for the uploads (injected).
+    :param user: Authenticated user (injected).
+
+    :return: Result or error of every file.
+    """
+
+    form = await receive_form(
+        request,
+        storage=storage,
+        max_file_size=settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024,
+        max_files=settings.BATCH_MAX_FILES,
+    )
+    try:
+        files = require_files(form)
+        options = validate_form(TunedTranscriptionForm, form)
+        results = await transcription_service.transcribe_batch(
+            [file.path for file in files],
+            options.model,
+            options.language,
+            sha256s=[file.sha256 for file in files],
+            options=options.inference_options(),
+        )
+    except InferenceQueueFullError as err:
+        raise _busy_error() from err
+    finally:
+        form.cleanup()
+
+    items = []
+    for file, result in zip(files, results, strict=True):
+        if isinstance(result, AudioDecodeError):
+            item = BatchTranscriptionItem(
+                filename=file.filename, error="Failed to decode audio"
+            )
+        elif isinstance(result, Exception):
+            item = BatchTranscriptionItem(
+                filename=file.filename, error="Transcription failed"
+            )
+        else:
+            item = BatchTranscriptionItem(
+                filename=file.filename,
+                result=transcription_service.format_result(
+                    result, options.result_format
+                ),
+            )
+        items.append(item)
+    return BatchTranscriptionResult(results=items)
+
+
+@router.post(
+    "/transcribe/stream",
+    summary="Stream transcribed speech from audio",
+    description="Uploads an audio file and streams the transcribed segments as newline-delimited JSON, sending each segment as soon as it is decoded.",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "One Segment object per line. If transcription "
+            'fails midway, the last line is {"error": "..."}.',
+            "content": {"application/x-ndjson": {}},
+        },
+        413: {
+            "description": "Audio file is too large",
+        },
+        503: {
+            "description": "Too many transcriptions in progress, retry later",
+        },
+        507: {
+            "description": "Not enough temporary storage for the upload",
+        },
+    },
+    openapi_extra=multipart_request_body(
+        TunedTranscriptionOptionsForm.openapi_fields()
+    ),
+)
+async def transcribe_stream(
+    request: Request,
+    transcription_service: SpeechTranscriptionServiceDep,
+    storage: UploadStorageDep,
+    user: CurrentUserDep,
+) -> StreamingResponse:
+    """
+    Transcribe speech from uploaded audio file, streaming the segments.
+
+    Takes the same multipart body as ``/transcribe`` without
+    ``result_format``. The upload is removed once the stream ends.
+
+    :param request: Incoming request with the multipart body.
+    :param transcription_service: Injected transcription service.
+    :param storage: Temporary storage for the upload (injected).
+    :param user: Authenticated user (injected).
+
+    :return: NDJSON stream of transcribed segments.
+    """
+
+    form = await receive_form(
+        request,
+        storage=storage,
+        max_file_size=settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024,
+    )
+    try:
+        file = require_file(form)
+        options = validate_form(TunedTranscriptionOptionsForm, form)
+        segments = await transcription_service.stream_audio(
+            file.path,
+            options.model,
+            options.language,
+            sha256=file.sha256,
+            options=options.inference_options(),
+        )
+    except InferenceQueueFullError as err:
+        form.cleanup()
+        raise _busy_error() from err
+    except BaseException:
+        form.cleanup()
+        raise
+
+    return StreamingResponse(
+        _ndjson_segments(segments, form), media_type="application/x-ndjson"
+    )
+
+
+@router.websocket("/realtime")
+async def transcribe_realtime(
+    websocket: WebSocket,
+    transcription_service: SpeechTranscriptionServiceDep,
+    token: str | None = Query(None),
+    model: Model = Query(Model.SMALL),
+    language: Language | None = Query(None),
+) -> None:
+    """
+    Transcribe live audio sent over a WebSocket.
+
+    The access token is passed in the ``token`` query parameter (browsers
+    cannot set headers on WebSocket requests) or as a Bearer Authorization
+    header. The client streams binary frames of 16 kHz mono 16-bit
+    little-endian PCM and sends ``{"type": "end"}`` when done; the server
+    answers with ``partial`` and ``final`` segment messages and a closing
+    ``done`` message.
+
+    :param websocket: WebSocket connection.
+    :param transcription_service: Injected transcription service.
+    :param token: JWT access token.
+    :param model: Transcription model to use.
+    :param language: Optional language of the audio.
+    """
+
+    authorization = websocket.headers.get("authorization", "")
+    if token is None and authorization.lower().startswith("bearer "):
+        token = authorization[7:]
+    try:
+        verify_token(token or "")
+    except HTTPException as err:
+        await websocket.close(
+            code=status.WS_1008_POLICY_VIOLATION, reason=err.detail
+        )
+        return
+
+    await websocket.accept()
+    await serve_live_transcription(
+        websocket,
+        await transcription_service.start_live(model, language),
+        transcription_service.step_live,
+        step_interval=settings.REALTIME_STEP_MS / 1000,
+        max_buffered=settings.REALTIME_MAX_BUFFERED_SECONDS,
+    )
+
+
+@router.get(
+    "/profiles",
+    summary="List transcription profiles",
+    description="Returns the kept CPU and memory profiles of transcriptions, newest first.",
+    responses={
+        200: {
+            "description": "Kept profiles",
+        },
+    },
+)
+async def get_profiles(
+    profiler: ProfilerDep, admin: CurrentAdminDep
+) -> ProfileList:
+    """
+    List the profiles of transcriptions that were profiled on request or by
+    sampling.
+
+    :param profiler: Injected transcription profiler.
+    :param admin: Authenticated admin (injected).
+
+    :return: Metadata of every kept profile.
+    """
+
+    return ProfileList(profiles=profiler.profiles())
+
+
+@router.get(
+    "/profiles/{profile_id}/{artifact}",
+    summary="Download a transcription profile",
+    description="Downloads the CPU profile of a transcription as folded stacks for flame graph tools, or its memory report as text.",
+    response_class=FileResponse,
+    responses={
+        200: {
+            "description": "Profile artifact",
+            "content": {"text/plain": {}},
+        },
+        404: {
+            "description": "Profile not found",
+        },
+    },
+)
+async def get_profile(
+    profile_id: UUID,
+    artifact: ProfileArtifact,
+    profiler: ProfilerDep,
+    admin: CurrentAdminDep,
+) -> FileResponse:
+    """
+    Download one artifact of a transcription profile.
+
+    :param profile_id: ID of the profile.
+    :param artifact: ``cpu`` for folded stacks, ``memory`` for the report
+        of the lines that allocated the most.
+    :param profiler: Injected transcription profiler.
+    :param admin: Authenticated admin (injected).
+
+    :return: The artifact as a text file.
+    """
+
+    path = profiler.path(profile_id.hex, artifact)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found",
+            headers={"X-Error-Code": "PROFILE_NOT_FOUND"},
+        )
+    return FileResponse(
+        path,
+        media_type="text/plain",
+        filename=os.path.basename(path),
+    )
+
+
+async def _ndjson_segments(
+    segments: AsyncGenerator[SingleSegment, None], form: UploadedForm
+) -> AsyncGenerator[str, None]:
+    """
+    Serializes streamed segments as NDJSON lines. Errors after the response
+    has started are reported in a final line instead of a status code.
+    """
+
+    try:
+        number = 0
+        async for segment in segments:
+            number += 1
+            yield SpeechTranscriptionService.to_segment(
+                number, segment
+            ).model_dump_json() + "\n"
+    except Exception as e:
+        log.error("Streaming transcription failed: %s", e)
+        yield '{"error": "Transcription failed"}\n'
+    finally:
+        await segments.aclose()
+        form.cleanup()
+
+
+def _busy_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Transcription service is busy, try again later",
+        headers={
+            "Retry-After": str(RETRY_AFTER_SECONDS),
+            "X-Error-Code": "TRANSCRIPTION_BUSY",
+        },
     )
@@ -1,5 +1,11 @@
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 
+from src.config import settings
+from src.transcription.enums import Language, Model, ResultFormat
+from src.transcription.tuning import InferenceOptions
+
 
 class ModelList(BaseModel):
     models: list[str]
@@ -22,3 +28,136 @@ class TranscriptionSrtResult(BaseModel):
 
 class TranscriptionTextResult(BaseModel):
     text: str
+
+
+class BatchTranscriptionItem(BaseModel):
+    filename: str
+    result: TranscriptionTextResult | TranscriptionSrtResult | None = None
+    error: str | None = None
+
+
+class BatchTranscriptionResult(BaseModel):
+    results: list[BatchTranscriptionItem]
+
+
+class ProfileInfo(BaseModel):
+    id: str
+    created_at: datetime
+    duration_seconds: float
+    samples: int = Field(..., description="Number of stack samples taken")
+    peak_memory_bytes: int = Field(
+        ..., description="Peak Python memory traced while profiling"
+    )
+    model: Model
+    language: Language | None = None
+    result_format: ResultFormat
+
+
+class ProfileList(BaseModel):
+    profiles: list[ProfileInfo]
+
+
+class TranscriptionOptionsForm(BaseModel):
+    language: Language | None = None
+    model: Model = Model.SMALL
+
+    @staticmethod
+    def openapi_fields() -> dict[str, dict]:
+        """JSON schemas of the form fields, for multipart request bodies."""
+
+        return {
+            "language": {"type": "string", "enum": Language.values()},
+            "model": {
+                "type": "string",
+                "enum": Model.values(),
+                "default": Model.SMALL.value,
+            },
+        }
+
+
+class TranscriptionForm(TranscriptionOptionsForm):
+    result_format: ResultFormat = ResultFormat.TEXT
+
+    @staticmethod
+    def openapi_fields() -> dict[str, dict]:
+        """JSON schemas of the form fields, for multipart request bodies."""
+
+        return {
+            **TranscriptionOptionsForm.openapi_fields(),
+            "result_format": {
+                "type": "string",
+                "enum": ResultFormat.values(),
+                "default": ResultFormat.TEXT.value,
+            },
+        }
+
+
+class InferenceOptionsForm(BaseModel):
+    batch_size: int | None = Field(
+        None, ge=1, le=settings.TRANSCRIPTION_MAX_BATCH_SIZE
+    )
+    chunk_size: int | None = Field(
+        None, ge=1, le=settings.TRANSCRIPTION_MAX_CHUNK_SIZE
+    )
+    beam_size: int | None = Field(
+        None, ge=1, le=settings.TRANSCRIPTION_MAX_BEAM_SIZE
+    )
+
+    def inference_options(self) -> InferenceOptions:
+        return InferenceOptions(
+            batch_size=self.batch_size,
+            chunk_size=self.chunk_size,
+            beam_size=self.beam_size,
+        )
+
+    @staticmethod
+    def openapi_fields() -> dict[str, dict]:
+        """JSON schemas of the form fields, for multipart request bodies."""
+
+        return {
+            "batch_size": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": settings.TRANSCRIPTION_MAX_BATCH_SIZE,
+                "description": "Chunks decoded per model call, the "
+                "model's tuned value when omitted",
+            },
+            "chunk_size": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": settings.TRANSCRIPTION_MAX_CHUNK_SIZE,
+                "description": "Maximum segment length in seconds, the "
+                "model's tuned value when omitted",
+            },
+            "beam_size": {
+                "type": "integer",
+                "minimum": 1,
+                "maximum": settings.TRANSCRIPTION_MAX_BEAM_SIZE,
+                "description": "Beam size of the decoding, the model's "
+                "tuned value when omitted",
+            },
+        }
+
+
+class TunedTranscriptionOptionsForm(
+    TranscriptionOptionsForm, InferenceOptionsForm
+):
+    @staticmethod
+    def openapi_fields() -> dict[str, dict]:
+        """JSON schemas of the form fields, for multipart request bodies."""
+
+        return {
+            **TranscriptionOptionsForm.openapi_fields(),
+            **InferenceOptionsForm.openapi_fields(),
+        }
+
+
+class TunedTranscriptionForm(TranscriptionForm, InferenceOptionsForm):
+    @staticmethod
+    def openapi_fields() -> dict[str, dict]:
+        """JSON schemas of the form fields, for multipart request bodies."""
+
+        return {
+            **TranscriptionForm.openapi_fields(),
+            **InferenceOptionsForm.openapi_fields(),
+        }
@@ -0,0 +1,137 @@
+"""
+Inference server process that owns the models of every API worker.
+
+Point ``INFERENCE_SERVER_ADDRESS`` of the API at the same socket path, give
+both the same ``INFERENCE_SERVER_AUTHKEY`` and run the API with as many
+workers as needed; none of them loads a model.
+
+Usage:
+    python -m src.transcription.server
+    python -m src.transcription.server --address /tmp/inference.sock --metrics-port 9100
+"""
+
+import argparse
+import signal
+import sys
+
+from prometheus_client import start_http_server
+
+from src.config import settings
+from src.transcription.batching import BatchScheduler
+from src.transcription.remote import InferenceServer
+from src.transcription.speech_transcription import SpeechTranscription
+from src.transcription.tuning import (
+    InferenceOptions,
+    ModelTuning,
+    load_inference_profile,
+)
+
+DEFAULT_ADDRESS = "files/inference.sock"
+
+
+def batch_scheduler_enabled(shared: bool = False) -> bool:
+    """
+    Whether chunks of concurrent transcriptions are decoded in shared
+    batches. Unless set, only when several transcriptions can decode at the
+    same time: with one at a time, a batch never gets chunks of another
+    request and only waits for them.
+
+    :param shared: Whether the transcriber serves several API workers.
+    """
+
+    if settings.BATCH_SCHEDULER_ENABLED is not None:
+        return settings.BATCH_SCHEDULER_ENABLED
+    return shared or settings.INFERENCE_WORKERS > 1
+
+
+def create_transcriber(
+    preload_in_background: bool = False,
+    shared: bool = False,
+) -> SpeechTranscription:
+    """
+    Builds the transcriber configured by the settings.
+
+    :param preload_in_background: Whether ``INIT_MODELS`` are loaded on a
+        background thread instead of before returning.
+    :param shared: Whether the transcriber serves several API workers, whose
+        requests then decode at the same time whatever ``INFERENCE_WORKERS``.
+    """
+
+    batch_scheduler = None
+    if batch_scheduler_enabled(shared):
+        batch_scheduler = BatchScheduler(
+            max_batch_size=settings.BATCH_SCHEDULER_MAX_BATCH_SIZE,
+            max_wait=settings.BATCH_SCHEDULER_MAX_WAIT_MS / 1000,
+        )
+
+    default_tuning = ModelTuning(
+        cpu_threads=settings.MODEL_CPU_THREADS,
+        replicas=settings.MODEL_REPLICAS,
+        options=InferenceOptions(
+            batch_size=settings.TRANSCRIPTION_BATCH_SIZE,
+            chunk_size=settings.TRANSCRIPTION_CHUNK_SIZE,
+            beam_size=settings.TRANSCRIPTION_BEAM_SIZE,
+        ),
+    )
+    model_tuning = (
+        load_inference_profile(settings.INFERENCE_PROFILE_PATH, default_tuning)
+        if settings.INFERENCE_PROFILE_PATH
+        else None
+    )
+
+    return SpeechTranscription(
+        device=settings.DEVICE,
+        compute_type=settings.COMPUTE_TYPE,
+        download_root=settings.DOWNLOAD_ROOT,
+        init_models=settings.INIT_MODELS,
+        batch_scheduler=batch_scheduler,
+        max_models=settings.MODEL_CACHE_MAX_MODELS,
+        memory_budget_mb=settings.MODEL_CACHE_MEMORY_BUDGET_MB,
+        cpu_threads=default_tuning.cpu_threads,
+        replicas=default_tuning.replicas,
+        long_audio_seconds=settings.LONG_AUDIO_MIN_SECONDS,
+        default_options=default_tuning.options,
+        model_tuning=model_tuning,
+        preload_in_background=preload_in_background,
+        warm_up=settings.MODEL_WARM_UP,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--address",
+        default=settings.INFERENCE_SERVER_ADDRESS or DEFAULT_ADDRESS,
+        help="Unix socket to listen on",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        help="Port to expose the Prometheus metrics of the models on",
+    )
+    args = parser.parse_args()
+    if not settings.INFERENCE_SERVER_AUTHKEY:
+        parser.error("INFERENCE_SERVER_AUTHKEY must be set")
+
+    # Stop accepting clients on SIGTERM the same way as on Ctrl+C.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    if args.metrics_port is not None:
+        start_http_server(args.metrics_port)
+
+    transcriber = create_transcriber(preload_in_background=True, shared=True)
+    server = InferenceServer(
+        transcriber,
+        args.address,
+        authkey=settings.INFERENCE_SERVER_AUTHKEY.encode(),
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        transcriber.clean()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,384 @@
-from typing import Union
+import hashlib
+from contextlib import nullcontext
+from typing import AsyncGenerator, Union
 
-from fastapi import UploadFile
+from anyio import to_thread
 from whisperx.types import SingleSegment
 
-from src.transcription.enums import Language, Model, ResultFormat
+from src.transcription.audio import AudioSource
+from src.transcription.enums import Language, Model, ModelState, ResultFormat
+from src.transcription.executor import InferenceExecutor
+from src.transcription.metrics import timed
+from src.transcription.profiling import TranscriptionProfiler
+from src.transcription.realtime import LiveSegment, LiveTranscription
+from src.transcription.remote import RemoteTranscriber
+from src.transcription.result_cache import (
+    ResultCache,
+    ResultCacheStats,
+    file_sha256,
+    result_cache_key,
+)
 from src.transcription.schemas import (
     Segment,
     TranscriptionSrtResult,
     TranscriptionTextResult,
 )
 from src.transcription.speech_transcription import SpeechTranscription
-from src.transcription.utils import temporary_audio_file
+from src.transcription.tuning import InferenceOptions
 
 
 class SpeechTranscriptionService:
-    def __init__(self, transcriber: SpeechTranscription):
+    def __init__(
+        self,
+        transcriber: SpeechTranscription | RemoteTranscriber,
+        executor: InferenceExecutor,
+        result_cache: ResultCache | None = None,
+        profiler: TranscriptionProfiler | None = None,
+    ):
         self._transcriber = transcriber
+        self._executor = executor
+        self._result_cache = result_cache
+        self._profiler = profiler
+
+    def model_states(self) -> dict[Model, ModelState]:
+        """Returns the loading progress of the models preloaded at startup."""
+
+        return self._transcriber.model_states()
 
-    def transcribe(
+    def result_cache_stats(self) -> ResultCacheStats | None:
+        """Returns the result cache counters, None if caching is disabled."""
+
+        if self._result_cache is None:
+            return None
+        return self._result_cache.stats()
+
+    async def transcribe(
         self,
-        file: UploadFile,
+        path: str,
         model: Model = Model.SMALL,
         language: Language | None = None,
         format_result: ResultFormat = ResultFormat.TEXT,
+        sha256: str | None = None,
+        options: InferenceOptions | None = None,
+        profile: bool = False,
     ) -> Union[TranscriptionTextResult, TranscriptionSrtResult]:
         """
         Transcribes speech from an uploaded audio file and returns the result
         in the specified format.
 
-        :param file: Uploaded audio file to be processed.
+        The transcription is profiled when asked to or sampled by the
+        profiler, see ``TranscriptionProfiler``.
+
+        :param path: Path to the uploaded audio file.
         :param model: Transcription model to use (e.g., Model.SMALL, Model.MEDIUM).
         :param language: Optional language enum value (e.g., Language.EN, Language.RU).
         :param format_result: Output format for the transcription result (e.g., ResultFormat.TEXT, ResultFormat.SRT).
+        :param sha256: SHA-256 of the file if already known, used as the
+            result cache key.
+        :param options: Batch, chunk and beam size overriding the defaults
+            of the model.
+        :param profile: Whether to profile the transcription regardless of
+            the sample rate. Ignored when profiling is disabled.
 
         :return: A transcription result in the selected format (text or subtitle).
+        :raises InferenceQueueFullError: If the inference pool is saturated.
+        """
+        profiling = (
+            self._profiler.profile(
+                force=profile,
+                model=model.value,
+                language=language.value if language else None,
+                result_format=format_result.value,
+            )
+            if self._profiler is not None
+            else nullcontext()
+        )
+        async with profiling:
+            segments = await self.transcribe_file(
+                path, model, language, sha256, options
+            )
+            return self.format_result(segments, format_result)
+
+    async def transcribe_file(
+        self,
+        path: str,
+        model: Model = Model.SMALL,
+        language: Language | None = None,
+        sha256: str | None = None,
+        options: InferenceOptions | None = None,
+    ) -> list[SingleSegment]:
+        """
+        Transcribes an audio file that is already stored on disk.
+
+        :param path: Path to the audio file.
+        :param model: Transcription model to use.
+        :param language: Optional language hint for transcription.
+        :param sha256: SHA-256 of the file, computed when caching is enabled
+            and it is not given.
+        :param options: Options overriding the defaults of the model.
+
+        :return: List of transcribed segments.
+        :raises InferenceQueueFullError: If the inference pool is saturated.
+        """
+
+        if self._result_cache is not None and sha256 is None:
+            sha256 = await to_thread.run_sync(file_sha256, path)
+        return await self.transcribe_audio(
+            path, model, language, sha256, options
+        )
+
+    async def transcribe_audio(
+        self,
+        audio: AudioSource,
+        model: Model = Model.SMALL,
+        language: Language | None = None,
+        sha256: str | None = None,
+        options: InferenceOptions | None = None,
+    ) -> list[SingleSegment]:
+        """
+        Transcribes audio held in memory or on disk. Decoding happens on the
+        inference pool as well, so the event loop never waits for it.
+
+        When the result cache is enabled, the transcript of identical audio
+        transcribed with the same model, language and inference parameters
+        is returned without running the model.
+
+        :param audio: Path, bytes or binary file-like object with the audio.
+        :param model: Transcription model to use.
+        :param language: Optional language hint for transcription.
+        :param sha256: SHA-256 of the audio content. Computed for bytes;
+            without it other sources bypass the cache.
+        :param options: Options overriding the defaults of the model.
+
+        :return: List of transcribed segments.
+        :raises InferenceQueueFullError: If the inference pool is saturated.
+        """
+
+        key = await self._cache_key(audio, model, language, sha256, options)
+        if key is not None:
+            segments = await to_thread.run_sync(self._result_cache.get, key)
+            if segments is not None:
+                return segments
+
+        segments = await self._executor.run(
+            self._transcriber.transcribe,
+            audio_file=audio,
+            model=model,
+            language=language,
+            **_overrides(options),
+        )
+
+        if key is not None:
+            await to_thread.run_sync(self._result_cache.set, key, segments)
+        return segments
+
+    async def stream_audio(
+        self,
+        audio: AudioSource,
+        model: Model = Model.SMALL,
+        language: Language | None = None,
+        sha256: str | None = None,
+        options: InferenceOptions | None = None,
+    ) -> AsyncGenerator[SingleSegment, None]:
+        """
+        Transcribes audio and returns an iterator that yields each segment as
+        soon as it is decoded, instead of after the whole file.
+
+        The inference slot is claimed before this coroutine returns, so
+        saturation is reported before anything has been streamed. A cached
+        transcript is replayed without running the model, and a transcript
+        streamed to the end is added to the cache.
+
+        :param audio: Path, bytes or binary file-like object with the audio.
+        :param model: Transcription model to use.
+        :param language: Optional language hint for transcription.
+        :param sha256: SHA-256 of the audio content, see ``transcribe_audio``.
+        :param options: Options overriding the defaults of the model.
+
+        :return: Async iterator over the transcribed segments, in order.
+        :raises InferenceQueueFullError: If the inference pool is saturated.
+        """
+
+        key = await self._cache_key(audio, model, language, sha256, options)
+        if key is not None:
+            segments = await to_thread.run_sync(self._result_cache.get, key)
+            if segments is not None:
+                return _replay(segments)
+
+        stream = self._executor.stream(
+            self._transcriber.transcribe_iter,
+            audio_file=audio,
+            model=model,
+            language=language,
+            **_overrides(options),
+        )
+        return self._collect(stream, key)
+
+    async def _collect(
+        self, stream: AsyncGenerator[SingleSegment, None], key: str | None
+    ) -> AsyncGenerator[SingleSegment, None]:
+        """Passes segments through and caches the complete transcript."""
+
+        segments = []
+        async for segment in stream:
+            segments.append(segment)
+            yield segment
+
+        if key is not None:
+            await to_thread.run_sync(self._result_cache.set, key, segments)
+
+    async def _cache_key(
+        self,
+        audio: AudioSource,
+        model: Model,
+        language: Language | None,
+        sha256: str | None,
+        options: InferenceOptions | None = None,
+    ) -> str | None:
+        """
+        Returns the result cache key of the audio, or None when caching is
+        disabled or the content hash is unknown.
+        """
+
+        if self._result_cache is None:
+            return None
+
+        if sha256 is None and isinstance(audio, (bytes, bytearray, memoryview)):
+            sha256 = await to_thread.run_sync(_sha256, audio)
+        if sha256 is None:
+            return None
+
+        # A remote transcriber asks its server, so not on the event loop.
+        params = await to_thread.run_sync(
+            self._transcriber.inference_params, model, options
+        )
+        return result_cache_key(sha256, model, language, **params)
+
+    async def transcribe_batch(
+        self,
+        paths: list[str],
+        model: Model = Model.SMALL,
+        language: Language | None = None,
+        sha256s: list[str | None] | None = None,
+        options: InferenceOptions | None = None,
+    ) -> list[list[SingleSegment] | Exception]:
+        """
+        Transcribes several audio files as one inference job: cached results
+        are reused and the remaining files share model batches.
+
+        :param paths: Paths to the audio files.
+        :param model: Transcription model to use.
+        :param language: Optional language hint for every file.
+        :param sha256s: SHA-256 of every file, for the result cache.
+        :param options: Options overriding the defaults of the model.
+
+        :return: Segments of every file, in order, or the exception that made
+            its transcription fail.
+        :raises InferenceQueueFullError: If the inference pool is saturated.
         """
-        segments = self._transcribe(file, model, language)
 
-        if format_result == ResultFormat.TEXT:
-            text = self._to_text(segments)
-            return TranscriptionTextResult(text=text)
+        sha256s = sha256s or [None] * len(paths)
+        keys = [
+            await self._cache_key(path, model, language, sha256, options)
+            for path, sha256 in zip(paths, sha256s, strict=True)
+        ]
+        results: list[list[SingleSegment] | Exception | None] = [None] * len(
+            paths
+        )
+        if self._result_cache is not None:
+            results = await to_thread.run_sync(
+                lambda: [
+                    self._result_cache.get(key) if key else None for key in keys
+                ]
+            )
 
-        srt = self._to_srt(segments)
-        return TranscriptionSrtResult(srt=srt)
+        misses = [
+            index for index, result in enumerate(results) if result is None
+        ]
+        if not misses:
+            return results
+
+        transcribed = await self._executor.run(
+            self._transcriber.transcribe_many,
+            [paths[index] for index in misses],
+            model=model,
+            language=language,
+            **_overrides(options),
+        )
+        for index, result in zip(misses, transcribed, strict=True):
+            results[index] = result
+            if keys[index] is not None and not isinstance(result, Exception):
+                await to_thread.run_sync(
+                    self._result_cache.set, keys[index], result
+                )
+        return results
+
+    async def start_live(
+        self, model: Model = Model.SMALL, language: Language | None = None
+    ) -> LiveTranscription:
+        """
+        Creates the transcription state of a live audio stream.
+
+        :param model: Transcription model to use.
+        :param language: Optional language of the stream.
+        """
+
+        options = await to_thread.run_sync(
+            self._transcriber.resolve_options, model
+        )
+        if isinstance(self._transcriber, RemoteTranscriber):
+            return self._transcriber.start_live(
+                model,
+                language,
+                chunk_size=options.chunk_size,
+                batch_size=options.batch_size,
+                beam_size=options.beam_size,
+            )
+        return LiveTranscription(
+            self._transcriber,
+            model,
+            language,
+            chunk_size=options.chunk_size,
+            batch_size=options.batch_size,
+            beam_size=options.beam_size,
+        )
+
+    async def step_live(
+        self, session: LiveTranscription, final: bool = False
+    ) -> list[LiveSegment]:
+        """
+        Transcribes the audio a live stream received since its last step.
+
+        :param session: State of the live stream.
+        :param final: Whether the stream has ended.
+
+        :return: Segments produced by the step.
+        :raises InferenceQueueFullError: If the inference pool is saturated.
+        """
+
+        return await self._executor.run(session.step, final)
+
+    def format_result(
+        self,
+        segments: list[SingleSegment],
+        format_result: ResultFormat = ResultFormat.TEXT,
+    ) -> Union[TranscriptionTextResult, TranscriptionSrtResult]:
+        """
+        Converts transcription segments into the requested result format.
+
+        :param segments: List of transcription segments.
+        :param format_result: Output format (e.g., ResultFormat.TEXT, ResultFormat.SRT).
+
+        :return: A transcription result in the selected format.
+        """
+
+        with timed("format"):
+            if format_result == ResultFormat.TEXT:
+                text = self._to_text(segments)
+                return TranscriptionTextResult(text=text)
+
+            srt = self._to_srt(segments)
+            return TranscriptionSrtResult(srt=srt)
 
     @staticmethod
     def _to_text(segments: list[SingleSegment]) -> str:
@@ -65,42 +401,47 @@ class SpeechTranscriptionService:
         :return: List of Segment objects suitable for SRT serialization.
         """
         return [
-            Segment(
-                number=index,
-                text=segment["text"].strip(),
-                start=segment["start"],
-                end=segment["end"],
-            )
+            SpeechTranscriptionService.to_segment(index, segment)
             for index, segment in enumerate(segments, start=1)
         ]
 
-    def _transcribe(
-        self,
-        file: UploadFile,
-        model: Model = Model.SMALL,
-        language: Language | None = None,
-    ) -> list[SingleSegment]:
+    @staticmethod
+    def to_segment(number: int, segment: SingleSegment) -> Segment:
         """
-        Transcribes from the uploaded audio file using the specified model and language.
-
-        The file is temporarily saved to disk and passed to the underlying transcriber.
+        Converts one transcription segment into a numbered Segment.
 
-        :param file: Uploaded audio file to be processed.
-        :param model: Transcription model to use (e.g., Model.SMALL, Model.MEDIUM).
-        :param language: Optional language enum value (e.g., Language.EN, Language.RU).
-
-        :return: List of transcribed segments containing transcribed text and timestamps.
+        :param number: 1-based position of the segment in the transcript.
+        :param segment: Transcription segment.
         """
-
-        with temporary_audio_file(file) as path:
-            return self._transcriber.transcribe(
-                audio_file=path, model=model, language=language
-            )
+        return Segment(
+            number=number,
+            text=segment["text"].strip(),
+            start=segment["start"],
+            end=segment["end"],
+        )
 
     def clean(self):
         """
-        Clean up resources held by the transcriber (e.g., cached models).
-        Should be called on application shutdown.
+        Clean up resources held by the transcriber (e.g., cached models) and
+        stop the inference executor. Should be called on application shutdown.
         """
 
+        self._executor.shutdown()
         self._transcriber.clean()
+        if self._result_cache is not None:
+            self._result_cache.close()
+
+
+def _overrides(options: InferenceOptions | None) -> dict[str, int]:
+    return options.overrides() if options is not None else {}
+
+
+def _sha256(data: bytes | bytearray | memoryview) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+async def _replay(
+    segments: list[SingleSegment],
+) -> AsyncGenerator[SingleSegment, None]:
+    for segment in segments:
+        yield segment
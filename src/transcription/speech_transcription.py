@@ -1,20 +1,66 @@
 import gc
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
-import torch
-import whisperx
-from whisperx.asr import FasterWhisperPipeline
+import numpy as np
 from whisperx.types import SingleSegment
 
 from src.transcription import log
-from src.transcription.enums import Language, Model
+from src.transcription.audio import (
+    SAMPLE_RATE,
+    AudioSource,
+    decode_audio,
+    synthetic_speech,
+)
+from src.transcription.batching import BatchScheduler
+from src.transcription.enums import Language, Model, ModelState
+from src.transcription.metrics import (
+    MODEL_PRELOAD_SECONDS,
+    MODEL_WARM_UP_SECONDS,
+    observe_transcription,
+    record_stage,
+    timed,
+)
+from src.transcription.model_cache import ModelCache, ModelCacheStats
+from src.transcription.pipeline import (
+    decode,
+    detect_speech,
+    get_tokenizer,
+    iter_segments,
+    split_audio,
+    to_segments,
+)
+from src.transcription.profiling import follow
+from src.transcription.tuning import (
+    DEFAULT_OPTIONS,
+    InferenceOptions,
+    ModelTuning,
+)
+
+if TYPE_CHECKING:
+    from faster_whisper.tokenizer import Tokenizer
+    from whisperx.asr import FasterWhisperPipeline
 
 
 class SpeechTranscription:
     """
     Handles audio transcription using WhisperX models.
 
-    Supports loading and caching multiple models, transcription audio files,
+    Supports loading and caching multiple models (bounded by count and
+    estimated memory, least recently used first), transcription audio files,
     and cleaning up memory (including CUDA cache).
+
+    Every model is loaded with the CPU threads and number of CTranslate2
+    workers (replicas) of its tuning, and the replicas decode in parallel.
+    Long audio has its speech chunks spread across them, so its latency
+    shrinks with the number of replicas instead of being bound to one model
+    call at a time.
     """
 
     def __init__(
@@ -23,6 +69,16 @@ class SpeechTranscription:
         compute_type: str = "float32",
         download_root: str = "models",
         init_models: list[Model] | None = None,
+        batch_scheduler: BatchScheduler | None = None,
+        max_models: int | None = None,
+        memory_budget_mb: int | None = None,
+        cpu_threads: int = 4,
+        replicas: int = 1,
+        long_audio_seconds: float | None = None,
+        default_options: InferenceOptions | None = None,
+        model_tuning: dict[Model, ModelTuning] | None = None,
+        preload_in_background: bool = False,
+        warm_up: bool = False,
     ):
         """
         Initializes the SpeechTranscription with device configuration and optional models to preload.
@@ -31,106 +87,679 @@ class SpeechTranscription:
         :param compute_type: Compute type for inference (e.g., "float32", "int8").
         :param download_root: Directory for downloading and caching models.
         :param init_models: Optional list of models to preload at startup.
+        :param batch_scheduler: Optional scheduler that batches chunks of
+            concurrent transcriptions together. Without it every call decodes
+            its own chunks in batches of ``batch_size``.
+        :param max_models: Maximum number of models kept in memory.
+        :param memory_budget_mb: Maximum estimated memory of the kept models, in MB.
+        :param cpu_threads: CPU threads used by each model replica.
+        :param replicas: Number of model replicas (CTranslate2 workers) that
+            can decode at the same time.
+        :param long_audio_seconds: Audio at least this long has its chunks
+            decoded in parallel on every replica (never if None).
+        :param default_options: Default batch size, chunk size and beam size
+            of transcriptions.
+        :param model_tuning: Tunings of specific models, replacing the
+            defaults above for them.
+        :param preload_in_background: Load ``init_models`` on a background
+            thread instead of blocking until they are loaded. Requests for a
+            model still loading wait for it; ``model_states`` reports progress.
+        :param warm_up: Run a short synthetic inference through every
+            preloaded model once it is loaded, so the first request on it
+            does not pay for lazy initialization.
+
+        Preloaded models are pinned and never evicted.
         """
 
-        self.__cache: dict[str, FasterWhisperPipeline] = {}
+        self.__cache: ModelCache[FasterWhisperPipeline] = ModelCache(
+            loader=self._load_model,
+            size_of=self._estimate_model_size,
+            max_models=max_models,
+            memory_budget=(
+                memory_budget_mb * 1024 * 1024 if memory_budget_mb else None
+            ),
+            on_evict=lambda _: self._free_memory(),
+        )
         self._device = device
         self._compute_type = compute_type
         self._download_root = download_root
+        self._batch_scheduler = batch_scheduler
+        self._default_tuning = ModelTuning(
+            cpu_threads=cpu_threads,
+            replicas=replicas,
+            options=(default_options or InferenceOptions()).merged(
+                DEFAULT_OPTIONS
+            ),
+        )
+        self._model_tuning = model_tuning or {}
+        self._long_audio_seconds = long_audio_seconds
+        max_replicas = max(
+            tuning.replicas
+            for tuning in [self._default_tuning, *self._model_tuning.values()]
+        )
+        self._replica_pool = (
+            ThreadPoolExecutor(
+                max_workers=max_replicas, thread_name_prefix="model-replica"
+            )
+            if max_replicas > 1 and long_audio_seconds is not None
+            else None
+        )
+
+        self._warm_up = warm_up
+        self._model_states = dict.fromkeys(
+            init_models or [], ModelState.PENDING
+        )
+        if preload_in_background:
+            threading.Thread(
+                target=self._preload,
+                args=(list(self._model_states),),
+                name="model-preload",
+                daemon=True,
+            ).start()
+        else:
+            error = self._preload(list(self._model_states))
+            if error is not None:
+                raise error
+
+    @property
+    def loaded_models(self) -> list[str]:
+        """Names of the models currently in memory, least recently used first."""
+
+        return self.__cache.keys()
+
+    def model_memory(self) -> dict[str, int]:
+        """Estimated memory of every model in memory, in bytes."""
+
+        return self.__cache.sizes()
+
+    def tuning(self, model: Model) -> ModelTuning:
+        """Returns the threads, replicas and default options of a model."""
+
+        return self._model_tuning.get(model, self._default_tuning)
+
+    def resolve_options(
+        self, model: Model, options: InferenceOptions | None = None
+    ) -> InferenceOptions:
+        """
+        Completes per-call options with the defaults of the model.
+
+        :param model: Model the options apply to.
+        :param options: Options of the call, unset fields take the default.
+        """
+
+        return (options or InferenceOptions()).merged(
+            self.tuning(model).options
+        )
+
+    def inference_params(
+        self, model: Model, options: InferenceOptions | None = None
+    ) -> dict:
+        """
+        Settings besides model and language that shape the transcript of a
+        call. The batch size is left out: it changes speed, not text.
+
+        :param model: Model of the call.
+        :param options: Options of the call.
+        """
+
+        options = self.resolve_options(model, options)
+        return {
+            "compute_type": self._compute_type,
+            "chunk_size": options.chunk_size,
+            "beam_size": options.beam_size,
+        }
+
+    def model_cache_stats(self) -> ModelCacheStats:
+        """
+        Returns hit, eviction, load and load-wait counters of the model cache.
+        """
+
+        return self.__cache.stats()
+
+    def model_states(self) -> dict[Model, ModelState]:
+        """Progress of loading every model preloaded at startup."""
 
-        self._load_models(init_models)
+        return dict(self._model_states)
 
-    def _load_models(self, models: list[Model] | None) -> None:
+    def _preload(self, models: list[Model]) -> Exception | None:
         """
-        Loads and caches the specified models.
+        Loads, caches and pins the specified models. A model that fails to
+        load does not stop the others.
 
         :param models: List of models to load.
+
+        :return: The first load error, None if every model loaded.
+        """
+
+        error = None
+        for model in models:
+            self._model_states[model] = ModelState.LOADING
+            started = time.perf_counter()
+            try:
+                self.__cache.load(model.value, pin=True)
+            except Exception as e:
+                self._model_states[model] = ModelState.FAILED
+                error = error or e
+                continue
+            seconds = time.perf_counter() - started
+            MODEL_PRELOAD_SECONDS.labels(model.value).set(seconds)
+            log.info("Preloaded model %s in %.1f s", model.value, seconds)
+
+            if self._warm_up:
+                self._model_states[model] = ModelState.WARMING_UP
+                self._warm_up_model(model)
+            self._model_states[model] = ModelState.READY
+        return error
+
+    def _warm_up_model(self, model: Model) -> None:
+        """
+        Runs voice activity detection, tokenizer setup and one batch of the
+        default size through a freshly loaded model, so that kernel selection
+        and memory allocation happen now instead of in the first request.
+        A failed warm-up is logged; the model is still usable.
+
+        :param model: Loaded model to warm up.
         """
 
-        if not models:
+        options = self.resolve_options(model)
+        audio = synthetic_speech(options.chunk_size)
+        started = time.perf_counter()
+        try:
+            with self.__cache.acquire(model.value) as pipeline:
+                detect_speech(pipeline, audio, options.chunk_size)
+                tokenizer = get_tokenizer(
+                    pipeline, audio, Language.ENGLISH.value
+                )
+                decode(
+                    pipeline,
+                    [audio] * options.batch_size,
+                    tokenizer,
+                    options.beam_size,
+                )
+        except Exception as e:
+            log.warning("Failed to warm up model %s: %s", model.value, e)
             return
 
-        for model in models:
-            self._load_model(model.value)
+        seconds = time.perf_counter() - started
+        MODEL_WARM_UP_SECONDS.labels(model.value).set(seconds)
+        log.info("Warmed up model %s in %.2f s", model.value, seconds)
 
-    def _get_model(self, model: Model) -> FasterWhisperPipeline:
+    @contextmanager
+    def _get_model(
+        self, model: Model, timings: dict[str, float] | None = None
+    ) -> Iterator["FasterWhisperPipeline"]:
         """
-        Returns a cached model instance. Loads it if not already cached.
+        Yields a cached model instance, loading it if not already cached.
+        The model is protected from eviction until the context exits.
 
         :param model: Model enum to retrieve.
+        :param timings: Stage timings the acquisition time is added to.
 
         :return: Loaded FasterWhisperPipeline instance.
         """
 
-        model_key = model.value
-        if model_key not in self.__cache:
-            self._load_model(model_key)
-        return self.__cache[model_key]
+        with ExitStack() as stack:
+            with timed("model_acquire", timings):
+                pipeline = stack.enter_context(
+                    self.__cache.acquire(model.value)
+                )
+            yield pipeline
+
+    @contextmanager
+    def acquire_model(self, model: Model) -> Iterator["FasterWhisperPipeline"]:
+        """
+        Yields the cached pipeline of a model for callers that drive the
+        pipeline steps themselves, such as live transcription. The model is
+        protected from eviction until the context exits.
+
+        :param model: Model enum to retrieve.
+        """
+
+        with self._get_model(model) as pipeline:
+            yield pipeline
 
-    def _load_model(self, model_name: str) -> None:
+    def _load_model(self, model_name: str) -> "FasterWhisperPipeline":
         """
-        Loads a WhisperX model and caches it.
+        Loads a WhisperX model.
 
         :param model_name: Name of the model (e.g., "small").
+
+        :return: Loaded FasterWhisperPipeline instance.
         """
 
+        # The WhisperX subclass, which adds the batched decoding the
+        # pipeline relies on, not the plain faster-whisper model.
+        from whisperx.asr import WhisperModel, load_model
+
         log.debug("Loading model %s...", model_name)
+        tuning = self.tuning(Model(model_name))
         try:
-            self.__cache[model_name] = whisperx.load_model(
+            model = WhisperModel(
+                model_name,
+                device=self._device,
+                compute_type=self._compute_type,
+                cpu_threads=tuning.cpu_threads,
+                num_workers=tuning.replicas,
+                download_root=self._download_root,
+            )
+            pipeline = load_model(
                 whisper_arch=model_name,
                 device=self._device,
                 compute_type=self._compute_type,
                 download_root=self._download_root,
+                model=model,
             )
             log.debug("Loaded model %s", model_name)
+            return pipeline
         except Exception as e:
             log.error("Failed to load model %s: %s", model_name, e)
             raise e
 
+    def _estimate_model_size(
+        self, model_name: str, pipeline: "FasterWhisperPipeline"
+    ) -> int:
+        """
+        Estimates the memory used by a loaded model from the size of its
+        weights on disk (stored as float16) and the compute type.
+
+        :param model_name: Name of the model.
+        :param pipeline: Loaded pipeline.
+
+        :return: Estimated size in bytes, or 0 if the weights cannot be found.
+        """
+
+        from faster_whisper.utils import download_model
+
+        try:
+            model_path = download_model(
+                model_name,
+                local_files_only=True,
+                cache_dir=self._download_root,
+            )
+        except Exception as e:
+            log.warning("Cannot estimate size of model %s: %s", model_name, e)
+            return 0
+
+        size = sum(
+            path.stat().st_size
+            for path in Path(model_path).iterdir()
+            if path.is_file()
+        )
+        if self._compute_type.startswith("int8"):
+            return size // 2
+        if self._compute_type == "float32":
+            return size * 2
+        return size
+
     def transcribe(
         self,
-        audio_file: str,
+        audio_file: AudioSource | np.ndarray,
         model: Model,
-        batch_size: int = 4,
-        chunk_size: int = 10,
+        batch_size: int | None = None,
+        chunk_size: int | None = None,
         language: Language | None = None,
+        beam_size: int | None = None,
     ) -> list[SingleSegment]:
         """
-        Transcribes the given audio file using the specified model and language.
+        Transcribes the given audio using the specified model and language.
 
-        :param audio_file: Path to the audio file.
+        :param audio_file: Path to an audio file, its bytes, a binary file-like
+            object, or an already decoded 16 kHz mono waveform.
         :param model: Transcription model to use.
-        :param batch_size: Batch size for inference.
+        :param batch_size: Batch size for inference. Batches shared with
+            other transcriptions by the batch scheduler hold at most its
+            maximum.
         :param chunk_size: Chunk size (in seconds) for audio splitting.
         :param language: Optional language to guide transcription.
+        :param beam_size: Beam size for decoding.
+
+        Batch, chunk and beam size default to the tuning of the model.
 
         :return: List of transcribed segments with text and timestamps.
         """
 
-        log.debug("Loading audio file %s...", audio_file)
-        try:
-            audio = whisperx.load_audio(file=audio_file)
-            log.debug("Loaded audio file %s", audio_file)
-        except RuntimeError as e:
-            log.error("Failed to load audio file %s: %s", audio_file, e)
-            raise e
+        return list(
+            self.transcribe_iter(
+                audio_file, model, batch_size, chunk_size, language, beam_size
+            )
+        )
+
+    def transcribe_iter(
+        self,
+        audio_file: AudioSource | np.ndarray,
+        model: Model,
+        batch_size: int | None = None,
+        chunk_size: int | None = None,
+        language: Language | None = None,
+        beam_size: int | None = None,
+    ) -> Iterator[SingleSegment]:
+        """
+        Transcribes the given audio, yielding each segment as soon as it and
+        every segment before it are decoded. Takes the same arguments as
+        ``transcribe``.
+
+        The model stays acquired until the generator is exhausted or closed;
+        closing it early drops the chunks that were not decoded yet.
+        """
+
+        options = self.resolve_options(
+            model, InferenceOptions(batch_size, chunk_size, beam_size)
+        )
+        timings: dict[str, float] = {}
+        if isinstance(audio_file, np.ndarray):
+            audio, name = audio_file, "<waveform>"
+        else:
+            name = (
+                audio_file
+                if isinstance(audio_file, (str, Path))
+                else "<in-memory audio>"
+            )
+            log.debug("Loading audio file %s...", name)
+            try:
+                with timed("decode", timings):
+                    audio = decode_audio(audio_file)
+                log.debug("Loaded audio file %s", name)
+            except RuntimeError as e:
+                log.error("Failed to load audio file %s: %s", name, e)
+                raise e
+
+        with self._get_model(model, timings) as pipeline:
+            log.debug("Transcribing audio file %s...", name)
+            # Time spent by the consumer between segments is not inference.
+            inference = 0.0
+            started = time.perf_counter()
+            try:
+                for segment in self._segments(
+                    pipeline, audio, name, model, language, options
+                ):
+                    inference += time.perf_counter() - started
+                    yield segment
+                    started = time.perf_counter()
+                inference += time.perf_counter() - started
+            except Exception as e:
+                log.error("Failed to transcribe audio file %s: %s", name, e)
+                raise e
+            finally:
+                record_stage("inference", inference, timings)
+
+        observe_transcription(name, model, len(audio) / SAMPLE_RATE, timings)
+
+    def _segments(
+        self,
+        pipeline: "FasterWhisperPipeline",
+        audio: np.ndarray,
+        name: str,
+        model: Model,
+        language: Language | None,
+        options: InferenceOptions,
+    ) -> Iterator[SingleSegment]:
+        """Runs VAD and decodes the speech chunks of one audio, in order."""
+
+        chunks = detect_speech(pipeline, audio, options.chunk_size)
+        if not chunks:
+            log.debug("No speech found in audio file %s", name)
+            return
+
+        tokenizer = get_tokenizer(
+            pipeline, audio, language.value if language else None
+        )
+        waveforms = split_audio(audio, chunks)
+        if self._is_long(model, audio):
+            log.debug(
+                "Decoding %d chunks of %s on %d replicas",
+                len(chunks),
+                name,
+                self.tuning(model).replicas,
+            )
+            decode_chunks = self._decode_parallel
+        else:
+            decode_chunks = self.decode_chunks
+        texts = decode_chunks(
+            pipeline,
+            tokenizer,
+            waveforms,
+            options.batch_size,
+            options.beam_size,
+        )
+        yield from iter_segments(chunks, texts)
+
+    def transcribe_many(
+        self,
+        audio_files: list[AudioSource],
+        model: Model,
+        batch_size: int | None = None,
+        chunk_size: int | None = None,
+        language: Language | None = None,
+        decode_workers: int | None = None,
+        beam_size: int | None = None,
+    ) -> list[list[SingleSegment] | Exception]:
+        """
+        Transcribes several audio files together.
+
+        The files are decoded in parallel, then the speech chunks of all files
+        that share a language are decoded in common batches, which keeps the
+        model busy even when every file is only a few seconds long.
 
-        pipeline = self._get_model(model)
+        :param audio_files: Paths, bytes or binary file-like objects.
+        :param model: Transcription model to use.
+        :param batch_size: Batch size for inference. Batches shared with
+            other transcriptions by the batch scheduler hold at most its
+            maximum.
+        :param chunk_size: Chunk size (in seconds) for audio splitting.
+        :param language: Optional language of every file.
+        :param decode_workers: Number of files decoded at once, one per CPU
+            by default.
+        :param beam_size: Beam size for decoding.
+
+        :return: Segments of every file, in order, or the exception that
+            made its transcription fail.
+        """
 
-        log.debug("Transcribing audio file %s...", audio_file)
+        results: list[list[SingleSegment] | Exception | None] = [None] * len(
+            audio_files
+        )
+        if not audio_files:
+            return []
+        options = self.resolve_options(
+            model, InferenceOptions(batch_size, chunk_size, beam_size)
+        )
+
+        timings: dict[str, float] = {}
+        workers = decode_workers or min(len(audio_files), os.cpu_count() or 1)
+        with (
+            timed("decode", timings),
+            ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="audio-decode"
+            ) as pool,
+        ):
+            decoding = [
+                pool.submit(follow(decode_audio), file) for file in audio_files
+            ]
+
+        audios: list[np.ndarray | None] = []
+        for index, future in enumerate(decoding):
+            try:
+                audios.append(future.result())
+            except Exception as e:
+                log.error("Failed to load audio file #%d: %s", index, e)
+                results[index] = e
+                audios.append(None)
+
+        with (
+            self._get_model(model, timings) as pipeline,
+            timed("inference", timings),
+        ):
+            groups: dict[str, list[tuple[int, list[dict], Tokenizer]]] = (
+                defaultdict(list)
+            )
+            waveforms: dict[int, list[np.ndarray]] = {}
+            for index, audio in enumerate(audios):
+                if audio is None:
+                    continue
+                try:
+                    chunks = detect_speech(pipeline, audio, options.chunk_size)
+                    if not chunks:
+                        results[index] = []
+                        continue
+                    tokenizer = get_tokenizer(
+                        pipeline, audio, language.value if language else None
+                    )
+                except Exception as e:
+                    log.error(
+                        "Failed to transcribe audio file #%d: %s", index, e
+                    )
+                    results[index] = e
+                    continue
+                groups[tokenizer.language_code].append(
+                    (index, chunks, tokenizer)
+                )
+                waveforms[index] = split_audio(audio, chunks)
+
+            for items in groups.values():
+                self._decode_group(pipeline, items, waveforms, options, results)
+
+        audio_seconds = sum(len(audio) for audio in audios if audio is not None)
+        observe_transcription(
+            f"{len(audio_files)} audio files",
+            model,
+            audio_seconds / SAMPLE_RATE,
+            timings,
+        )
+        return results
+
+    def _decode_group(
+        self,
+        pipeline: "FasterWhisperPipeline",
+        items: list[tuple[int, list[dict], "Tokenizer"]],
+        waveforms: dict[int, list[np.ndarray]],
+        options: InferenceOptions,
+        results: list,
+    ) -> None:
+        """
+        Decodes the chunks of files sharing a language in common batches.
+        If that fails, the files are retried one by one so that a single bad
+        file does not fail the others.
+        """
+
+        tokenizer = items[0][2]
+        chunks = [chunk for index, _, _ in items for chunk in waveforms[index]]
         try:
-            result = pipeline.transcribe(
-                audio=audio,
-                batch_size=batch_size,
-                chunk_size=chunk_size,
-                language=language.value if language else None,
+            texts = list(
+                self.decode_chunks(
+                    pipeline,
+                    tokenizer,
+                    chunks,
+                    options.batch_size,
+                    options.beam_size,
+                )
             )
-            log.debug("Transcribed audio file %s", audio_file)
         except Exception as e:
-            log.error("Failed to transcribe audio file %s: %s", audio_file, e)
-            raise e
+            if len(items) == 1:
+                log.error(
+                    "Failed to transcribe audio file #%d: %s", items[0][0], e
+                )
+                results[items[0][0]] = e
+                return
+            for item in items:
+                self._decode_group(
+                    pipeline, [item], waveforms, options, results
+                )
+            return
+
+        position = 0
+        for index, file_chunks, _ in items:
+            end = position + len(file_chunks)
+            results[index] = to_segments(file_chunks, texts[position:end])
+            position = end
+
+    def decode_chunks(
+        self,
+        pipeline: "FasterWhisperPipeline",
+        tokenizer: "Tokenizer",
+        chunks: list[np.ndarray],
+        batch_size: int,
+        beam_size: int | None = None,
+    ) -> Iterator[str]:
+        """
+        Decodes audio chunks, through the batch scheduler when one is configured.
+
+        :param pipeline: Pipeline to decode with.
+        :param tokenizer: Tokenizer for the language of the audio.
+        :param chunks: Waveforms of the speech chunks.
+        :param batch_size: Maximum number of chunks in a batch. The scheduler
+            fills batches of it with chunks of other transcriptions.
+        :param beam_size: Beam size, the pipeline's own when None.
+
+        :return: Iterator over the decoded text of every chunk, in order.
+        """
+
+        if self._batch_scheduler is None:
+            for start in range(0, len(chunks), batch_size):
+                yield from decode(
+                    pipeline,
+                    chunks[start : start + batch_size],
+                    tokenizer,
+                    beam_size,
+                )
+            return
+
+        futures = self._batch_scheduler.submit(
+            pipeline, tokenizer, chunks, beam_size, batch_size
+        )
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _is_long(self, model: Model, audio: np.ndarray) -> bool:
+        """Whether the audio is decoded in parallel across replicas."""
 
-        return result["segments"]
+        return (
+            self._replica_pool is not None
+            and self.tuning(model).replicas > 1
+            and len(audio) >= self._long_audio_seconds * SAMPLE_RATE
+        )
+
+    def _decode_parallel(
+        self,
+        pipeline: "FasterWhisperPipeline",
+        tokenizer: "Tokenizer",
+        chunks: list[np.ndarray],
+        batch_size: int,
+        beam_size: int | None = None,
+    ) -> Iterator[str]:
+        """
+        Decodes the chunks of one long audio in batches that run on every
+        model replica at once, bypassing the batch scheduler: a long audio
+        fills its own batches, while the scheduler runs one batch at a time.
+
+        :param pipeline: Pipeline to decode with.
+        :param tokenizer: Tokenizer for the language of the audio.
+        :param chunks: Waveforms of the speech chunks.
+        :param batch_size: Number of chunks in a batch.
+        :param beam_size: Beam size, the pipeline's own when None.
+
+        :return: Iterator over the decoded text of every chunk, in order.
+        """
+
+        futures: list[Future] = [
+            self._replica_pool.submit(
+                follow(decode),
+                pipeline,
+                chunks[start : start + batch_size],
+                tokenizer,
+                beam_size,
+            )
+            for start in range(0, len(chunks), batch_size)
+        ]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
 
     def clean(self) -> None:
         """
@@ -138,12 +767,26 @@ class SpeechTranscription:
         """
 
         log.debug("Cleaning up resources...")
+        if self._batch_scheduler is not None:
+            self._batch_scheduler.close()
+        if self._replica_pool is not None:
+            self._replica_pool.shutdown(cancel_futures=True)
         self.__cache.clear()
         log.debug("Cleared model cache")
 
-        gc.collect()
-        if self._device.startswith("cuda") and torch.cuda.is_available():
-            torch.cuda.empty_cache()
-            log.debug("Cleared CUDA cache")
+        self._free_memory()
 
         log.debug("Cleanup complete")
+
+    def _free_memory(self) -> None:
+        """
+        Collects released models. If using CUDA, clears GPU memory too.
+        """
+
+        gc.collect()
+        if self._device.startswith("cuda"):
+            import torch
+
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+                log.debug("Cleared CUDA cache")
@@ -0,0 +1,186 @@
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from src.transcription import log
+from src.transcription.utils import delete_file
+
+_NAME_PATTERN = re.compile(r"^(?P<pid>\d+)-[0-9a-f]{32}(\.[^.]*)?$")
+
+
+class TempStorage:
+    """
+    Scratch directory for uploaded audio.
+
+    Every file gets a name of the form ``<pid>-<uuid><suffix>``, so concurrent
+    requests never share a path and files left behind by a worker process
+    that crashed can be recognised and swept. The directory may live on a
+    RAM-backed filesystem such as ``/dev/shm`` for faster scratch I/O; space
+    there is memory taken from the models, so it is also bounded by the
+    memory the system has available, and checked while uploads are written.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        min_free_mb: int = 0,
+        quota_mb: int | None = None,
+    ):
+        """
+        :param directory: Directory holding the files, created if missing.
+        :param min_free_mb: Free space that must remain on the filesystem,
+            and free memory when it is RAM-backed, after a file has been
+            stored.
+        :param quota_mb: Maximum total size of the files in the directory,
+            or None for no limit.
+        """
+
+        self._directory = Path(directory)
+        self._min_free = min_free_mb * 1024 * 1024
+        self._quota = quota_mb * 1024 * 1024 if quota_mb is not None else None
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._filesystem = _filesystem_type(self._directory)
+        if self.in_memory:
+            log.info(
+                "%s is RAM-backed (%s), uploads there use system memory",
+                self._directory,
+                self._filesystem,
+            )
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def in_memory(self) -> bool:
+        """Whether the directory is on a RAM-backed filesystem."""
+
+        return self._filesystem in ("tmpfs", "ramfs")
+
+    def new_path(self, suffix: str = "") -> str:
+        """
+        Returns a fresh path in the directory owned by the current process.
+
+        :param suffix: File extension to keep, e.g. ``.mp3``.
+        """
+
+        name = f"{os.getpid()}-{uuid4().hex}{suffix[:16]}"
+        return str(self._directory / name)
+
+    def usage(self) -> int:
+        """Total size in bytes of the files in the directory."""
+
+        total = 0
+        for entry in os.scandir(self._directory):
+            try:
+                if entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+            except FileNotFoundError:
+                continue
+        return total
+
+    def available(self) -> int:
+        """
+        Number of bytes that can still be stored without going below the
+        minimum free space or over the quota.
+        """
+
+        available = shutil.disk_usage(self._directory).free - self._min_free
+        if self.in_memory:
+            # A tmpfs reports its size limit, usually half of the memory,
+            # whatever the models already use.
+            memory = _memory_available()
+            if memory is not None:
+                available = min(available, memory - self._min_free)
+        if self._quota is not None:
+            available = min(available, self._quota - self.usage())
+        return max(available, 0)
+
+    def sweep(self, max_age: float | None = None) -> int:
+        """
+        Deletes files left behind by worker processes that are gone.
+
+        A file is an orphan when the process that created it is no longer
+        running, or when it is older than ``max_age``. Files whose names were
+        not produced by ``new_path`` are left untouched.
+
+        :param max_age: Age in seconds after which any file is an orphan.
+        :return: Number of deleted files.
+        """
+
+        now = time.time()
+        current_pid = os.getpid()
+        removed = 0
+
+        for entry in os.scandir(self._directory):
+            match = _NAME_PATTERN.match(entry.name)
+            if match is None or not entry.is_file(follow_symlinks=False):
+                continue
+
+            pid = int(match["pid"])
+            try:
+                expired = (
+                    max_age is not None
+                    and now - entry.stat().st_mtime > max_age
+                )
+            except FileNotFoundError:
+                continue
+
+            # A file with our own pid predates this process: the pid was
+            # reused after a restart, e.g. pid 1 in a container.
+            if pid == current_pid or not _pid_alive(pid) or expired:
+                delete_file(entry.path)
+                removed += 1
+
+        if removed:
+            log.info(
+                "Removed %d orphaned file(s) from %s", removed, self._directory
+            )
+        return removed
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _memory_available() -> int | None:
+    """Memory available to new allocations in bytes, from /proc/meminfo."""
+
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _filesystem_type(path: Path) -> str | None:
+    """Type of the filesystem mounted at ``path``, from /proc/mounts."""
+
+    try:
+        with open("/proc/mounts") as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return None
+
+    resolved = str(path.resolve())
+    best, fs_type = "", None
+    for mount_point, mount_type in mounts:
+        inside = resolved == mount_point or resolved.startswith(
+            mount_point.rstrip("/") + "/"
+        )
+        if inside and len(mount_point) > len(best):
+            best, fs_type = mount_point, mount_type
+    return fs_type
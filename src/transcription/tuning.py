@@ -0,0 +1,151 @@
+"""
+Inference parameters of the transcription models.
+
+Every model runs with a ``ModelTuning``: the CPU threads and replicas it is
+loaded with and the default ``InferenceOptions`` of its transcriptions.
+Hosts differ enough that no single set of values suits them all, so the
+tunings can be measured with ``python -m src.transcription.autotune`` and
+loaded from the JSON profile it writes.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass, field, fields
+
+from src.transcription import log
+from src.transcription.enums import Model
+
+
+@dataclass(frozen=True)
+class InferenceOptions:
+    """
+    Parameters of one transcription. Fields left as None take the value of
+    the model's tuning.
+    """
+
+    batch_size: int | None = None
+    chunk_size: int | None = None
+    beam_size: int | None = None
+
+    def merged(self, defaults: "InferenceOptions") -> "InferenceOptions":
+        """Returns these options with unset fields taken from ``defaults``."""
+
+        return InferenceOptions(
+            **{
+                f.name: (
+                    getattr(self, f.name)
+                    if getattr(self, f.name) is not None
+                    else getattr(defaults, f.name)
+                )
+                for f in fields(self)
+            }
+        )
+
+    def overrides(self) -> dict[str, int]:
+        """Returns the fields that are set, as keyword arguments."""
+
+        return {
+            name: value
+            for name, value in asdict(self).items()
+            if value is not None
+        }
+
+
+DEFAULT_OPTIONS = InferenceOptions(batch_size=4, chunk_size=10, beam_size=5)
+
+
+@dataclass(frozen=True)
+class ModelTuning:
+    """How a model is loaded and the defaults of its transcriptions."""
+
+    cpu_threads: int = 4
+    replicas: int = 1
+    options: InferenceOptions = field(default_factory=lambda: DEFAULT_OPTIONS)
+
+    def to_dict(self) -> dict:
+        return {
+            "cpu_threads": self.cpu_threads,
+            "replicas": self.replicas,
+            **self.options.overrides(),
+        }
+
+    @classmethod
+    def from_dict(
+        cls, data: dict, defaults: "ModelTuning | None" = None
+    ) -> "ModelTuning":
+        """
+        Builds a tuning from its JSON form, taking missing values from
+        ``defaults``.
+        """
+
+        defaults = defaults or cls()
+        options = InferenceOptions(
+            batch_size=data.get("batch_size"),
+            chunk_size=data.get("chunk_size"),
+            beam_size=data.get("beam_size"),
+        )
+        return cls(
+            cpu_threads=data.get("cpu_threads", defaults.cpu_threads),
+            replicas=data.get("replicas", defaults.replicas),
+            options=options.merged(defaults.options),
+        )
+
+
+def load_inference_profile(
+    path: str, defaults: ModelTuning | None = None
+) -> dict[Model, ModelTuning]:
+    """
+    Reads the per-model tunings written by the autotune command.
+
+    :param path: JSON profile.
+    :param defaults: Tuning supplying the values a model entry leaves out.
+
+    :return: Tuning of every model in the profile; empty if the file does
+        not exist.
+    """
+
+    if not os.path.exists(path):
+        log.warning("Inference profile %s not found, using defaults", path)
+        return {}
+
+    with open(path) as f:
+        profile = json.load(f)
+
+    tunings = {
+        Model(name): ModelTuning.from_dict(data, defaults)
+        for name, data in profile.get("models", {}).items()
+    }
+    log.info(
+        "Loaded inference profile %s for models: %s",
+        path,
+        ", ".join(model.value for model in tunings),
+    )
+    return tunings
+
+
+def save_inference_profile(
+    path: str, tunings: dict[Model, ModelTuning], **metadata
+) -> None:
+    """
+    Writes per-model tunings in the format read by ``load_inference_profile``.
+
+    :param path: JSON profile, replaced atomically.
+    :param tunings: Tuning of every model.
+    :param metadata: Additional top-level fields, such as the host it was
+        measured on.
+    """
+
+    profile = {
+        **metadata,
+        "models": {
+            model.value: tuning.to_dict() for model, tuning in tunings.items()
+        },
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        json.dump(profile, f, indent=2)
+        f.write("\n")
+    os.replace(temp_path, path)
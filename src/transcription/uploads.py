@@ -0,0 +1,436 @@
+import hashlib
+import os
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+import anyio
+from anyio import AsyncFile
+from fastapi import HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from src.transcription import log
+from src.transcription.metrics import timed
+from src.transcription.storage import TempStorage
+from src.transcription.utils import delete_file
+
+MAX_FIELD_SIZE = 64 * 1024
+MAX_FIELDS = 32
+# Bytes written between two reads of the free space, which other uploads
+# use up concurrently.
+CAPACITY_CHECK_SIZE = 8 * 1024 * 1024
+
+FormT = TypeVar("FormT", bound=BaseModel)
+
+
+@dataclass
+class StoredFile:
+    """A file part of a multipart request, written to disk."""
+
+    field_name: str
+    filename: str
+    content_type: str | None
+    path: str
+    size: int = 0
+    sha256: str = ""
+
+
+@dataclass
+class UploadedForm:
+    """Form fields and stored files of a multipart request."""
+
+    fields: dict[str, str] = field(default_factory=dict)
+    files: list[StoredFile] = field(default_factory=list)
+
+    def get_file(self, field_name: str = "file") -> StoredFile | None:
+        """Returns the first file sent under ``field_name``, if any."""
+
+        return next(
+            (file for file in self.files if file.field_name == field_name),
+            None,
+        )
+
+    def cleanup(self) -> None:
+        """Deletes every stored file."""
+
+        for file in self.files:
+            delete_file(file.path)
+
+
+@dataclass
+class _Part:
+    headers: dict[bytes, bytes] = field(default_factory=dict)
+    field_name: str = ""
+    data: bytearray = field(default_factory=bytearray)
+    file: StoredFile | None = None
+    hasher: Any = None
+    handle: AsyncFile | None = None
+
+
+class _MultipartReceiver:
+    """
+    Incremental multipart/form-data parser that writes file parts straight
+    to disk as the request body arrives.
+
+    Parser callbacks are synchronous, so they only record what has to be done;
+    the file I/O queued by each chunk is awaited before the next chunk is read.
+    Room for every chunk is reserved against the space left in the storage
+    before it is written, so the upload stops once the storage is full.
+    """
+
+    def __init__(
+        self, storage: TempStorage, max_file_size: int, max_files: int
+    ):
+        self._storage = storage
+        self._max_file_size = max_file_size
+        self._max_files = max_files
+        self._form = UploadedForm()
+        self._part = _Part()
+        self._header_name = b""
+        self._header_value = b""
+        self._pending: list[tuple[_Part, bytes | None]] = []
+        self._to_open: list[_Part] = []
+        self._to_close: list[_Part] = []
+        self._file_parts: list[_Part] = []
+        self._available = 0
+        self._unchecked = 0
+
+    def on_part_begin(self) -> None:
+        self._part = _Part()
+
+    def on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def on_header_end(self) -> None:
+        self._part.headers[self._header_name.lower()] = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def on_headers_finished(self) -> None:
+        _, options = parse_options_header(
+            self._part.headers.get(b"content-disposition")
+        )
+        if b"name" not in options:
+            raise _bad_request("Multipart part without a field name")
+        self._part.field_name = options[b"name"].decode("utf-8", "replace")
+
+        if b"filename" not in options:
+            if len(self._form.fields) >= MAX_FIELDS:
+                raise _bad_request("Too many form fields")
+            return
+
+        if len(self._form.files) >= self._max_files:
+            raise _bad_request(
+                f"Too many files, at most {self._max_files} allowed"
+            )
+
+        filename = os.path.basename(
+            options[b"filename"].decode("utf-8", "replace")
+        )
+        _, extension = os.path.splitext(filename)
+        content_type = self._part.headers.get(b"content-type")
+        self._part.file = StoredFile(
+            field_name=self._part.field_name,
+            filename=filename,
+            content_type=(
+                content_type.decode("latin-1") if content_type else None
+            ),
+            path=self._storage.new_path(extension),
+        )
+        self._part.hasher = hashlib.sha256()
+        self._form.files.append(self._part.file)
+        self._file_parts.append(self._part)
+        self._to_open.append(self._part)
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        chunk = data[start:end]
+        part = self._part
+
+        if part.file is None:
+            if len(part.data) + len(chunk) > MAX_FIELD_SIZE:
+                raise _bad_request(f"Form field {part.field_name} is too large")
+            part.data.extend(chunk)
+            return
+
+        part.file.size += len(chunk)
+        if part.file.size > self._max_file_size:
+            raise _too_large(self._max_file_size)
+        part.hasher.update(chunk)
+        self._pending.append((part, chunk))
+
+    def on_part_end(self) -> None:
+        part = self._part
+        if part.file is None:
+            self._form.fields[part.field_name] = part.data.decode(
+                "utf-8", "replace"
+            )
+            return
+
+        part.file.sha256 = part.hasher.hexdigest()
+        self._to_close.append(part)
+
+    async def receive(self, request: Request) -> UploadedForm:
+        content_type, params = parse_options_header(
+            request.headers.get("content-type")
+        )
+        if content_type != b"multipart/form-data" or b"boundary" not in params:
+            raise _bad_request("Expected a multipart/form-data request")
+
+        # The length only allows rejecting early, the body is checked
+        # while it is written.
+        content_length = request.headers.get("content-length")
+        if content_length and content_length.isdigit():
+            limit = (
+                self._max_files * self._max_file_size
+                + MAX_FIELDS * MAX_FIELD_SIZE
+            )
+            if int(content_length) > limit:
+                raise _too_large(self._max_file_size)
+            await self._check_room(int(content_length))
+
+        parser = MultipartParser(
+            params[b"boundary"],
+            callbacks={
+                "on_part_begin": self.on_part_begin,
+                "on_part_data": self.on_part_data,
+                "on_part_end": self.on_part_end,
+                "on_header_field": self.on_header_field,
+                "on_header_value": self.on_header_value,
+                "on_header_end": self.on_header_end,
+                "on_headers_finished": self.on_headers_finished,
+            },
+        )
+
+        try:
+            async for chunk in request.stream():
+                parser.write(chunk)
+                await self._flush()
+            parser.finalize()
+            await self._flush()
+        except MultipartParseError as err:
+            await self._abort()
+            raise _bad_request("Malformed multipart body") from err
+        except BaseException:
+            await self._abort()
+            raise
+
+        return self._form
+
+    async def _flush(self) -> None:
+        """Performs the file I/O queued by the parser callbacks, in order."""
+
+        for part in self._to_open:
+            part.handle = await anyio.open_file(part.file.path, "wb")
+        self._to_open.clear()
+
+        await self._reserve(sum(len(chunk) for _, chunk in self._pending))
+        for part, chunk in self._pending:
+            await part.handle.write(chunk)
+        self._pending.clear()
+
+        for part in self._to_close:
+            await part.handle.aclose()
+            part.handle = None
+            log.debug(
+                "Upload %s saved to %s (%d bytes)",
+                part.file.filename,
+                part.file.path,
+                part.file.size,
+            )
+        self._to_close.clear()
+
+    async def _reserve(self, size: int) -> None:
+        """
+        Takes ``size`` bytes off the space left in the storage, reading the
+        space again when it runs out or every ``CAPACITY_CHECK_SIZE`` bytes.
+        """
+
+        if size > self._available or self._unchecked >= CAPACITY_CHECK_SIZE:
+            await self._check_room(size)
+        self._available -= size
+        self._unchecked += size
+
+    async def _check_room(self, size: int) -> None:
+        """
+        Reads the space left in the storage.
+
+        :raises HTTPException: 507 if there is no room for ``size`` bytes.
+        """
+
+        self._available = await anyio.to_thread.run_sync(
+            self._storage.available
+        )
+        self._unchecked = 0
+        if size > self._available:
+            log.warning(
+                "Rejecting upload: not enough storage in %s",
+                self._storage.directory,
+            )
+            raise HTTPException(
+                status_code=status.HTTP_507_INSUFFICIENT_STORAGE,
+                detail="Not enough storage for the upload, try again later",
+                headers={"X-Error-Code": "INSUFFICIENT_STORAGE"},
+            )
+
+    async def _abort(self) -> None:
+        for part in self._file_parts:
+            if part.handle is not None:
+                await part.handle.aclose()
+        self._form.cleanup()
+
+
+async def receive_form(
+    request: Request,
+    storage: TempStorage,
+    max_file_size: int,
+    max_files: int = 1,
+) -> UploadedForm:
+    """
+    Streams a multipart/form-data request body to disk.
+
+    Each file part is written in chunks to a uniquely named file in
+    ``storage`` while its SHA-256 is computed, so the body is written to
+    disk once and never held in memory. The upload is aborted as soon as a
+    file exceeds ``max_file_size`` or the storage runs out of room; partially
+    written files are removed.
+
+    :param request: Incoming request whose body has not been read yet.
+    :param storage: Temporary storage for the files.
+    :param max_file_size: Maximum size of a single file in bytes.
+    :param max_files: Maximum number of files in the request.
+
+    :return: The form fields and stored files. The caller owns the files.
+    :raises HTTPException: 400 for malformed requests, 413 for oversized files,
+        507 when the storage has no room for the upload.
+    """
+
+    receiver = _MultipartReceiver(storage, max_file_size, max_files)
+    with timed("upload"):
+        return await receiver.receive(request)
+
+
+def multipart_request_body(
+    fields: dict[str, dict], file_field: str = "file", multiple: bool = False
+) -> dict:
+    """
+    Builds the OpenAPI request body of a route that reads its multipart form
+    with receive_form instead of File/Form parameters.
+
+    :param fields: JSON schemas of the plain form fields by name.
+    :param file_field: Name of the file field.
+    :param multiple: Whether the file field accepts several files.
+
+    :return: Value for the ``openapi_extra`` argument of the route.
+    """
+
+    file_schema: dict = {"type": "string", "format": "binary"}
+    if multiple:
+        file_schema = {"type": "array", "items": file_schema}
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": [file_field],
+                        "properties": {file_field: file_schema, **fields},
+                    }
+                }
+            },
+        }
+    }
+
+
+def _bad_request(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=detail,
+        headers={"X-Error-Code": "INVALID_UPLOAD"},
+    )
+
+
+def _too_large(max_file_size: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File exceeds the maximum size of {max_file_size // (1024 * 1024)} MB",
+        headers={"X-Error-Code": "FILE_TOO_LARGE"},
+    )
+
+
+def validate_form(schema: type[FormT], form: UploadedForm) -> FormT:
+    """
+    Validates the plain fields of an uploaded form against a schema.
+    Empty fields are treated as missing, like FastAPI does for Form params.
+
+    :param schema: Pydantic model describing the fields.
+    :param form: Received form.
+
+    :return: The validated fields.
+    :raises RequestValidationError: If the fields do not match the schema.
+    """
+
+    fields = {name: value for name, value in form.fields.items() if value}
+    try:
+        return schema.model_validate(fields)
+    except ValidationError as err:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in err.errors(
+                    include_url=False, include_context=False
+                )
+            ]
+        ) from err
+
+
+def require_files(
+    form: UploadedForm, field_name: str = "files"
+) -> list[StoredFile]:
+    """
+    Returns every file sent under ``field_name``, in request order.
+
+    :raises RequestValidationError: If the request has no such file.
+    """
+
+    files = [file for file in form.files if file.field_name == field_name]
+    if not files:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "missing",
+                    "loc": ("body", field_name),
+                    "msg": "Field required",
+                    "input": None,
+                }
+            ]
+        )
+    return files
+
+
+def require_file(form: UploadedForm, field_name: str = "file") -> StoredFile:
+    """
+    Returns the file sent under ``field_name``.
+
+    :raises RequestValidationError: If the request has no such file.
+    """
+
+    file = form.get_file(field_name)
+    if file is None:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "missing",
+                    "loc": ("body", field_name),
+                    "msg": "Field required",
+                    "input": None,
+                }
+            ]
+        )
+    return file
@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.config import settings
+from src.users.models import Role, UserModel
+
+
+@dataclass(frozen=True)
+class CachedUser:
+    """
+    Snapshot of what authorization needs from a user row, detached from any
+    database session. The password hash is left out, so a changed password
+    never outlives its write.
+    """
+
+    id: UUID
+    username: str
+    role: Role
+    is_active: bool
+
+    @classmethod
+    def from_model(cls, user: UserModel) -> "CachedUser":
+        return cls(
+            id=user.id,
+            username=user.username,
+            role=user.role,
+            is_active=user.is_active,
+        )
+
+
+class UserCache:
+    """
+    Thread-safe cache of users by ID with a short TTL and a bounded number
+    of entries, evicted least recently used first.
+
+    Every write to a user through ``UserService`` invalidates its entry. The
+    cache is per process, so a change made by another worker is seen once
+    the entry expires, which is what the TTL bounds. Logins read the user
+    from the database instead, as they check the password hash.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 30.0):
+        """
+        :param max_entries: Maximum number of cached users, 0 disables the
+            cache.
+        :param ttl: Seconds after which a cached user is read again.
+        """
+
+        if max_entries < 0:
+            raise ValueError("max_entries must not be negative")
+
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._users: OrderedDict[UUID, tuple[CachedUser, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: UUID) -> CachedUser | None:
+        with self._lock:
+            return self._get(user_id)
+
+    def put(self, user: CachedUser) -> CachedUser:
+        """Caches a user read from the database and returns it."""
+
+        if not self._max_entries:
+            return user
+        with self._lock:
+            self._users.pop(user.id, None)
+            self._users[user.id] = (user, time.monotonic() + self._ttl)
+            while len(self._users) > self._max_entries:
+                self._users.popitem(last=False)
+        return user
+
+    def invalidate(self, user_id: UUID) -> None:
+        with self._lock:
+            self._users.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._users.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._users)
+
+    def _get(self, user_id: UUID) -> CachedUser | None:
+        entry = self._users.get(user_id)
+        if entry is None:
+            return None
+        user, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._users[user_id]
+            return None
+        self._users.move_to_end(user_id)
+        return user
+
+
+user_cache = UserCache(
+    max_entries=settings.USER_CACHE_MAX_ENTRIES,
+    ttl=settings.USER_CACHE_TTL_SECONDS,
+)
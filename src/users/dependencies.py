@@ -1,4 +1,4 @@
-from typing import Annotated, AsyncGenerator
+from typing import Annotated, AsyncContextManager, AsyncGenerator
 
 from fastapi import Depends
 
@@ -6,8 +6,17 @@ from src.database.config import sqlalchemy_config
 from src.users.services import UserService
 
 
+def open_user_service() -> AsyncContextManager[UserService]:
+    """
+    Opens a user service with its own session. Streamed responses use it,
+    since the session of a dependency is closed before the body is sent.
+    """
+
+    return UserService.new(config=sqlalchemy_config)
+
+
 async def provide_user_service() -> AsyncGenerator[UserService, None]:
-    async with UserService.new(config=sqlalchemy_config) as service:
+    async with open_user_service() as service:
         yield service
 
 
@@ -3,7 +3,7 @@ from enum import Enum
 from advanced_alchemy.base import UUIDAuditBase
 from sqlalchemy import Boolean
 from sqlalchemy import Enum as SQLAlchemyEnum
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -18,6 +18,8 @@ class UserModel(UUIDAuditBase):
     """User model."""
 
     __tablename__ = "users"
+    # Keyset pagination walks users in (created_at, id) order.
+    __table_args__ = (Index("ix_users_created_at_id", "created_at", "id"),)
 
     username: Mapped[str] = mapped_column(String, unique=True, index=True)
     password: Mapped[str]
@@ -0,0 +1,29 @@
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
+from src.users.models import UserModel
+
+UserKey = tuple[datetime, UUID]
+
+
+def encode_cursor(user: UserModel) -> str:
+    """Returns an opaque cursor pointing after ``user`` in listing order."""
+
+    key = {"created_at": user.created_at.isoformat(), "id": str(user.id)}
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> UserKey:
+    """
+    Returns the ``(created_at, id)`` key a cursor points after.
+
+    :raises ValueError: If the cursor was not made by ``encode_cursor``.
+    """
+
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(key["created_at"]), UUID(key["id"])
+    except (TypeError, KeyError, ValueError) as err:
+        raise ValueError("Invalid cursor") from err
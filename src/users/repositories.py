@@ -1,9 +1,55 @@
 from advanced_alchemy.extensions.fastapi import repository
+from sqlalchemy import literal, select, tuple_
 
-from src.users.models import UserModel
+from src.users.models import Role, UserModel
+from src.users.pagination import UserKey
 
 
 class UserRepository(repository.SQLAlchemyAsyncRepository[UserModel]):
     """User repository"""
 
     model_type = UserModel
+
+    async def list_after(
+        self,
+        limit: int,
+        after: UserKey | None = None,
+        role: Role | None = None,
+        is_active: bool | None = None,
+        username_prefix: str | None = None,
+    ) -> list[UserModel]:
+        """
+        Lists users in ``(created_at, id)`` order, starting after a key. The
+        key condition is served by the ``ix_users_created_at_id`` index, so
+        a page costs the same wherever it starts.
+
+        :param limit: Maximum number of users returned.
+        :param after: Key of the last user of the previous page.
+        """
+
+        statement = select(UserModel)
+        if after is not None:
+            created_at, user_id = after
+            # A row comparison, which PostgreSQL matches against the index.
+            # The values are typed explicitly, since a tuple does not pass
+            # the column types on to them.
+            statement = statement.where(
+                tuple_(UserModel.created_at, UserModel.id)
+                > tuple_(
+                    literal(created_at, UserModel.created_at.type),
+                    literal(user_id, UserModel.id.type),
+                )
+            )
+        if role is not None:
+            statement = statement.where(UserModel.role == role)
+        if is_active is not None:
+            statement = statement.where(UserModel.is_active == is_active)
+        if username_prefix:
+            statement = statement.where(
+                UserModel.username.startswith(username_prefix, autoescape=True)
+            )
+        statement = statement.order_by(
+            UserModel.created_at, UserModel.id
+        ).limit(limit)
+        result = await self.session.execute(statement)
+        return list(result.scalars())
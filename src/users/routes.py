@@ -1,16 +1,46 @@
+from typing import Annotated, AsyncGenerator
 from uuid import UUID
 
 from advanced_alchemy.exceptions import IntegrityError
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 from src.auth.security.dependencies import CurrentAdminDep
-from src.users.dependencies import UserServiceDep
+from src.users import log
+from src.users.dependencies import UserServiceDep, open_user_service
 from src.users.models import UserModel
-from src.users.schemas import User, UserCreate, UserList
+from src.users.schemas import (
+    User,
+    UserCreate,
+    UserFilters,
+    UserList,
+    UserPageQuery,
+)
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
+@router.get(
+    "/export",
+    summary="Export users",
+    description="Streams every user matching the filters as newline-delimited JSON, in creation order.",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "One User object per line. If the export fails "
+            'midway, the last line is {"error": "..."}.',
+            "content": {"application/x-ndjson": {}},
+        },
+    },
+)
+async def export_users(
+    filters: Annotated[UserFilters, Query()], admin: CurrentAdminDep
+) -> StreamingResponse:
+    return StreamingResponse(
+        _ndjson_users(filters), media_type="application/x-ndjson"
+    )
+
+
 @router.get(
     "/{user_id}",
     summary="Get user by ID",
@@ -33,7 +63,7 @@ async def get_user(
             headers={"X-Error-Code": "INVALID_UUID"},
         ) from err
 
-    user = await service.get(user_uuid)
+    user = await service.get_cached(user_uuid)
     if not user:
         raise HTTPException(
             status_code=404,
@@ -45,19 +75,32 @@ async def get_user(
 
 @router.get(
     "",
-    summary="List all users",
-    description="Retrieve a list of all registered users",
+    summary="List users",
+    description="Retrieve a page of users in creation order. Pass the returned `next_cursor` as `cursor` to get the next page.",
     responses={
         status.HTTP_200_OK: {
-            "description": "List of all users returned successfully"
+            "description": "Page of users returned successfully"
         },
     },
 )
 async def get_all_users(
-    service: UserServiceDep, admin: CurrentAdminDep
+    service: UserServiceDep,
+    admin: CurrentAdminDep,
+    query: Annotated[UserPageQuery, Query()],
 ) -> UserList:
-    users = await service.list()
-    return UserList(users=users)
+    try:
+        users, next_cursor = await service.list_page(
+            query.limit,
+            query.cursor,
+            **query.model_dump(exclude={"limit", "cursor"}),
+        )
+    except ValueError as err:
+        raise HTTPException(
+            status_code=422,
+            detail="Invalid cursor",
+            headers={"X-Error-Code": "INVALID_CURSOR"},
+        ) from err
+    return UserList(users=users, next_cursor=next_cursor)
 
 
 @router.post(
@@ -86,3 +129,18 @@ async def create_user(user: UserCreate, service: UserServiceDep) -> User:
         ) from err
 
     return created_user
+
+
+async def _ndjson_users(filters: UserFilters) -> AsyncGenerator[str, None]:
+    """
+    Serializes exported users as NDJSON lines. Errors after the response
+    has started are reported in a final line instead of a status code.
+    """
+
+    try:
+        async with open_user_service() as service:
+            async for user in service.export(**filters.model_dump()):
+                yield User.model_validate(user).model_dump_json() + "\n"
+    except Exception as e:
+        log.error("User export failed: %s", e)
+        yield '{"error": "Export failed"}\n'
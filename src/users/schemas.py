@@ -1,6 +1,10 @@
-from pydantic import UUID4
+from pydantic import UUID4, BaseModel, Field
 
 from src.schemas import BaseSchema
+from src.users.models import Role
+
+USERS_PAGE_SIZE = 100
+USERS_MAX_PAGE_SIZE = 1000
 
 
 class User(BaseSchema):
@@ -15,5 +19,27 @@ class UserCreate(BaseSchema):
     password: str
 
 
+class UserFilters(BaseModel):
+    role: Role | None = Field(None, description="Only users with this role")
+    is_active: bool | None = Field(
+        None, description="Only active or only inactive users"
+    )
+    username_prefix: str | None = Field(
+        None, description="Only users whose username starts with this"
+    )
+
+
+class UserPageQuery(UserFilters):
+    limit: int = Field(
+        USERS_PAGE_SIZE, ge=1, le=USERS_MAX_PAGE_SIZE, description="Page size"
+    )
+    cursor: str | None = Field(
+        None, description="`next_cursor` of the previous page"
+    )
+
+
 class UserList(BaseSchema):
     users: list[User]
+    next_cursor: str | None = Field(
+        None, description="Cursor of the next page, None on the last page"
+    )
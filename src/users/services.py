@@ -1,7 +1,12 @@
+from typing import AsyncIterator
+from uuid import UUID
+
 from advanced_alchemy.extensions.fastapi import service
 
-from src.auth.security.passwords import hash_password
+from src.auth.security.passwords import password_pool
+from src.users.cache import CachedUser, user_cache
 from src.users.models import UserModel
+from src.users.pagination import decode_cursor, encode_cursor
 from src.users.repositories import UserRepository
 
 
@@ -12,6 +17,75 @@ class UserService(
 
     repository_type = UserRepository
 
+    async def get_cached(self, user_id: UUID) -> CachedUser | None:
+        """
+        Returns a user by ID from the user cache, reading it from the
+        database on a miss. The session only opens a connection then.
+        """
+
+        user = user_cache.get(user_id)
+        if user is None:
+            model = await self.get_one_or_none(id=user_id)
+            if model is not None:
+                user = user_cache.put(CachedUser.from_model(model))
+        return user
+
+    async def list_page(
+        self, limit: int, cursor: str | None = None, **filters
+    ) -> tuple[list[UserModel], str | None]:
+        """
+        Lists a page of users in creation order.
+
+        :param limit: Maximum number of users on the page.
+        :param cursor: Cursor returned with the previous page, None for the
+            first page.
+        :param filters: Filters of ``UserRepository.list_after``.
+        :return: Users of the page and the cursor of the next one, None if
+            this is the last page.
+        :raises ValueError: If the cursor is invalid.
+        """
+
+        after = decode_cursor(cursor) if cursor else None
+        users = await self.repository.list_after(limit + 1, after, **filters)
+        if len(users) <= limit:
+            return users, None
+        return users[:limit], encode_cursor(users[limit - 1])
+
+    async def export(
+        self, batch_size: int = 1000, **filters
+    ) -> AsyncIterator[UserModel]:
+        """
+        Yields every matching user in creation order, reading one page at a
+        time, so memory use does not grow with the number of users.
+
+        :param batch_size: Number of users read per query.
+        :param filters: Filters of ``UserRepository.list_after``.
+        """
+
+        after = None
+        while True:
+            users = await self.repository.list_after(
+                batch_size, after, **filters
+            )
+            for user in users:
+                yield user
+            if len(users) < batch_size:
+                return
+            after = (users[-1].created_at, users[-1].id)
+            self.repository.session.expunge_all()
+
     async def create_user(self, user_obj: UserModel) -> UserModel:
-        user_obj.password = hash_password(user_obj.password)
+        user_obj.password = await password_pool.hash(user_obj.password)
         return await self.create(user_obj, auto_commit=True)
+
+    async def update_password_hash(
+        self, user_id: UUID, password_hash: str
+    ) -> UserModel:
+        """Stores a new hash of the user's unchanged password."""
+
+        try:
+            return await self.update(
+                {"password": password_hash}, item_id=user_id, auto_commit=True
+            )
+        finally:
+            user_cache.invalidate(user_id)
@@ -1,4 +1,14 @@
-from src.auth.security.passwords import hash_password, verify_password
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from src.auth.security.passwords import (
+    PasswordHashingPool,
+    hash_password,
+    verify_password,
+)
 
 
 def test_hash_password_returns_string():
@@ -39,3 +49,44 @@ def test_hash_format_is_argon2():
     """Test that hash uses Argon2 format."""
     hashed = hash_password("test_password")
     assert hashed.startswith("$argon2")
+
+
+@pytest.mark.asyncio
+async def test_pool_hashes_off_the_event_loop():
+    """Test that the pool hashes and verifies on its own threads."""
+    pool = PasswordHashingPool(max_workers=1)
+    threads = []
+
+    def record(*args):
+        threads.append(threading.current_thread().name)
+        return verify_password(*args)
+
+    hashed = await pool.hash("test_password")
+    assert await pool.verify_and_update("test_password", hashed) == (
+        True,
+        None,
+    )
+    assert await pool._run("verify", record, "wrong", hashed) is False
+    assert threads[0].startswith("password")
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_pool_rejects_operations_when_saturated():
+    """Test that operations beyond the admission limit get a 503."""
+    pool = PasswordHashingPool(max_workers=1, max_pending=0)
+    release = threading.Event()
+    running = asyncio.ensure_future(pool._run("verify", release.wait))
+    await asyncio.sleep(0)
+
+    with pytest.raises(HTTPException) as exc:
+        await pool.verify_and_update(
+            "test_password", hash_password("test_password")
+        )
+    release.set()
+    await running
+
+    assert exc.value.status_code == 503
+    assert exc.value.headers["X-Error-Code"] == "AUTH_BUSY"
+    assert pool.admitted == 0
+    pool.shutdown()
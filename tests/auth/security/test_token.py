@@ -5,8 +5,11 @@ import jwt
 import pytest
 from fastapi import HTTPException
 
+from src.auth.security import token as token_module
 from src.auth.security.schemas import TokenPayload
 from src.auth.security.token import (
+    VerifiedTokenCache,
+    access_token_cache,
     create_access_token,
     create_refresh_token,
     create_token,
@@ -113,3 +116,56 @@ def test_verify_token_invalid():
     with pytest.raises(HTTPException) as exc:
         verify_token(invalid_token)
     assert "invalid" in str(exc.value.detail).lower()
+
+
+def test_verify_token_is_cached(token_payload, monkeypatch):
+    """Test that a token sent again is not decoded again."""
+    access_token_cache.clear()
+    token = create_access_token(token_payload)
+    decodes = []
+    decode = jwt.decode
+    monkeypatch.setattr(
+        jwt,
+        "decode",
+        lambda *args, **kwargs: decodes.append(1) or decode(*args, **kwargs),
+    )
+
+    first = verify_token(token)
+    second = verify_token(token)
+
+    assert second is first
+    assert len(decodes) == 1
+
+
+def test_cached_token_is_not_served_after_exp(token_payload, monkeypatch):
+    """Test that a cached token is verified again once it expires."""
+    access_token_cache.clear()
+    token = create_access_token(token_payload)
+    verify_token(token)
+
+    expires = jwt.decode(token, options={"verify_signature": False})["exp"]
+    monkeypatch.setattr(token_module.time, "time", lambda: expires + 1)
+
+    def decode(*args, **kwargs):
+        raise jwt.ExpiredSignatureError()
+
+    monkeypatch.setattr(jwt, "decode", decode)
+    with pytest.raises(HTTPException) as exc:
+        verify_token(token)
+    assert "expired" in str(exc.value.detail).lower()
+    assert len(access_token_cache) == 0
+
+
+def test_token_cache_is_bounded(token_payload):
+    """Test that the least recently used tokens are evicted."""
+    cache = VerifiedTokenCache(max_entries=2)
+    expires = 2**40
+    cache.put("a", token_payload, expires)
+    cache.put("b", token_payload, expires)
+    cache.get("a")
+    cache.put("c", token_payload, expires)
+
+    assert cache.get("a") is token_payload
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    assert VerifiedTokenCache(max_entries=0).get("a") is None
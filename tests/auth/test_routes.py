@@ -3,7 +3,8 @@ import uuid
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-from src.auth.security.passwords import hash_password
+from src.auth.security.passwords import create_password_context, hash_password
+from src.config import settings
 from src.main import app
 from src.users.dependencies import provide_user_service
 from src.users.models import Role
@@ -81,3 +82,50 @@ async def test_login_invalid_json(client):
 async def test_login_no_payload(client):
     response = await client.post("/auth/login")
     assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_password(credentials, client):
+    """Test that a hash made with another Argon2 cost is replaced on login."""
+    user = MockUser()
+    user.password = create_password_context(1, 1024, 1).hash("password")
+    updates = []
+
+    class RehashingUserService(MockUserService):
+        async def get_one_or_none(self, username: str):
+            return user
+
+        async def update_password_hash(self, user_id, password_hash):
+            updates.append(password_hash)
+
+    app.dependency_overrides[provide_user_service] = RehashingUserService
+
+    first = await client.post("/auth/login", json=credentials)
+    user.password = updates[0]
+    second = await client.post("/auth/login", json=credentials)
+
+    assert first.status_code == second.status_code == 200
+    assert len(updates) == 1
+    assert updates[0].startswith(
+        f"$argon2id$v=19$m={settings.ARGON2_MEMORY_COST_KB},"
+        f"t={settings.ARGON2_TIME_COST},p={settings.ARGON2_PARALLELISM}$"
+    )
+
+
+@pytest.mark.asyncio
+async def test_login_rejects_a_changed_password(credentials, client):
+    """Test that the old password stops working once the hash changes."""
+    user = MockUser()
+
+    class ChangingUserService(MockUserService):
+        async def get_one_or_none(self, username: str):
+            return user
+
+    app.dependency_overrides[provide_user_service] = ChangingUserService
+
+    before = await client.post("/auth/login", json=credentials)
+    user.password = hash_password("changed")
+    after = await client.post("/auth/login", json=credentials)
+
+    assert before.status_code == 200
+    assert after.status_code == 401
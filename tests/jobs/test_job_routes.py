@@ -0,0 +1,153 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.auth.security.dependencies import get_current_user
+from src.auth.security.schemas import TokenPayload
+from src.jobs.dependencies import (
+    provide_job_service,
+    provide_job_storage,
+    provide_job_worker,
+)
+from src.jobs.enums import JobStatus
+from src.main import app
+from src.transcription.dependencies import provide_transcription_service
+from src.transcription.enums import ResultFormat
+from src.transcription.schemas import TranscriptionTextResult
+from src.transcription.storage import TempStorage
+from src.users.models import Role
+
+USER = TokenPayload(id=uuid.uuid4(), role=Role.USER)
+
+
+@pytest.fixture
+async def client():
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
+
+
+class MockJobService:
+    def __init__(self):
+        self.jobs = {}
+
+    async def create_job(self, job_obj):
+        job_obj.status = JobStatus.PENDING
+        job_obj.created_at = datetime.now(timezone.utc)
+        job_obj.started_at = None
+        job_obj.finished_at = None
+        job_obj.error = None
+        job_obj.segments = None
+        self.jobs[job_obj.id] = job_obj
+        return job_obj
+
+    async def get_one_or_none(self, id):
+        return self.jobs.get(id)
+
+
+class MockJobWorker:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, job_id):
+        self.submitted.append(job_id)
+
+
+class MockTranscriptionService:
+    def format_result(self, segments, format_result):
+        text = " ".join(segment["text"] for segment in segments)
+        return TranscriptionTextResult(text=text)
+
+
+@pytest.fixture
+def job_service():
+    return MockJobService()
+
+
+@pytest.fixture
+def job_worker():
+    return MockJobWorker()
+
+
+@pytest.fixture(autouse=True)
+def override_dependencies(job_service, job_worker, tmp_path):
+    storage = TempStorage(str(tmp_path))
+    app.dependency_overrides[provide_job_storage] = lambda: storage
+    app.dependency_overrides[provide_job_service] = lambda: job_service
+    app.dependency_overrides[provide_job_worker] = lambda: job_worker
+    app.dependency_overrides[provide_transcription_service] = (
+        lambda: MockTranscriptionService()
+    )
+    app.dependency_overrides[get_current_user] = lambda: USER
+    yield
+    app.dependency_overrides.clear()
+
+
+async def submit(client):
+    return await client.post(
+        "/transcription/jobs",
+        files={"file": ("audio.mp3", b"audio", "audio/mpeg")},
+        data={"model": "small", "result_format": ResultFormat.TEXT.value},
+    )
+
+
+@pytest.mark.asyncio
+async def test_submit_job_queues_it(client, job_worker, tmp_path):
+    """Test that submitting a job stores the audio and queues the job."""
+    response = await submit(client)
+    data = response.json()
+
+    assert response.status_code == 202
+    assert data["status"] == JobStatus.PENDING.value
+    assert job_worker.submitted == [uuid.UUID(data["id"])]
+    assert [path.read_bytes() for path in tmp_path.iterdir()] == [b"audio"]
+
+
+@pytest.mark.asyncio
+async def test_get_job_status(client):
+    """Test that the owner can poll the job status."""
+    job_id = (await submit(client)).json()["id"]
+
+    response = await client.get(f"/transcription/jobs/{job_id}")
+
+    assert response.status_code == 200
+    assert response.json()["id"] == job_id
+
+
+@pytest.mark.asyncio
+async def test_get_job_of_another_user_is_not_found(client, job_service):
+    """Test that users cannot see jobs they did not submit."""
+    job_id = (await submit(client)).json()["id"]
+    job_service.jobs[uuid.UUID(job_id)].user_id = uuid.uuid4()
+
+    response = await client.get(f"/transcription/jobs/{job_id}")
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_result_of_pending_job(client):
+    """Test that fetching the result of an unfinished job is a conflict."""
+    job_id = (await submit(client)).json()["id"]
+
+    response = await client.get(f"/transcription/jobs/{job_id}/result")
+
+    assert response.status_code == 409
+    assert response.headers["X-Error-Code"] == "JOB_NOT_COMPLETED"
+
+
+@pytest.mark.asyncio
+async def test_get_result_of_completed_job(client, job_service):
+    """Test that a completed job returns its formatted result."""
+    job_id = (await submit(client)).json()["id"]
+    job = job_service.jobs[uuid.UUID(job_id)]
+    job.status = JobStatus.COMPLETED
+    job.segments = [{"text": "hello", "start": 0.0, "end": 1.0}]
+
+    response = await client.get(f"/transcription/jobs/{job_id}/result")
+
+    assert response.status_code == 200
+    assert response.json() == {"text": "hello"}
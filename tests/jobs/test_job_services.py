@@ -0,0 +1,108 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from advanced_alchemy.base import UUIDAuditBase
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.jobs.enums import JobStatus
+from src.jobs.models import JobModel
+from src.jobs.services import JobService
+from src.transcription.enums import Model, ResultFormat
+from src.users.models import Role, UserModel
+
+
+@pytest.fixture
+async def sessions(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/jobs.db")
+    async with engine.begin() as connection:
+        await connection.run_sync(UUIDAuditBase.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+async def job(sessions):
+    user = UserModel(
+        id=uuid.uuid4(), username="user", password="hash", role=Role.USER
+    )
+    job = JobModel(
+        user_id=user.id,
+        model=Model.SMALL,
+        result_format=ResultFormat.TEXT,
+        audio_path="audio.wav",
+    )
+    async with sessions() as session:
+        session.add(user)
+        await JobService(session=session).create_job(job)
+    return job
+
+
+@pytest.mark.asyncio
+async def test_job_is_claimed_once(sessions, job):
+    """Test that only one of two services claiming a job gets it."""
+    async with sessions() as first, sessions() as second:
+        claimed = await JobService(session=first).claim(job.id)
+        again = await JobService(session=second).claim(job.id)
+
+    assert claimed.status == JobStatus.RUNNING
+    assert claimed.started_at is not None
+    assert again is None
+
+
+@pytest.mark.asyncio
+async def test_only_stale_jobs_are_requeued(sessions, job):
+    """Test that a running job is requeued only after its lease expires."""
+    async with sessions() as session:
+        service = JobService(session=session)
+        await service.claim(job.id)
+
+        assert await service.requeue_stale(lease=60) == []
+
+        await service.update(
+            {"started_at": datetime.now(timezone.utc) - timedelta(minutes=2)},
+            item_id=job.id,
+            auto_commit=True,
+        )
+
+        assert await service.requeue_stale(lease=60) == [job.id]
+        assert [pending.id for pending in await service.list_pending()] == [
+            job.id
+        ]
+
+
+@pytest.mark.asyncio
+async def test_expired_claim_does_not_finish_the_job(sessions, job):
+    """Test that a worker whose job was requeued cannot store its result."""
+    async with sessions() as session:
+        stale = await JobService(session=session).claim(job.id)
+    async with sessions() as session:
+        service = JobService(session=session)
+        await service.update(
+            {"started_at": stale.started_at - timedelta(hours=2)},
+            item_id=job.id,
+            auto_commit=True,
+        )
+        await service.requeue_stale(lease=60)
+    async with sessions() as session:
+        current = await JobService(session=session).claim(job.id)
+
+    async with sessions() as session:
+        service = JobService(session=session)
+
+        assert not await service.mark_failed(stale, "stopped")
+        assert await service.mark_completed(current, [])
+        assert not await service.mark_completed(current, [])
+
+        finished = await service.get(job.id)
+
+    assert finished.status == JobStatus.COMPLETED
+    assert finished.audio_path is None
+    assert finished.error is None
+
+
+@pytest.mark.asyncio
+async def test_unknown_job_is_not_claimed(sessions):
+    """Test that claiming a missing job returns None."""
+    async with sessions() as session:
+        assert await JobService(session=session).claim(uuid.uuid4()) is None
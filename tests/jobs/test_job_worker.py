@@ -0,0 +1,68 @@
+import uuid
+from contextlib import asynccontextmanager
+
+import pytest
+
+from src.jobs import worker
+from src.jobs.models import JobModel
+from src.jobs.worker import JobWorker
+from src.transcription.enums import Model, ResultFormat
+from src.transcription.exceptions import AudioDecodeError
+
+
+class FakeJobService:
+    def __init__(self, job):
+        self.job = job
+        self.error = None
+
+    @asynccontextmanager
+    async def new(self, config):
+        yield self
+
+    async def claim(self, job_id):
+        return self.job
+
+    async def mark_failed(self, job, error):
+        self.error = error
+        return True
+
+
+class FailingTranscriptionService:
+    def __init__(self, error):
+        self.error = error
+
+    async def transcribe_file(self, path, model, language):
+        raise self.error
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("error", "message"),
+    [
+        (
+            AudioDecodeError("ffmpeg: /srv/uploads/a.wav: invalid data"),
+            "Failed to decode audio",
+        ),
+        (
+            RuntimeError("/srv/models/small: out of memory"),
+            "Transcription failed",
+        ),
+    ],
+)
+async def test_failed_job_stores_a_public_error(
+    monkeypatch, tmp_path, error, message
+):
+    """Test that a failed job stores a generic message, not the exception."""
+    job = JobModel(
+        id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        model=Model.SMALL,
+        result_format=ResultFormat.TEXT,
+        audio_path=str(tmp_path / "audio.wav"),
+    )
+    service = FakeJobService(job)
+    monkeypatch.setattr(worker, "JobService", service)
+
+    await JobWorker(FailingTranscriptionService(error))._process(job.id)
+
+    assert service.error == message
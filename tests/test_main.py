@@ -1,2 +1,24 @@
+import subprocess
+import sys
+
+
 def test_main():
     assert True
+
+
+def test_import_does_not_load_the_ml_stack():
+    """Test that importing the app leaves PyTorch and CTranslate2 unloaded."""
+    script = (
+        "import sys, src.main; "
+        "print([m for m in ('torch', 'ctranslate2', 'whisperx.asr') "
+        "if m in sys.modules])"
+    )
+
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    assert output.strip() == "[]"
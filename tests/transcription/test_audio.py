@@ -0,0 +1,108 @@
+import io
+import subprocess
+import wave
+
+import numpy as np
+import pytest
+
+from src.transcription import audio as audio_module
+from src.transcription.audio import SAMPLE_RATE, decode_audio
+from src.transcription.exceptions import AudioDecodeError
+
+
+def make_wav(samples: np.ndarray, rate: int = SAMPLE_RATE, channels=1):
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as f:
+        f.setnchannels(channels)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(samples.astype("<i2").tobytes())
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def no_ffmpeg(monkeypatch):
+    def run(*args, **kwargs):
+        raise AssertionError("ffmpeg must not be called")
+
+    monkeypatch.setattr(audio_module.subprocess, "run", run)
+
+
+def test_wav_bytes_are_decoded_without_ffmpeg(no_ffmpeg):
+    """Test that 16 kHz PCM WAV takes the in-process fast path."""
+    samples = np.array([0, 16384, -16384, 32767], dtype=np.int16)
+
+    audio = decode_audio(make_wav(samples))
+
+    assert audio.dtype == np.float32
+    np.testing.assert_allclose(audio, samples / 32768.0)
+
+
+def test_stereo_wav_is_downmixed(no_ffmpeg):
+    """Test that channels are averaged into a mono waveform."""
+    samples = np.array([16384, 0, -16384, -16384], dtype=np.int16)
+
+    audio = decode_audio(io.BytesIO(make_wav(samples, channels=2)))
+
+    np.testing.assert_allclose(audio, [0.25, -0.5])
+
+
+def test_wav_file_is_decoded_without_ffmpeg(no_ffmpeg, tmp_path):
+    """Test that WAV files on disk also take the fast path."""
+    path = tmp_path / "audio.wav"
+    path.write_bytes(make_wav(np.zeros(10, dtype=np.int16)))
+
+    assert len(decode_audio(str(path))) == 10
+
+
+def test_other_rates_are_piped_to_ffmpeg(monkeypatch):
+    """Test that audio needing resampling is fed to ffmpeg over stdin."""
+    calls = []
+
+    def run(cmd, input, capture_output, check):
+        calls.append((cmd, input))
+        out = np.array([16384], dtype=np.int16).tobytes()
+        return subprocess.CompletedProcess(cmd, 0, stdout=out)
+
+    monkeypatch.setattr(audio_module.subprocess, "run", run)
+    data = make_wav(np.zeros(10, dtype=np.int16), rate=44100)
+
+    audio = decode_audio(data)
+
+    np.testing.assert_allclose(audio, [0.5])
+    [(cmd, fed)] = calls
+    assert cmd[cmd.index("-i") + 1] == "pipe:0"
+    assert bytes(fed) == data
+
+
+@pytest.mark.parametrize("size", [0, 0xFFFFFFFF])
+def test_unknown_data_size_is_piped_to_ffmpeg(monkeypatch, size):
+    """Test that WAV streamed without a final data size is not truncated."""
+    calls = []
+
+    def run(cmd, input, capture_output, check):
+        calls.append(cmd)
+        out = np.zeros(10, dtype=np.int16).tobytes()
+        return subprocess.CompletedProcess(cmd, 0, stdout=out)
+
+    monkeypatch.setattr(audio_module.subprocess, "run", run)
+    data = bytearray(make_wav(np.zeros(10, dtype=np.int16)))
+    header = data.index(b"data")
+    data[header + 4 : header + 8] = size.to_bytes(4, "little")
+
+    audio = decode_audio(bytes(data))
+
+    assert len(audio) == 10
+    assert len(calls) == 1
+
+
+def test_ffmpeg_failure_raises(monkeypatch):
+    """Test that decoding errors surface as AudioDecodeError."""
+
+    def run(cmd, **kwargs):
+        raise subprocess.CalledProcessError(1, cmd, stderr=b"bad data")
+
+    monkeypatch.setattr(audio_module.subprocess, "run", run)
+
+    with pytest.raises(AudioDecodeError, match="bad data"):
+        decode_audio(b"not audio")
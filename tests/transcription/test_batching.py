@@ -0,0 +1,162 @@
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.config import settings
+from src.transcription import batching
+from src.transcription.batching import BatchScheduler
+from src.transcription.server import batch_scheduler_enabled
+
+
+def make_tokenizer(language: str = "en"):
+    return SimpleNamespace(task="transcribe", language_code=language)
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """Replaces model decoding with one that records each batch."""
+    calls = []
+    lock = threading.Lock()
+
+    def fake_decode(pipeline, chunks, tokenizer, beam_size=None):
+        with lock:
+            calls.append((tokenizer.language_code, len(chunks)))
+        return [
+            f"{tokenizer.language_code}:{int(chunk[0])}" for chunk in chunks
+        ]
+
+    monkeypatch.setattr(batching, "decode", fake_decode)
+    return calls
+
+
+def chunks(*values: int) -> list[np.ndarray]:
+    return [np.full(4, value, dtype=np.float32) for value in values]
+
+
+def test_decode_returns_texts_in_order(batches):
+    """Test that every caller gets the texts of its own chunks in order."""
+    scheduler = BatchScheduler(max_batch_size=2, max_wait=0.01)
+    try:
+        texts = scheduler.decode(object(), make_tokenizer(), chunks(1, 2, 3))
+    finally:
+        scheduler.close()
+
+    assert texts == ["en:1", "en:2", "en:3"]
+    assert [size for _, size in batches] == [2, 1]
+
+
+def test_concurrent_requests_share_batches(batches):
+    """Test that chunks from concurrent callers are decoded together."""
+    scheduler = BatchScheduler(max_batch_size=8, max_wait=0.2)
+    pipeline = object()
+    results = {}
+
+    def request(value: int) -> None:
+        results[value] = scheduler.decode(
+            pipeline, make_tokenizer(), chunks(value)
+        )
+
+    threads = [threading.Thread(target=request, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    scheduler.close()
+
+    assert results == {i: [f"en:{i}"] for i in range(4)}
+    assert sum(size for _, size in batches) == 4
+    assert len(batches) < 4
+
+
+def test_requested_batch_size_is_honoured(batches):
+    """Test that a caller's batch size is used, up to the scheduler's."""
+    scheduler = BatchScheduler(max_batch_size=4, max_wait=0.01)
+    pipeline = object()
+    try:
+        small = scheduler.decode(
+            pipeline, make_tokenizer(), chunks(1, 2, 3), batch_size=2
+        )
+        large = scheduler.decode(
+            pipeline, make_tokenizer(), chunks(*range(6)), batch_size=16
+        )
+    finally:
+        scheduler.close()
+
+    assert small == ["en:1", "en:2", "en:3"]
+    assert len(large) == 6
+    assert [size for _, size in batches] == [2, 1, 4, 2]
+
+
+def test_languages_are_not_mixed(batches):
+    """Test that chunks with different tokenizers never share a batch."""
+    scheduler = BatchScheduler(max_batch_size=8, max_wait=0.05)
+    pipeline = object()
+    try:
+        english = scheduler.submit(pipeline, make_tokenizer("en"), chunks(1))
+        russian = scheduler.submit(pipeline, make_tokenizer("ru"), chunks(2))
+        assert english[0].result() == "en:1"
+        assert russian[0].result() == "ru:2"
+    finally:
+        scheduler.close()
+
+    assert sorted(batches) == [("en", 1), ("ru", 1)]
+
+
+def test_decode_errors_reach_every_caller(monkeypatch):
+    """Test that a failing batch fails the futures of all its chunks."""
+
+    def failing_decode(pipeline, chunks, tokenizer, beam_size=None):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(batching, "decode", failing_decode)
+    scheduler = BatchScheduler(max_batch_size=4, max_wait=0.01)
+    try:
+        with pytest.raises(RuntimeError, match="boom"):
+            scheduler.decode(object(), make_tokenizer(), chunks(1, 2))
+    finally:
+        scheduler.close()
+
+
+def test_submit_after_close_fails(batches):
+    """Test that a closed scheduler rejects new work."""
+    scheduler = BatchScheduler()
+    scheduler.close()
+
+    with pytest.raises(RuntimeError):
+        scheduler.submit(object(), make_tokenizer(), chunks(1))
+
+
+def test_cancelled_chunks_are_not_decoded(batches):
+    """Test that chunks whose caller gave up are dropped from batches."""
+    scheduler = BatchScheduler(max_batch_size=4, max_wait=0.05)
+    try:
+        futures = scheduler.submit(object(), make_tokenizer(), chunks(1, 2, 3))
+        futures[1].cancel()
+
+        assert futures[0].result(timeout=5) == "en:1"
+        assert futures[2].result(timeout=5) == "en:3"
+        assert batches == [("en", 2)]
+    finally:
+        scheduler.close()
+
+
+@pytest.mark.parametrize(
+    ("enabled", "workers", "shared", "expected"),
+    [
+        (None, 1, False, False),
+        (None, 4, False, True),
+        (None, 1, True, True),
+        (True, 1, False, True),
+        (False, 4, True, False),
+    ],
+)
+def test_scheduler_is_enabled_with_concurrent_transcriptions(
+    monkeypatch, enabled, workers, shared, expected
+):
+    """Test that batching is on by default only when requests overlap."""
+    monkeypatch.setattr(settings, "BATCH_SCHEDULER_ENABLED", enabled)
+    monkeypatch.setattr(settings, "INFERENCE_WORKERS", workers)
+
+    assert batch_scheduler_enabled(shared) is expected
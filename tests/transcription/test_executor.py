@@ -0,0 +1,154 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.transcription.exceptions import InferenceQueueFullError
+from src.transcription.executor import InferenceExecutor
+
+
+@pytest.fixture
+def executor():
+    executor = InferenceExecutor(max_workers=1, max_pending=1)
+    yield executor
+    executor.shutdown(wait=False)
+
+
+@pytest.mark.asyncio
+async def test_run_returns_result(executor):
+    """Test that run executes the callable off the event loop thread."""
+    loop_thread = threading.get_ident()
+
+    result = await executor.run(threading.get_ident)
+
+    assert result != loop_thread
+    assert executor.admitted == 0
+
+
+@pytest.mark.asyncio
+async def test_run_propagates_exceptions(executor):
+    """Test that exceptions raised by the job reach the caller."""
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await executor.run(fail)
+    assert executor.admitted == 0
+
+
+@pytest.mark.asyncio
+async def test_run_rejects_when_saturated(executor):
+    """Test that jobs beyond workers + pending are rejected."""
+    release = threading.Event()
+
+    running = asyncio.ensure_future(executor.run(release.wait))
+    waiting = asyncio.ensure_future(executor.run(release.wait))
+    await asyncio.sleep(0)
+
+    assert executor.admitted == 2
+    with pytest.raises(InferenceQueueFullError):
+        await executor.run(release.wait)
+
+    release.set()
+    await asyncio.gather(running, waiting)
+    assert executor.admitted == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_keeps_slot_until_job_finishes(executor):
+    """Test that a cancelled await does not free the slot of a running job."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def job():
+        started.set()
+        release.wait()
+
+    task = asyncio.ensure_future(executor.run(job))
+    await asyncio.to_thread(started.wait)
+    task.cancel()
+    await asyncio.sleep(0)
+
+    assert executor.admitted == 1
+
+    release.set()
+    for _ in range(100):
+        if executor.admitted == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert executor.admitted == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_items_in_order(executor):
+    """Test that generator items reach the caller as they are produced."""
+
+    def count():
+        yield from range(3)
+
+    items = [item async for item in executor.stream(count)]
+
+    assert items == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_stream_propagates_exceptions(executor):
+    """Test that an error after some items ends the stream with it."""
+
+    def fail():
+        yield 1
+        raise RuntimeError("boom")
+
+    items = []
+    with pytest.raises(RuntimeError, match="boom"):
+        async for item in executor.stream(fail):
+            items.append(item)
+    assert items == [1]
+
+
+@pytest.mark.asyncio
+async def test_closed_stream_stops_the_generator(executor):
+    """Test that closing the stream early closes the generator."""
+    closed = threading.Event()
+
+    def endless():
+        try:
+            while True:
+                yield 1
+        finally:
+            closed.set()
+
+    stream = executor.stream(endless)
+    assert await anext(stream) == 1
+    await stream.aclose()
+
+    assert await asyncio.to_thread(closed.wait, 5)
+    for _ in range(100):
+        if executor.admitted == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert executor.admitted == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_rejects_when_saturated(executor):
+    """Test that saturation is reported before iterating the stream."""
+    release = threading.Event()
+    running = asyncio.ensure_future(executor.run(release.wait))
+    waiting = asyncio.ensure_future(executor.run(release.wait))
+    await asyncio.sleep(0)
+
+    with pytest.raises(InferenceQueueFullError):
+        executor.stream(iter, [])
+
+    release.set()
+    await asyncio.gather(running, waiting)
+
+
+def test_invalid_configuration():
+    """Test that invalid pool sizes are rejected."""
+    with pytest.raises(ValueError):
+        InferenceExecutor(max_workers=0)
+    with pytest.raises(ValueError):
+        InferenceExecutor(max_pending=-1)
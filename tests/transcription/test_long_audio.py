@@ -0,0 +1,117 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.transcription import speech_transcription
+from src.transcription.audio import SAMPLE_RATE
+from src.transcription.enums import Model
+from src.transcription.pipeline import to_segments
+from src.transcription.speech_transcription import SpeechTranscription
+
+
+@pytest.fixture
+def make_transcriber(monkeypatch):
+    """Builds transcribers whose VAD and model calls are faked."""
+    monkeypatch.setattr(
+        SpeechTranscription, "_load_model", lambda self, name: object()
+    )
+    monkeypatch.setattr(
+        SpeechTranscription, "_estimate_model_size", lambda self, name, p: 0
+    )
+    monkeypatch.setattr(
+        speech_transcription,
+        "detect_speech",
+        lambda pipeline, audio, chunk_size: [
+            {"start": float(i), "end": i + 1.2}
+            for i in range(len(audio) // SAMPLE_RATE)
+        ],
+    )
+    monkeypatch.setattr(
+        speech_transcription,
+        "get_tokenizer",
+        lambda pipeline, audio, language: SimpleNamespace(language_code="en"),
+    )
+    monkeypatch.setattr(
+        speech_transcription,
+        "split_audio",
+        lambda audio, chunks: [np.full(1, i) for i in range(len(chunks))],
+    )
+
+    transcribers = []
+
+    def make(**kwargs):
+        transcriber = SpeechTranscription(**kwargs)
+        transcribers.append(transcriber)
+        return transcriber
+
+    yield make
+    for transcriber in transcribers:
+        transcriber.clean()
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """Records the threads that decode batches and how many ran at once."""
+    state = {"threads": set(), "running": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def decode(pipeline, chunks, tokenizer, beam_size=None):
+        with lock:
+            state["threads"].add(threading.current_thread().name)
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.02)
+        with lock:
+            state["running"] -= 1
+        return [str(int(chunk[0])) for chunk in chunks]
+
+    monkeypatch.setattr(speech_transcription, "decode", decode)
+    return state
+
+
+def seconds(n: int) -> np.ndarray:
+    return np.zeros(n * SAMPLE_RATE, dtype=np.float32)
+
+
+def test_long_audio_is_decoded_on_every_replica(make_transcriber, decodes):
+    """Test that chunks of long audio run in parallel and stay in order."""
+    transcriber = make_transcriber(replicas=3, long_audio_seconds=10)
+
+    segments = transcriber.transcribe(seconds(12), Model.SMALL, batch_size=2)
+
+    assert [s["text"] for s in segments] == [str(i) for i in range(12)]
+    assert decodes["peak"] == 3
+    assert all(name.startswith("model-replica") for name in decodes["threads"])
+
+
+def test_short_audio_is_decoded_in_the_calling_thread(
+    make_transcriber, decodes
+):
+    """Test that audio below the threshold keeps the sequential path."""
+    transcriber = make_transcriber(replicas=3, long_audio_seconds=10)
+
+    segments = transcriber.transcribe(seconds(5), Model.SMALL, batch_size=2)
+
+    assert len(segments) == 5
+    assert decodes["peak"] == 1
+    assert decodes["threads"] == {threading.current_thread().name}
+
+
+def test_overlapping_chunks_are_stitched():
+    """Test that padded VAD chunks do not produce overlapping segments."""
+    chunks = [
+        {"start": 0.0, "end": 1.2},
+        {"start": 1.0, "end": 2.2},
+        {"start": 2.1, "end": 2.15},
+    ]
+
+    segments = to_segments(chunks, ["a", "b", "c"])
+
+    assert [(s["start"], s["end"]) for s in segments] == [
+        (0.0, 1.2),
+        (1.2, 2.2),
+        (2.2, 2.2),
+    ]
@@ -0,0 +1,119 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY, CollectorRegistry
+
+from src.main import app
+from src.transcription.collector import TranscriptionCollector
+from src.transcription.enums import Model
+from src.transcription.executor import InferenceExecutor
+from src.transcription.metrics import observe_transcription, timed
+from src.transcription.model_cache import ModelCacheStats
+from src.transcription.result_cache import MemoryResultCache
+
+
+class FakeTranscriber:
+    def model_cache_stats(self):
+        return ModelCacheStats(hits=3, misses=1, loads=1, load_seconds=2.5)
+
+    def model_memory(self):
+        return {"small": 1024}
+
+
+def sample(registry, name, labels=None):
+    return registry.get_sample_value(name, labels or {})
+
+
+def test_collector_reports_caches_and_queues():
+    """Test that component state is read when the registry is scraped."""
+    result_cache = MemoryResultCache()
+    result_cache.set("key", [])
+    result_cache.get("key")
+    executor = InferenceExecutor(max_workers=2, max_pending=3)
+    registry = CollectorRegistry()
+    registry.register(
+        TranscriptionCollector(
+            FakeTranscriber(),
+            executor,
+            result_cache,
+            job_queue_size=lambda: 7,
+        )
+    )
+
+    assert sample(registry, "model_cache_hits_total") == 3
+    assert sample(registry, "model_cache_load_seconds_total") == 2.5
+    assert sample(registry, "model_memory_bytes", {"model": "small"}) == 1024
+    assert sample(registry, "result_cache_hits_total") == 1
+    assert sample(registry, "result_cache_entries") == 1
+    assert sample(registry, "inference_jobs_admitted") == 0
+    assert sample(registry, "inference_jobs_limit") == 5
+    assert sample(registry, "transcription_job_queue_size") == 7
+    executor.shutdown()
+
+
+class ClosedTranscriber:
+    def model_cache_stats(self):
+        raise EOFError()
+
+    def model_memory(self):
+        raise EOFError()
+
+
+def test_collector_skips_models_of_a_closed_server():
+    """Test that a scrape succeeds while the inference server is gone."""
+    executor = InferenceExecutor(max_workers=2, max_pending=3)
+    registry = CollectorRegistry()
+    registry.register(
+        TranscriptionCollector(
+            ClosedTranscriber(), executor, None, job_queue_size=lambda: 0
+        )
+    )
+
+    assert sample(registry, "model_cache_hits_total") is None
+    assert sample(registry, "inference_jobs_limit") == 5
+    executor.shutdown()
+
+
+def test_stage_timings_are_observed_and_logged(caplog):
+    """Test that stages feed the histograms and the structured log line."""
+    timings = {}
+    before = sample(
+        REGISTRY, "transcription_stage_seconds_count", {"stage": "decode"}
+    )
+
+    with timed("decode", timings):
+        pass
+    with caplog.at_level("INFO", logger="src.transcription"):
+        observe_transcription("audio.wav", Model.SMALL, 10.0, timings)
+
+    after = sample(
+        REGISTRY, "transcription_stage_seconds_count", {"stage": "decode"}
+    )
+    assert after == (before or 0) + 1
+    assert set(timings) == {"decode"}
+    [record] = caplog.records
+    assert record.timings["audio_seconds"] == 10.0
+    assert "decode_seconds=" in record.getMessage()
+    assert (
+        sample(
+            REGISTRY,
+            "transcription_real_time_factor_count",
+            {"model": "small"},
+        )
+        >= 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_serves_prometheus_text():
+    """Test that /metrics exposes the default registry."""
+    with timed("format"):
+        pass
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'transcription_stage_seconds_count{stage="format"}' in response.text
@@ -0,0 +1,202 @@
+import threading
+import time
+
+import pytest
+
+from src.transcription.model_cache import ModelCache
+
+
+class Loader:
+    def __init__(self):
+        self.loaded = []
+
+    def __call__(self, key: str) -> str:
+        self.loaded.append(key)
+        return f"model-{key}"
+
+
+@pytest.fixture
+def loader():
+    return Loader()
+
+
+def test_acquire_loads_once(loader):
+    """Test that a cached model is loaded only on first use."""
+    cache = ModelCache(loader)
+
+    with cache.acquire("small") as model:
+        assert model == "model-small"
+    with cache.acquire("small"):
+        pass
+
+    assert loader.loaded == ["small"]
+
+
+def test_evicts_least_recently_used(loader):
+    """Test that the least recently used model goes first."""
+    evicted = []
+    cache = ModelCache(loader, max_models=2, on_evict=evicted.append)
+
+    cache.load("small")
+    cache.load("medium")
+    cache.load("small")
+    cache.load("turbo")
+
+    assert cache.keys() == ["small", "turbo"]
+    assert evicted == ["medium"]
+
+
+def test_pinned_models_are_not_evicted(loader):
+    """Test that pinned models survive eviction."""
+    cache = ModelCache(loader, max_models=2)
+
+    cache.load("small", pin=True)
+    cache.load("medium")
+    cache.load("turbo")
+
+    assert "small" in cache
+    assert "medium" not in cache
+
+
+def test_models_in_use_are_not_evicted(loader):
+    """Test that an acquired model is never evicted, even when least recent."""
+    cache = ModelCache(loader, max_models=1)
+
+    with cache.acquire("small"):
+        with cache.acquire("medium"):
+            assert cache.keys() == ["small", "medium"]
+        assert cache.keys() == ["small"]
+
+    assert cache.keys() == ["small"]
+
+
+def test_memory_budget(loader):
+    """Test that models are evicted to stay within the memory budget."""
+    sizes = {"small": 40, "medium": 70, "turbo": 50}
+    cache = ModelCache(
+        loader, size_of=lambda key, _: sizes[key], memory_budget=100
+    )
+
+    cache.load("small")
+    cache.load("turbo")
+    assert cache.memory_usage == 90
+
+    cache.load("medium")
+    assert cache.keys() == ["medium"]
+    assert cache.memory_usage == 70
+
+
+def test_unpin_allows_eviction(loader):
+    """Test that unpinning an over-limit model evicts it."""
+    cache = ModelCache(loader, max_models=1)
+
+    cache.load("small", pin=True)
+    cache.load("medium", pin=True)
+    assert len(cache) == 2
+
+    cache.unpin("small")
+    assert cache.keys() == ["medium"]
+
+
+def test_concurrent_misses_load_once():
+    """Test that concurrent callers missing on one model share a single load."""
+    started = threading.Event()
+    release = threading.Event()
+    loads = []
+
+    def slow_loader(key: str) -> str:
+        loads.append(key)
+        started.set()
+        release.wait()
+        return f"model-{key}"
+
+    cache = ModelCache(slow_loader)
+    results = []
+
+    def acquire() -> None:
+        with cache.acquire("small") as model:
+            results.append(model)
+
+    leader = threading.Thread(target=acquire)
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=acquire) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    stats = cache.stats()
+    assert loads == ["small"]
+    assert results == ["model-small"] * 4
+    assert stats.loads == 1
+    assert stats.misses == 1
+    assert stats.waits == 3
+    assert stats.wait_seconds > 0
+
+
+def test_failed_load_is_shared_and_retried():
+    """Test that waiters see the load error and a later call retries."""
+    attempts = []
+
+    def flaky_loader(key: str) -> str:
+        attempts.append(key)
+        if len(attempts) == 1:
+            raise RuntimeError("download failed")
+        return f"model-{key}"
+
+    cache = ModelCache(flaky_loader)
+
+    with pytest.raises(RuntimeError):
+        cache.load("small")
+    cache.load("small")
+
+    assert attempts == ["small", "small"]
+    assert cache.stats().load_failures == 1
+
+
+def test_interrupted_load_wakes_up_waiters():
+    """Test that an interrupted load wakes its waiters and can be retried."""
+    started = threading.Event()
+    release = threading.Event()
+    attempts = []
+
+    class Interrupted(BaseException):
+        pass
+
+    def loader(key: str) -> str:
+        attempts.append(key)
+        if len(attempts) == 1:
+            started.set()
+            release.wait()
+            raise Interrupted()
+        return f"model-{key}"
+
+    cache = ModelCache(loader)
+    errors = []
+
+    def load() -> None:
+        try:
+            cache.load("small")
+        except BaseException as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=load)
+    leader.start()
+    started.wait()
+    follower = threading.Thread(target=load)
+    follower.start()
+    time.sleep(0.05)
+    release.set()
+    leader.join(5)
+    follower.join(5)
+
+    assert sorted(type(error).__name__ for error in errors) == [
+        "Interrupted",
+        "RuntimeError",
+    ]
+    cache.load("small")
+    assert "small" in cache
+    assert cache.stats().load_failures == 1
@@ -0,0 +1,187 @@
+import threading
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+
+from src.main import app
+from src.transcription import speech_transcription
+from src.transcription.dependencies import provide_transcription_service
+from src.transcription.enums import Model, ModelState
+from src.transcription.speech_transcription import SpeechTranscription
+from src.transcription.tuning import InferenceOptions
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Fakes model loading; loads block until their model is released."""
+    released = {model.value: threading.Event() for model in Model}
+
+    def load(self, name):
+        released[name].wait(5)
+        if name == Model.MEDIUM.value:
+            raise RuntimeError("download failed")
+        return object()
+
+    monkeypatch.setattr(SpeechTranscription, "_load_model", load)
+    monkeypatch.setattr(
+        SpeechTranscription, "_estimate_model_size", lambda self, name, p: 0
+    )
+    return released
+
+
+def wait_until(predicate) -> None:
+    event = threading.Event()
+    for _ in range(100):
+        if predicate():
+            return
+        event.wait(0.01)
+    raise AssertionError("condition not reached")
+
+
+def test_models_load_in_the_background(loads):
+    """Test that the constructor returns before the preloaded models load."""
+    transcriber = SpeechTranscription(
+        init_models=[Model.SMALL, Model.MEDIUM, Model.TURBO],
+        preload_in_background=True,
+    )
+
+    assert transcriber.model_states()[Model.TURBO] == ModelState.PENDING
+    assert transcriber.loaded_models == []
+
+    for event in loads.values():
+        event.set()
+    wait_until(
+        lambda: transcriber.model_states()[Model.TURBO] == ModelState.READY
+    )
+
+    assert transcriber.model_states() == {
+        Model.SMALL: ModelState.READY,
+        Model.MEDIUM: ModelState.FAILED,
+        Model.TURBO: ModelState.READY,
+    }
+    assert transcriber.loaded_models == ["small", "turbo"]
+    transcriber.clean()
+
+
+def test_foreground_preload_raises_load_errors(loads):
+    """Test that a blocking preload still fails loudly."""
+    for event in loads.values():
+        event.set()
+
+    with pytest.raises(RuntimeError, match="download failed"):
+        SpeechTranscription(init_models=[Model.MEDIUM])
+
+
+class StatesService:
+    def __init__(self, states):
+        self.states = states
+
+    def model_states(self):
+        return self.states
+
+
+@pytest.mark.asyncio
+async def test_readiness_waits_for_every_preloaded_model():
+    """Test that readiness is 503 until every preloaded model is ready."""
+    service = StatesService(
+        {Model.SMALL: ModelState.READY, Model.MEDIUM: ModelState.LOADING}
+    )
+    app.dependency_overrides[provide_transcription_service] = lambda: service
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        loading = await client.get("/readiness")
+        service.states[Model.MEDIUM] = ModelState.READY
+        ready = await client.get("/readiness")
+        alive = await client.get("/healthcheck")
+    app.dependency_overrides.clear()
+
+    assert loading.status_code == 503
+    assert loading.json() == {
+        "ready": False,
+        "models": {"small": "ready", "medium": "loading"},
+    }
+    assert ready.status_code == 200
+    assert ready.json()["ready"] is True
+    assert alive.status_code == 200
+
+
+@pytest.fixture
+def warm_up_calls(loads, monkeypatch):
+    """Fakes the pipeline steps of the warm-up and records the decodes."""
+    calls = []
+    for event in loads.values():
+        event.set()
+    monkeypatch.setattr(
+        speech_transcription, "detect_speech", lambda *args: [{}]
+    )
+    monkeypatch.setattr(
+        speech_transcription, "get_tokenizer", lambda *args: "tokenizer"
+    )
+
+    def decode(pipeline, chunks, tokenizer, beam_size=None):
+        if pipeline == "broken":
+            raise RuntimeError("out of memory")
+        calls.append((len(chunks), tokenizer, beam_size))
+        return [""] * len(chunks)
+
+    monkeypatch.setattr(speech_transcription, "decode", decode)
+    return calls
+
+
+def test_preloaded_models_are_warmed_up(warm_up_calls):
+    """Test that a batch of the tuned size runs through each loaded model."""
+    transcriber = SpeechTranscription(
+        init_models=[Model.SMALL, Model.TURBO],
+        warm_up=True,
+        default_options=InferenceOptions(batch_size=3, beam_size=2),
+    )
+
+    assert warm_up_calls == [(3, "tokenizer", 2)] * 2
+    assert transcriber.model_states() == {
+        Model.SMALL: ModelState.READY,
+        Model.TURBO: ModelState.READY,
+    }
+    assert (
+        REGISTRY.get_sample_value("model_warm_up_seconds", {"model": "turbo"})
+        is not None
+    )
+    transcriber.clean()
+
+
+def test_failed_warm_up_keeps_the_model(warm_up_calls, monkeypatch):
+    """Test that a model whose warm-up fails is still ready."""
+    monkeypatch.setattr(
+        SpeechTranscription, "_load_model", lambda self, name: "broken"
+    )
+
+    transcriber = SpeechTranscription(init_models=[Model.SMALL], warm_up=True)
+
+    assert warm_up_calls == []
+    assert transcriber.model_states() == {Model.SMALL: ModelState.READY}
+    transcriber.clean()
+
+
+def test_models_are_built_for_batched_decoding(monkeypatch):
+    """Test that the pipeline gets the WhisperX model with its tuning."""
+    from whisperx import asr
+
+    built = {}
+
+    def init(self, name, **kwargs):
+        built.update(kwargs, name=name)
+
+    monkeypatch.setattr(asr.WhisperModel, "__init__", init)
+    monkeypatch.setattr(
+        asr, "load_model", lambda whisper_arch, model, **kwargs: model
+    )
+    transcriber = SpeechTranscription(cpu_threads=3, replicas=2)
+
+    model = transcriber._load_model(Model.SMALL.value)
+
+    assert isinstance(model, asr.WhisperModel)
+    assert hasattr(model, "generate_segment_batched")
+    assert built["name"] == "small"
+    assert (built["cpu_threads"], built["num_workers"]) == (3, 2)
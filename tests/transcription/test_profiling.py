@@ -0,0 +1,127 @@
+import time
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.auth.security.dependencies import get_current_user
+from src.auth.security.schemas import TokenPayload
+from src.main import app
+from src.transcription.dependencies import provide_profiler
+from src.transcription.executor import InferenceExecutor
+from src.transcription.profiling import ProfileArtifact, TranscriptionProfiler
+from src.users.models import Role
+
+
+def spin(seconds: float) -> list[bytes]:
+    buffers = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        buffers.append(bytes(1024))
+    return buffers
+
+
+@pytest.mark.asyncio
+async def test_profile_samples_the_inference_thread(tmp_path):
+    """Test that work handed to the inference pool ends up in the profile."""
+    profiler = TranscriptionProfiler(str(tmp_path), interval=0.001)
+    executor = InferenceExecutor(max_workers=1)
+
+    async with profiler.profile(force=True, model="small") as profile_id:
+        buffers = await executor.run(spin, 0.2)
+    executor.shutdown()
+
+    [info] = profiler.profiles()
+    assert info["id"] == profile_id
+    assert info["model"] == "small"
+    assert info["samples"] > 0
+    assert info["peak_memory_bytes"] >= len(buffers) * 1024
+    with open(profiler.path(profile_id, ProfileArtifact.CPU)) as f:
+        stacks = f.read().splitlines()
+    assert any(
+        line.startswith("inference") and ";spin (" in line for line in stacks
+    )
+    with open(profiler.path(profile_id, ProfileArtifact.MEMORY)) as f:
+        report = f.read()
+    assert "test_profiling.py" in report
+
+
+@pytest.mark.asyncio
+async def test_unsampled_transcriptions_are_not_profiled(tmp_path):
+    """Test that nothing is recorded unless forced or sampled."""
+    profiler = TranscriptionProfiler(str(tmp_path), sample_rate=0.0)
+
+    async with profiler.profile() as profile_id:
+        spin(0.01)
+
+    assert profile_id is None
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_one_transcription_is_profiled_at_a_time(tmp_path):
+    """Test that a profile is skipped while another one runs."""
+    profiler = TranscriptionProfiler(str(tmp_path))
+
+    async with profiler.profile(force=True) as outer:
+        async with profiler.profile(force=True) as inner:
+            pass
+
+    assert outer is not None
+    assert inner is None
+
+
+@pytest.mark.asyncio
+async def test_old_profiles_are_deleted(tmp_path):
+    """Test that only the most recent profiles are kept."""
+    profiler = TranscriptionProfiler(str(tmp_path), max_kept=2)
+
+    ids = []
+    for _ in range(3):
+        async with profiler.profile(force=True) as profile_id:
+            ids.append(profile_id)
+
+    assert [info["id"] for info in profiler.profiles()] == ids[:0:-1]
+    assert profiler.path(ids[0], ProfileArtifact.CPU) is None
+    assert len(list(tmp_path.iterdir())) == 6
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    profiler = TranscriptionProfiler(str(tmp_path))
+    app.dependency_overrides[provide_profiler] = lambda: profiler
+    yield profiler
+    app.dependency_overrides.clear()
+
+
+def login(role: Role) -> None:
+    user = TokenPayload(id=uuid.uuid4(), role=role)
+    app.dependency_overrides[get_current_user] = lambda: user
+
+
+@pytest.mark.asyncio
+async def test_admins_download_profiles(profiler):
+    """Test that profiles are listed and served to admins only."""
+    async with profiler.profile(
+        force=True, model="small", language=None, result_format="text"
+    ) as profile_id:
+        spin(0.05)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        login(Role.USER)
+        forbidden = await client.get("/transcription/profiles")
+        login(Role.ADMIN)
+        listed = await client.get("/transcription/profiles")
+        cpu = await client.get(f"/transcription/profiles/{profile_id}/cpu")
+        missing = await client.get(
+            f"/transcription/profiles/{uuid.uuid4()}/memory"
+        )
+
+    assert forbidden.status_code == 403
+    assert [p["id"] for p in listed.json()["profiles"]] == [profile_id]
+    assert cpu.status_code == 200
+    assert cpu.text.startswith("MainThread;")
+    assert missing.status_code == 404
+    assert missing.headers["X-Error-Code"] == "PROFILE_NOT_FOUND"
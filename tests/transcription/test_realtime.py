@@ -0,0 +1,273 @@
+import json
+import uuid
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from src.auth.security.schemas import TokenPayload
+from src.auth.security.token import create_access_token
+from src.main import app
+from src.transcription import realtime
+from src.transcription.audio import SAMPLE_RATE
+from src.transcription.dependencies import provide_transcription_service
+from src.transcription.exceptions import InferenceQueueFullError
+from src.transcription.realtime import LiveSegment, LiveTranscription
+from src.users.models import Role
+
+
+class FakeTranscriber:
+    @contextmanager
+    def acquire_model(self, model):
+        yield object()
+
+    def decode_chunks(
+        self, pipeline, tokenizer, chunks, batch_size, beam_size=None
+    ):
+        return [f"{len(chunk) / SAMPLE_RATE:.1f}s" for chunk in chunks]
+
+
+@pytest.fixture
+def vad(monkeypatch):
+    """Replaces VAD with a queue of canned speech chunks per step."""
+    steps = []
+    monkeypatch.setattr(
+        realtime, "detect_speech", lambda pipeline, audio, size: steps.pop(0)
+    )
+    monkeypatch.setattr(
+        realtime,
+        "get_tokenizer",
+        lambda pipeline, audio, language: SimpleNamespace(
+            language_code=language or "en"
+        ),
+    )
+    return steps
+
+
+def seconds(value: float) -> np.ndarray:
+    return np.zeros(int(value * SAMPLE_RATE), dtype=np.float32)
+
+
+def test_step_finalizes_closed_chunks(vad):
+    """Test that chunks followed by silence are final and their audio dropped."""
+    session = LiveTranscription(FakeTranscriber(), min_silence=0.5)
+    vad.append([{"start": 0.2, "end": 1.0}, {"start": 1.5, "end": 2.8}])
+    session.feed(seconds(3))
+
+    segments = session.step()
+
+    assert segments == [
+        LiveSegment(final=True, text="0.8s", start=0.2, end=1.0),
+        LiveSegment(final=False, text="1.3s", start=1.5, end=2.8),
+    ]
+    assert session.buffered_seconds == pytest.approx(2.0)
+    assert session.language == "en"
+
+    vad.append([{"start": 0.5, "end": 2.5}])
+    session.feed(seconds(1))
+    [segment] = session.step()
+
+    assert segment == LiveSegment(final=True, text="2.0s", start=1.5, end=3.5)
+    assert session.buffered_seconds == pytest.approx(0.5)
+
+
+def test_final_step_closes_every_chunk(vad):
+    """Test that the last step of a stream finalizes the open chunk."""
+    session = LiveTranscription(FakeTranscriber())
+    vad.append([{"start": 0.0, "end": 1.0}])
+    session.feed(seconds(1))
+
+    [segment] = session.step(final=True)
+
+    assert segment.final
+    assert session.buffered_seconds == 0
+
+
+def test_silence_is_dropped(vad):
+    """Test that audio without speech does not accumulate."""
+    session = LiveTranscription(FakeTranscriber(), min_silence=0.5)
+    vad.append([])
+    session.feed(seconds(5))
+
+    assert session.step() == []
+    assert session.buffered_seconds == pytest.approx(0.5)
+
+
+def test_odd_byte_is_carried_to_the_next_frame():
+    """Test that a sample split across two PCM frames is kept whole."""
+    session = LiveTranscription(FakeTranscriber())
+    frame = np.array([1, -2, 300], dtype="<i2").tobytes()
+
+    session.feed_pcm16(frame[:3])
+    session.feed_pcm16(frame[3:])
+
+    samples = np.concatenate(session._incoming) * 32768.0
+    assert samples.tolist() == [1, -2, 300]
+
+
+class FakeSession:
+    def __init__(self):
+        self.samples = 0
+        self.pending = 0
+        self.language = "en"
+
+    @property
+    def pending_seconds(self):
+        return self.pending / SAMPLE_RATE
+
+    @property
+    def buffered_seconds(self):
+        return self.samples / SAMPLE_RATE
+
+    def feed_pcm16(self, frame):
+        self.samples += len(frame) // 2
+        self.pending += len(frame) // 2
+
+
+class MockTranscriptionService:
+    def __init__(self):
+        self.busy = 0
+        self.error = None
+        self.steps = []
+
+    async def start_live(self, model, language):
+        return FakeSession()
+
+    async def step_live(self, session, final=False):
+        if self.busy:
+            self.busy -= 1
+            raise InferenceQueueFullError("busy")
+        if self.error is not None:
+            raise self.error
+        self.steps.append(final)
+        session.pending = 0
+        end = session.samples / SAMPLE_RATE
+        return [LiveSegment(final=final, text="hi", start=0.0, end=end)]
+
+
+@pytest.fixture
+def service():
+    service = MockTranscriptionService()
+    app.dependency_overrides[provide_transcription_service] = lambda: service
+    yield service
+    app.dependency_overrides.clear()
+
+
+def token() -> str:
+    return create_access_token(TokenPayload(id=uuid.uuid4(), role=Role.USER))
+
+
+def pcm(value: float) -> bytes:
+    return np.zeros(int(value * SAMPLE_RATE), dtype="<i2").tobytes()
+
+
+def receive_until_done(websocket) -> list[dict]:
+    messages = []
+    while not messages or messages[-1]["type"] != "done":
+        messages.append(websocket.receive_json())
+    return messages
+
+
+def test_realtime_requires_a_valid_token(service):
+    """Test that connections without a valid JWT are refused."""
+    client = TestClient(app)
+
+    with pytest.raises(WebSocketDisconnect) as err:
+        with client.websocket_connect("/transcription/realtime?token=bad"):
+            pass
+
+    assert err.value.code == 1008
+
+
+def test_realtime_streams_partial_and_final_segments(service):
+    """Test the message flow of a live transcription."""
+    client = TestClient(app)
+    url = f"/transcription/realtime?token={token()}&language=en"
+
+    with client.websocket_connect(url) as websocket:
+        websocket.send_bytes(pcm(1.0))
+        partial = websocket.receive_json()
+        websocket.send_bytes(pcm(0.5))
+        websocket.send_text(json.dumps({"type": "end"}))
+        messages = receive_until_done(websocket)
+
+    assert partial == {
+        "type": "partial",
+        "text": "hi",
+        "start": 0.0,
+        "end": 1.0,
+    }
+    assert messages == [
+        {"type": "final", "text": "hi", "start": 0.0, "end": 1.5},
+        {"type": "done", "language": "en"},
+    ]
+
+
+def test_realtime_accepts_bearer_header(service):
+    """Test that the token may also be sent as an Authorization header."""
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {token()}"}
+
+    with client.websocket_connect(
+        "/transcription/realtime", headers=headers
+    ) as websocket:
+        websocket.send_text(json.dumps({"type": "end"}))
+        messages = receive_until_done(websocket)
+
+    assert messages[-1]["type"] == "done"
+
+
+def test_realtime_retries_final_step_when_busy(service):
+    """Test that skipped steps are caught up and the final one is retried."""
+    service.busy = 2
+    client = TestClient(app)
+
+    with client.websocket_connect(
+        f"/transcription/realtime?token={token()}"
+    ) as websocket:
+        websocket.send_bytes(pcm(1.0))
+        websocket.send_text(json.dumps({"type": "end"}))
+        messages = receive_until_done(websocket)
+
+    assert service.steps == [True]
+    assert [message["type"] for message in messages] == ["final", "done"]
+
+
+def test_realtime_closes_when_falling_behind(service):
+    """Test that audio piling up while every step is rejected is refused."""
+    service.busy = 100
+    client = TestClient(app)
+
+    with client.websocket_connect(
+        f"/transcription/realtime?token={token()}"
+    ) as websocket:
+        for _ in range(4):
+            websocket.send_bytes(pcm(6.0))
+        message = websocket.receive_json()
+        with pytest.raises(WebSocketDisconnect) as err:
+            websocket.receive_json()
+
+    assert message["type"] == "error"
+    assert err.value.code == 1013
+    assert service.steps == []
+
+
+def test_realtime_closes_when_a_step_fails(service):
+    """Test that a failing step closes the stream with an internal error."""
+    service.error = RuntimeError("CUDA out of memory")
+    client = TestClient(app)
+
+    with client.websocket_connect(
+        f"/transcription/realtime?token={token()}"
+    ) as websocket:
+        websocket.send_bytes(pcm(1.0))
+        websocket.send_text(json.dumps({"type": "end"}))
+        message = websocket.receive_json()
+        with pytest.raises(WebSocketDisconnect) as err:
+            websocket.receive_json()
+
+    assert message == {"type": "error", "detail": "Transcription failed"}
+    assert err.value.code == 1011
@@ -0,0 +1,240 @@
+import io
+import threading
+from contextlib import contextmanager
+from multiprocessing.connection import Listener
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.transcription import realtime
+from src.transcription.audio import SAMPLE_RATE
+from src.transcription.enums import Model, ModelState
+from src.transcription.exceptions import AudioDecodeError
+from src.transcription.remote import InferenceServer, RemoteTranscriber
+from src.transcription.tuning import InferenceOptions
+
+AUTHKEY = b"secret"
+
+
+class FakeTranscriber:
+    def __init__(self):
+        self.calls = []
+        self.stream_closed = threading.Event()
+
+    def transcribe(self, audio, model, language=None, **options):
+        self.calls.append(("transcribe", audio, model, options))
+        if audio == b"broken":
+            raise AudioDecodeError("cannot decode")
+        return [{"text": "hello", "start": 0.0, "end": 1.0}]
+
+    def transcribe_iter(self, audio, model, language=None, **options):
+        try:
+            for index in range(100):
+                yield {"text": str(index), "start": index, "end": index + 1}
+        finally:
+            self.stream_closed.set()
+
+    def transcribe_many(self, audio_files, model, language=None, **options):
+        return [AudioDecodeError("bad"), [{"text": "ok"}]]
+
+    def model_states(self):
+        return {Model.SMALL: ModelState.READY}
+
+    def resolve_options(self, model, options=None):
+        self.calls.append(("resolve_options", model, options))
+        return InferenceOptions(batch_size=4, chunk_size=10, beam_size=5)
+
+    def model_cache_stats(self):
+        return None
+
+    def model_memory(self):
+        return {}
+
+    def inference_params(self, model, options=None):
+        return {}
+
+    @contextmanager
+    def acquire_model(self, model):
+        yield object()
+
+    def decode_chunks(
+        self, pipeline, tokenizer, chunks, batch_size, beam_size=None
+    ):
+        return [f"{len(chunk) / SAMPLE_RATE:.1f}s" for chunk in chunks]
+
+
+@pytest.fixture
+def server(tmp_path):
+    transcriber = FakeTranscriber()
+    address = str(tmp_path / "inference.sock")
+    server = InferenceServer(transcriber, address, AUTHKEY)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield SimpleNamespace(transcriber=transcriber, address=address)
+    server.close()
+    thread.join(5)
+
+
+@pytest.fixture
+def client(server):
+    client = RemoteTranscriber(server.address, AUTHKEY)
+    yield client
+    client.clean()
+
+
+def test_calls_are_forwarded_to_the_server(server, client):
+    """Test that results and audio sources cross the process boundary."""
+    segments = client.transcribe(
+        io.BytesIO(b"audio"), Model.MEDIUM, batch_size=2
+    )
+
+    assert segments == [{"text": "hello", "start": 0.0, "end": 1.0}]
+    assert server.transcriber.calls == [
+        ("transcribe", b"audio", Model.MEDIUM, {"batch_size": 2})
+    ]
+    assert client.model_states() == {Model.SMALL: ModelState.READY}
+
+
+def test_errors_are_raised_in_the_client(client):
+    """Test that exceptions keep their type and the connection stays usable."""
+    with pytest.raises(AudioDecodeError, match="cannot decode"):
+        client.transcribe(b"broken", Model.SMALL)
+
+    [error, result] = client.transcribe_many(["a.wav", "b.wav"], Model.SMALL)
+    assert isinstance(error, AudioDecodeError)
+    assert result == [{"text": "ok"}]
+
+
+def test_closing_a_stream_stops_the_server_generator(server, client):
+    """Test that a stream abandoned by the client stops on the server."""
+    segments = client.transcribe_iter("audio.wav", Model.SMALL)
+    first = [next(segments) for _ in range(3)]
+    segments.close()
+
+    assert [segment["text"] for segment in first] == ["0", "1", "2"]
+    assert server.transcriber.stream_closed.wait(5)
+    assert len(client.transcribe("audio.wav", Model.SMALL)) == 1
+
+
+def test_options_are_fetched_once(server, client):
+    """Test that tuning lookups on the event loop do not hit the server."""
+    for _ in range(3):
+        options = client.resolve_options(Model.SMALL)
+
+    assert options.batch_size == 4
+    assert [call[0] for call in server.transcriber.calls] == ["resolve_options"]
+
+
+def test_unreachable_server_reports_models_as_pending(tmp_path):
+    """Test that readiness stays false while the server is down."""
+    client = RemoteTranscriber(
+        str(tmp_path / "missing.sock"), AUTHKEY, models=[Model.SMALL]
+    )
+
+    assert client.model_states() == {Model.SMALL: ModelState.PENDING}
+    with pytest.raises(OSError):
+        client.transcribe("audio.wav", Model.SMALL)
+
+
+def test_stuck_server_does_not_hang_its_clients(tmp_path):
+    """Test that calls other than transcriptions time out."""
+    answered = threading.Event()
+    transcriber = FakeTranscriber()
+    transcriber.model_states = lambda: answered.wait(5)
+    transcriber.resolve_options = lambda *args: answered.wait(5)
+    address = str(tmp_path / "inference.sock")
+    server = InferenceServer(transcriber, address, AUTHKEY)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = RemoteTranscriber(
+        address, AUTHKEY, models=[Model.SMALL], call_timeout=0.1
+    )
+
+    try:
+        assert client.model_states() == {Model.SMALL: ModelState.PENDING}
+        with pytest.raises(TimeoutError):
+            client.resolve_options(Model.SMALL)
+    finally:
+        answered.set()
+        server.close()
+        thread.join(5)
+
+
+def closing_server(address: str, answers: list) -> threading.Thread:
+    """
+    Serves one connection per answer: the connection answers one call with
+    it, or none if it is None, and is then closed, as by a server that
+    stopped or restarted.
+    """
+
+    listener = Listener(address, family="AF_UNIX", authkey=AUTHKEY)
+
+    def serve() -> None:
+        with listener:
+            for answer in answers:
+                with listener.accept() as connection:
+                    connection.recv()
+                    if answer is not None:
+                        connection.send(("result", answer))
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_closed_connection_reports_models_as_pending(tmp_path):
+    """Test that a server closing the connection does not fail readiness."""
+    address = str(tmp_path / "inference.sock")
+    thread = closing_server(address, [None])
+    client = RemoteTranscriber(address, AUTHKEY, models=[Model.SMALL])
+
+    assert client.model_states() == {Model.SMALL: ModelState.PENDING}
+    thread.join(5)
+
+
+def test_calls_are_retried_after_a_server_restart(tmp_path):
+    """Test that a pooled connection closed by the server is replaced."""
+    address = str(tmp_path / "inference.sock")
+    segments = [{"text": "hello", "start": 0.0, "end": 1.0}]
+    thread = closing_server(address, [{"small": 1}, segments, None])
+    client = RemoteTranscriber(address, AUTHKEY)
+
+    assert client.model_memory() == {"small": 1}
+    assert client.transcribe("audio.wav", Model.SMALL) == segments
+    with pytest.raises(EOFError):
+        client.transcribe("audio.wav", Model.SMALL)
+    thread.join(5)
+
+
+def test_live_sessions_run_in_the_server(client, monkeypatch):
+    """Test that live audio buffered in the client is stepped remotely."""
+    steps = [
+        [{"start": 0.2, "end": 1.0}, {"start": 1.5, "end": 2.8}],
+        [{"start": 0.5, "end": 2.5}],
+    ]
+    monkeypatch.setattr(
+        realtime, "detect_speech", lambda pipeline, audio, size: steps.pop(0)
+    )
+    monkeypatch.setattr(
+        realtime,
+        "get_tokenizer",
+        lambda pipeline, audio, language: SimpleNamespace(language_code="en"),
+    )
+    session = client.start_live(
+        Model.SMALL, None, chunk_size=10, batch_size=4, beam_size=None
+    )
+
+    session.feed(np.zeros(3 * SAMPLE_RATE, dtype=np.float32))
+    assert session.pending_seconds == pytest.approx(3.0)
+    first = session.step()
+    session.feed(np.zeros(SAMPLE_RATE, dtype=np.float32))
+    [last] = session.step(final=True)
+
+    assert [(s.final, s.text) for s in first] == [
+        (True, "0.8s"),
+        (False, "1.3s"),
+    ]
+    assert (last.final, last.start, last.end) == (True, 1.5, 3.5)
+    assert session.language == "en"
+    assert session.buffered_seconds == 0
@@ -0,0 +1,189 @@
+import pytest
+
+from src.transcription import result_cache as result_cache_module
+from src.transcription.enums import Language, Model
+from src.transcription.executor import InferenceExecutor
+from src.transcription.result_cache import (
+    MemoryResultCache,
+    SQLiteResultCache,
+    result_cache_key,
+)
+from src.transcription.services import SpeechTranscriptionService
+from src.transcription.tuning import InferenceOptions
+
+SEGMENTS = [{"text": "hello", "start": 0.0, "end": 1.0}]
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path):
+    caches = []
+
+    def make(**kwargs):
+        if request.param == "memory":
+            cache = MemoryResultCache(**kwargs)
+        else:
+            cache = SQLiteResultCache(str(tmp_path / "cache.db"), **kwargs)
+        caches.append(cache)
+        return cache
+
+    yield make
+    for cache in caches:
+        cache.close()
+
+
+def test_hit_and_miss_are_counted(make_cache):
+    """Test that lookups return stored segments and update the counters."""
+    cache = make_cache()
+
+    assert cache.get("key") is None
+    cache.set("key", SEGMENTS)
+
+    assert cache.get("key") == SEGMENTS
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.stores) == (1, 1, 1)
+
+
+def test_least_recently_used_entry_is_evicted(make_cache):
+    """Test that the cache keeps at most max_entries results."""
+    cache = make_cache(max_entries=2)
+    cache.set("a", SEGMENTS)
+    cache.set("b", SEGMENTS)
+    cache.get("a")
+
+    cache.set("c", SEGMENTS)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == SEGMENTS
+    assert cache.stats().evictions == 1
+
+
+def test_expired_entry_is_a_miss(make_cache, monkeypatch):
+    """Test that results older than the TTL are dropped."""
+    now = [1000.0]
+    monkeypatch.setattr(result_cache_module.time, "time", lambda: now[0])
+    monkeypatch.setattr(result_cache_module.time, "monotonic", lambda: now[0])
+    cache = make_cache(ttl=60)
+    cache.set("key", SEGMENTS)
+
+    now[0] += 61
+
+    assert cache.get("key") is None
+    assert cache.stats().expirations == 1
+    assert len(cache) == 0
+
+
+def test_sqlite_cache_survives_reopening(tmp_path):
+    """Test that the SQLite backend persists results."""
+    path = str(tmp_path / "cache.db")
+    cache = SQLiteResultCache(path)
+    cache.set("key", SEGMENTS)
+    cache.close()
+
+    cache = SQLiteResultCache(path)
+
+    assert cache.get("key") == SEGMENTS
+    cache.close()
+
+
+def test_key_depends_on_every_input():
+    """Test that model, language and parameters are part of the key."""
+    key = result_cache_key("abc", Model.SMALL, None, compute_type="int8")
+
+    assert key == result_cache_key(
+        "abc", Model.SMALL, None, compute_type="int8"
+    )
+    assert key != result_cache_key(
+        "abd", Model.SMALL, None, compute_type="int8"
+    )
+    assert key != result_cache_key(
+        "abc", Model.MEDIUM, None, compute_type="int8"
+    )
+    assert key != result_cache_key(
+        "abc", Model.SMALL, Language.ENGLISH, compute_type="int8"
+    )
+    assert key != result_cache_key(
+        "abc", Model.SMALL, None, compute_type="float32"
+    )
+
+
+class FakeTranscriber:
+    def __init__(self):
+        self.calls = 0
+
+    def inference_params(self, model, options=None):
+        return {"compute_type": "int8", "beam_size": 5, **options_of(options)}
+
+    def transcribe(self, audio_file, model, language=None, **options):
+        self.calls += 1
+        return SEGMENTS
+
+    def transcribe_iter(self, audio_file, model, language=None, **options):
+        self.calls += 1
+        yield from SEGMENTS
+
+
+def options_of(options):
+    return options.overrides() if options is not None else {}
+
+
+@pytest.mark.asyncio
+async def test_service_skips_the_model_on_a_hit(tmp_path):
+    """Test that identical audio is transcribed only once."""
+    transcriber = FakeTranscriber()
+    executor = InferenceExecutor(max_workers=1)
+    service = SpeechTranscriptionService(
+        transcriber, executor, result_cache=MemoryResultCache()
+    )
+    first = tmp_path / "first.wav"
+    second = tmp_path / "second.wav"
+    first.write_bytes(b"audio")
+    second.write_bytes(b"audio")
+
+    assert await service.transcribe_file(str(first)) == SEGMENTS
+    assert await service.transcribe_file(str(second)) == SEGMENTS
+    assert await service.transcribe_audio(b"audio") == SEGMENTS
+    await service.transcribe_file(str(first), model=Model.MEDIUM)
+
+    assert transcriber.calls == 2
+    assert service.result_cache_stats().hits == 2
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_streamed_transcript_is_cached():
+    """Test that a completed stream fills the cache for later requests."""
+    transcriber = FakeTranscriber()
+    executor = InferenceExecutor(max_workers=1)
+    service = SpeechTranscriptionService(
+        transcriber, executor, result_cache=MemoryResultCache()
+    )
+
+    first = [s async for s in await service.stream_audio(b"audio")]
+    second = [s async for s in await service.stream_audio(b"audio")]
+
+    assert first == second == SEGMENTS
+    assert await service.transcribe_audio(b"audio") == SEGMENTS
+    assert transcriber.calls == 1
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_options_that_change_the_text_are_part_of_the_key():
+    """Test that results are keyed on the resolved options of the call."""
+    transcriber = FakeTranscriber()
+    executor = InferenceExecutor(max_workers=1)
+    service = SpeechTranscriptionService(
+        transcriber, executor, result_cache=MemoryResultCache()
+    )
+
+    await service.transcribe_audio(b"audio")
+    await service.transcribe_audio(
+        b"audio", options=InferenceOptions(beam_size=5)
+    )
+    await service.transcribe_audio(
+        b"audio", options=InferenceOptions(beam_size=1)
+    )
+
+    assert transcriber.calls == 2
+    executor.shutdown()
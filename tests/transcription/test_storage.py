@@ -0,0 +1,87 @@
+import os
+import subprocess
+import sys
+
+from src.transcription import storage as storage_module
+from src.transcription.storage import TempStorage
+
+
+def dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def test_new_paths_are_unique(tmp_path):
+    """Test that each call returns a distinct path owned by this process."""
+    storage = TempStorage(str(tmp_path))
+
+    first = storage.new_path(".mp3")
+    second = storage.new_path(".mp3")
+
+    assert first != second
+    assert os.path.dirname(first) == str(tmp_path)
+    assert os.path.basename(first).startswith(f"{os.getpid()}-")
+    assert first.endswith(".mp3")
+
+
+def test_quota_limits_available_space(tmp_path):
+    """Test that stored files count against the quota."""
+    storage = TempStorage(str(tmp_path), quota_mb=2)
+    with open(storage.new_path(), "wb") as f:
+        f.write(b"a" * 1024 * 1024)
+
+    assert storage.available() == 1024 * 1024
+
+    with open(storage.new_path(), "wb") as f:
+        f.write(b"a" * (1024 * 1024 + 1))
+
+    assert storage.available() == 0
+
+
+def test_min_free_space_limits_available_space(tmp_path):
+    """Test that the minimum free space is kept out of reach."""
+    storage = TempStorage(str(tmp_path), min_free_mb=1024 * 1024 * 1024)
+
+    assert storage.available() == 0
+
+
+def test_ram_backed_space_is_bounded_by_memory(tmp_path, monkeypatch):
+    """Test that a tmpfs directory only offers the memory left."""
+    monkeypatch.setattr(
+        storage_module, "_filesystem_type", lambda path: "tmpfs"
+    )
+    monkeypatch.setattr(
+        storage_module, "_memory_available", lambda: 3 * 1024 * 1024
+    )
+    storage = TempStorage(str(tmp_path), min_free_mb=1)
+
+    assert storage.in_memory
+    assert storage.available() == 2 * 1024 * 1024
+
+
+def test_sweep_removes_orphans_only(tmp_path):
+    """Test that files of dead processes go and everything else stays."""
+    storage = TempStorage(str(tmp_path))
+    orphan = tmp_path / f"{dead_pid()}-{'a' * 32}.mp3"
+    stale = tmp_path / f"{os.getpid()}-{'b' * 32}.wav"
+    alive = tmp_path / f"{os.getppid()}-{'c' * 32}.wav"
+    unrelated = tmp_path / "notes.txt"
+    for path in (orphan, stale, alive, unrelated):
+        path.write_bytes(b"audio")
+
+    removed = storage.sweep()
+
+    assert removed == 2
+    assert sorted(tmp_path.iterdir()) == sorted([alive, unrelated])
+
+
+def test_sweep_removes_expired_files(tmp_path):
+    """Test that files older than max_age are removed even if owned."""
+    storage = TempStorage(str(tmp_path))
+    path = tmp_path / f"{os.getppid()}-{'a' * 32}"
+    path.write_bytes(b"audio")
+    os.utime(path, (0, 0))
+
+    assert storage.sweep(max_age=60) == 1
+    assert not path.exists()
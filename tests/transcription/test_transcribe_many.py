@@ -0,0 +1,96 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.transcription import speech_transcription
+from src.transcription.audio import SAMPLE_RATE
+from src.transcription.enums import Model
+from src.transcription.exceptions import AudioDecodeError
+from src.transcription.speech_transcription import SpeechTranscription
+
+
+class FakeAudio(SimpleNamespace):
+    def __len__(self):
+        return self.chunks * SAMPLE_RATE
+
+
+@pytest.fixture
+def transcriber(monkeypatch):
+    """A transcriber whose audio, VAD and model calls are faked."""
+    monkeypatch.setattr(
+        SpeechTranscription, "_load_model", lambda self, name: object()
+    )
+    monkeypatch.setattr(
+        SpeechTranscription, "_estimate_model_size", lambda self, name, p: 0
+    )
+
+    def decode_audio(file):
+        if file.startswith("broken"):
+            raise AudioDecodeError("broken")
+        # "<language>:<chunks>" describes the fake audio.
+        language, chunks = file.split(":")
+        return FakeAudio(language=language, chunks=int(chunks))
+
+    def detect_speech(pipeline, audio, chunk_size):
+        return [
+            {"start": float(i), "end": i + 0.5} for i in range(audio.chunks)
+        ]
+
+    def get_tokenizer(pipeline, audio, language):
+        return SimpleNamespace(
+            task="transcribe", language_code=language or audio.language
+        )
+
+    def split_audio(audio, chunks):
+        return [np.full(1, audio.chunks) for _ in chunks]
+
+    monkeypatch.setattr(speech_transcription, "decode_audio", decode_audio)
+    monkeypatch.setattr(speech_transcription, "detect_speech", detect_speech)
+    monkeypatch.setattr(speech_transcription, "get_tokenizer", get_tokenizer)
+    monkeypatch.setattr(speech_transcription, "split_audio", split_audio)
+
+    transcriber = SpeechTranscription()
+    yield transcriber
+    transcriber.clean()
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    calls = []
+
+    def decode(pipeline, chunks, tokenizer, beam_size=None):
+        if any(chunk[0] == 9 for chunk in chunks):
+            raise RuntimeError("bad chunk")
+        calls.append((tokenizer.language_code, len(chunks)))
+        return [f"{tokenizer.language_code}{int(c[0])}" for c in chunks]
+
+    monkeypatch.setattr(speech_transcription, "decode", decode)
+    return calls
+
+
+def test_files_of_a_language_share_batches(transcriber, batches):
+    """Test that chunks of several files are decoded in common batches."""
+    results = transcriber.transcribe_many(
+        ["en:1", "ru:2", "en:2", "en:0"], Model.SMALL, batch_size=4
+    )
+
+    assert sorted(batches) == [("en", 3), ("ru", 2)]
+    assert [[s["text"] for s in result] for result in results] == [
+        ["en1"],
+        ["ru2", "ru2"],
+        ["en2", "en2"],
+        [],
+    ]
+    assert results[2][1]["start"] == 1.0
+
+
+def test_failures_are_reported_per_file(transcriber, batches):
+    """Test that undecodable audio and failing chunks only fail their file."""
+    results = transcriber.transcribe_many(
+        ["en:1", "broken", "en:9"], Model.SMALL
+    )
+
+    assert [s["text"] for s in results[0]] == ["en1"]
+    assert isinstance(results[1], AudioDecodeError)
+    assert isinstance(results[2], RuntimeError)
@@ -0,0 +1,215 @@
+import json
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.auth.security.dependencies import get_current_user
+from src.auth.security.schemas import TokenPayload
+from src.config import settings
+from src.main import app
+from src.transcription.dependencies import (
+    provide_transcription_service,
+    provide_upload_storage,
+)
+from src.transcription.exceptions import (
+    AudioDecodeError,
+    InferenceQueueFullError,
+)
+from src.transcription.services import SpeechTranscriptionService
+from src.transcription.storage import TempStorage
+from src.transcription.tuning import InferenceOptions
+from src.users.models import Role
+
+USER = TokenPayload(id=uuid.uuid4(), role=Role.USER)
+
+SEGMENTS = [
+    {"text": " hello ", "start": 0.0, "end": 1.0},
+    {"text": "world", "start": 1.5, "end": 2.0},
+]
+
+
+class MockTranscriptionService:
+    def __init__(self, segments=SEGMENTS, error=None, busy=False):
+        self.segments = segments
+        self.error = error
+        self.busy = busy
+        self.calls = []
+        self.options = []
+
+    async def stream_audio(
+        self, audio, model, language, sha256=None, options=None
+    ):
+        if self.busy:
+            raise InferenceQueueFullError("busy")
+        with open(audio, "rb") as f:
+            self.calls.append((f.read(), model, language, sha256))
+        self.options.append(options)
+        return self._generate()
+
+    async def transcribe_batch(
+        self, paths, model, language, sha256s=None, options=None
+    ):
+        self.calls.append((paths, model, language, sha256s))
+        self.options.append(options)
+        return [
+            AudioDecodeError("bad") if index == 1 else SEGMENTS
+            for index in range(len(paths))
+        ]
+
+    format_result = SpeechTranscriptionService.format_result
+    _to_text = staticmethod(SpeechTranscriptionService._to_text)
+    _to_srt = staticmethod(SpeechTranscriptionService._to_srt)
+
+    async def _generate(self):
+        for segment in self.segments:
+            yield segment
+        if self.error is not None:
+            raise self.error
+
+
+@pytest.fixture
+async def client():
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
+
+
+@pytest.fixture
+def service():
+    return MockTranscriptionService()
+
+
+@pytest.fixture(autouse=True)
+def override_dependencies(service, tmp_path):
+    storage = TempStorage(str(tmp_path))
+    app.dependency_overrides[provide_upload_storage] = lambda: storage
+    app.dependency_overrides[provide_transcription_service] = lambda: service
+    app.dependency_overrides[get_current_user] = lambda: USER
+    yield
+    app.dependency_overrides.clear()
+
+
+async def stream(client, **data):
+    return await client.post(
+        "/transcription/transcribe/stream",
+        files={"file": ("audio.mp3", b"audio", "audio/mpeg")},
+        data=data,
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_one_segment_per_line(client, service, tmp_path):
+    """Test that segments are streamed as numbered NDJSON lines."""
+    response = await stream(client, model="medium", language="en")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == [
+        {"number": 1, "text": "hello", "start": 0.0, "end": 1.0},
+        {"number": 2, "text": "world", "start": 1.5, "end": 2.0},
+    ]
+    [(audio, model, language, sha256)] = service.calls
+    assert (audio, model.value, language.value) == (b"audio", "medium", "en")
+    assert sha256
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_late_errors_in_band(client, service):
+    """Test that a failure after the first segment ends with an error line."""
+    service.error = RuntimeError("boom")
+
+    response = await stream(client)
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert response.status_code == 200
+    assert len(lines) == 3
+    assert lines[-1] == {"error": "Transcription failed"}
+
+
+@pytest.mark.asyncio
+async def test_stream_when_busy(client, service, tmp_path):
+    """Test that saturation is a 503 before anything is streamed."""
+    service.busy = True
+
+    response = await stream(client)
+
+    assert response.status_code == 503
+    assert response.headers["X-Error-Code"] == "TRANSCRIPTION_BUSY"
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_a_result_per_file(client, service, tmp_path):
+    """Test that every uploaded file gets its own result or error."""
+    response = await client.post(
+        "/transcription/transcribe/batch",
+        files=[
+            ("files", ("a.wav", b"a", "audio/wav")),
+            ("files", ("b.wav", b"b", "audio/wav")),
+            ("files", ("c.wav", b"c", "audio/wav")),
+        ],
+        data={"result_format": "text"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "results": [
+            {
+                "filename": "a.wav",
+                "result": {"text": "hello world"},
+                "error": None,
+            },
+            {
+                "filename": "b.wav",
+                "result": None,
+                "error": "Failed to decode audio",
+            },
+            {
+                "filename": "c.wav",
+                "result": {"text": "hello world"},
+                "error": None,
+            },
+        ]
+    }
+    [(paths, _, _, sha256s)] = service.calls
+    assert len(paths) == len(set(paths)) == 3
+    assert all(sha256s)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_batch_without_files_is_rejected(client):
+    """Test that a batch request needs at least one file."""
+    response = await client.post(
+        "/transcription/transcribe/batch",
+        files={"file": ("a.wav", b"a", "audio/wav")},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "files"]
+
+
+@pytest.mark.asyncio
+async def test_inference_options_are_passed_to_the_service(client, service):
+    """Test that per-request overrides reach the service, unset ones as None."""
+    response = await stream(client, beam_size="2", batch_size="8")
+
+    assert response.status_code == 200
+    assert service.options == [
+        InferenceOptions(batch_size=8, chunk_size=None, beam_size=2)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_inference_options_above_the_limits_are_rejected(client, service):
+    """Test that overrides are bounded by the server-side maximums."""
+    response = await stream(
+        client, beam_size=str(settings.TRANSCRIPTION_MAX_BEAM_SIZE + 1)
+    )
+
+    assert response.status_code == 422
+    assert service.calls == []
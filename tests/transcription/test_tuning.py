@@ -0,0 +1,149 @@
+import argparse
+
+import pytest
+
+from src.transcription import autotune
+from src.transcription.enums import Model
+from src.transcription.speech_transcription import SpeechTranscription
+from src.transcription.tuning import (
+    InferenceOptions,
+    ModelTuning,
+    load_inference_profile,
+    save_inference_profile,
+)
+
+
+@pytest.fixture
+def make_transcriber(monkeypatch):
+    monkeypatch.setattr(
+        SpeechTranscription, "_load_model", lambda self, name: object()
+    )
+    transcribers = []
+
+    def make(**kwargs):
+        transcriber = SpeechTranscription(**kwargs)
+        transcribers.append(transcriber)
+        return transcriber
+
+    yield make
+    for transcriber in transcribers:
+        transcriber.clean()
+
+
+def test_unset_options_take_the_defaults():
+    """Test that only the fields set on a call override the defaults."""
+    defaults = InferenceOptions(batch_size=4, chunk_size=10, beam_size=5)
+
+    options = InferenceOptions(beam_size=1).merged(defaults)
+
+    assert options == InferenceOptions(batch_size=4, chunk_size=10, beam_size=1)
+
+
+def test_profile_round_trip(tmp_path):
+    """Test that tunings written by autotune are read back for each model."""
+    path = str(tmp_path / "profile.json")
+    defaults = ModelTuning(
+        cpu_threads=2,
+        options=InferenceOptions(batch_size=4, chunk_size=10, beam_size=5),
+    )
+    save_inference_profile(
+        path,
+        {
+            Model.SMALL: ModelTuning(
+                cpu_threads=8,
+                replicas=4,
+                options=InferenceOptions(batch_size=16),
+            )
+        },
+        host={"cores": 32},
+    )
+
+    tunings = load_inference_profile(path, defaults)
+
+    assert tunings == {
+        Model.SMALL: ModelTuning(
+            cpu_threads=8,
+            replicas=4,
+            options=InferenceOptions(batch_size=16, chunk_size=10, beam_size=5),
+        )
+    }
+
+
+def test_missing_profile_keeps_the_defaults(tmp_path):
+    """Test that a profile that was not generated yet is not an error."""
+    assert load_inference_profile(str(tmp_path / "missing.json")) == {}
+
+
+def test_model_tuning_shapes_the_cache_params(make_transcriber):
+    """Test that per-model defaults and per-call overrides are resolved."""
+    transcriber = make_transcriber(
+        default_options=InferenceOptions(beam_size=5),
+        model_tuning={
+            Model.MEDIUM: ModelTuning(
+                options=InferenceOptions(
+                    batch_size=8, chunk_size=20, beam_size=2
+                )
+            )
+        },
+    )
+
+    assert transcriber.inference_params(Model.SMALL) == {
+        "compute_type": "float32",
+        "chunk_size": 10,
+        "beam_size": 5,
+    }
+    assert transcriber.inference_params(
+        Model.MEDIUM, InferenceOptions(beam_size=3, batch_size=1)
+    ) == {"compute_type": "float32", "chunk_size": 20, "beam_size": 3}
+
+
+@pytest.fixture
+def tune(monkeypatch):
+    """Runs tune_model with a fake transcriber and measurement."""
+
+    class FakeTranscription:
+        def __init__(self, **kwargs):
+            pass
+
+        def clean(self):
+            pass
+
+    monkeypatch.setattr(autotune, "SpeechTranscription", FakeTranscription)
+    args = argparse.Namespace(
+        device="cpu", compute_type="int8", download_root=None, language="en"
+    )
+
+    def run(measure, batch_sizes):
+        monkeypatch.setattr(autotune, "measure", measure)
+        return autotune.tune_model(
+            Model.SMALL, [], batch_sizes, [(2, 1), (1, 2)], args
+        )
+
+    return run
+
+
+def test_autotune_skips_failed_trials(tune):
+    """Test that a failing trial is skipped and the fastest one is kept."""
+
+    def measure(transcriber, model, chunks, batch_size, replicas, language):
+        if batch_size == 8:
+            raise RuntimeError("out of memory")
+        return batch_size * replicas
+
+    tuning, trials = tune(measure, [1, 4, 8])
+
+    assert tuning == ModelTuning(
+        cpu_threads=1, replicas=2, options=InferenceOptions(batch_size=4)
+    )
+    assert len(trials) == 4
+
+
+def test_autotune_without_successful_trials(tune):
+    """Test that a model is left untuned when every trial fails."""
+
+    def measure(*args):
+        raise RuntimeError("out of memory")
+
+    assert tune(measure, [1, 2]) == (None, [])
+    with pytest.raises(ValueError):
+        tune(measure, [])
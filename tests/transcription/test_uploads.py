@@ -0,0 +1,208 @@
+import hashlib
+
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from src.transcription.schemas import TranscriptionForm
+from src.transcription.storage import TempStorage
+from src.transcription.uploads import receive_form, require_file, validate_form
+
+MAX_FILE_SIZE = 1024
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = FastAPI()
+
+    @app.post("/upload")
+    async def upload(request: Request):
+        form = await receive_form(
+            request,
+            storage=TempStorage(str(tmp_path)),
+            max_file_size=MAX_FILE_SIZE,
+        )
+        try:
+            file = require_file(form)
+            options = validate_form(TranscriptionForm, form)
+        except BaseException:
+            form.cleanup()
+            raise
+        return {
+            "filename": file.filename,
+            "path": file.path,
+            "size": file.size,
+            "sha256": file.sha256,
+            "model": options.model,
+        }
+
+    return app
+
+
+@pytest.fixture
+async def client(app):
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
+
+
+@pytest.mark.asyncio
+async def test_upload_is_streamed_to_disk(client, tmp_path):
+    """Test that the file is stored under a unique name with its hash."""
+    content = b"audio" * 100
+
+    response = await client.post(
+        "/upload",
+        files={"file": ("../audio.mp3", content, "audio/mpeg")},
+        data={"model": "medium"},
+    )
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data["filename"] == "audio.mp3"
+    assert data["size"] == len(content)
+    assert data["sha256"] == hashlib.sha256(content).hexdigest()
+    assert data["model"] == "medium"
+    assert data["path"].startswith(str(tmp_path))
+    assert data["path"].endswith(".mp3")
+    with open(data["path"], "rb") as f:
+        assert f.read() == content
+
+
+@pytest.mark.asyncio
+async def test_upload_names_are_unique(client):
+    """Test that two uploads with the same filename do not collide."""
+    files = {"file": ("audio.mp3", b"audio", "audio/mpeg")}
+
+    first = (await client.post("/upload", files=files)).json()
+    second = (await client.post("/upload", files=files)).json()
+
+    assert first["path"] != second["path"]
+
+
+@pytest.mark.asyncio
+async def test_oversized_upload_is_rejected(client, tmp_path):
+    """Test that files over the limit get 413 and leave nothing behind."""
+    response = await client.post(
+        "/upload",
+        files={"file": ("audio.mp3", b"a" * (MAX_FILE_SIZE + 1), "audio/mpeg")},
+    )
+
+    assert response.status_code == 413
+    assert response.headers["X-Error-Code"] == "FILE_TOO_LARGE"
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_invalid_fields_clean_up_the_file(client, tmp_path):
+    """Test that invalid form fields are a 422 and the file is removed."""
+    response = await client.post(
+        "/upload",
+        files={"file": ("audio.mp3", b"audio", "audio/mpeg")},
+        data={"model": "huge"},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "model"]
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_missing_file_is_rejected(client):
+    """Test that a form without the file field is a 422."""
+    response = await client.post(
+        "/upload",
+        files={"other": ("audio.mp3", b"audio", "audio/mpeg")},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "file"]
+
+
+@pytest.mark.asyncio
+async def test_non_multipart_request_is_rejected(client):
+    """Test that requests without a multipart body are a 400."""
+    response = await client.post("/upload", json={"file": "audio"})
+
+    assert response.status_code == 400
+    assert response.headers["X-Error-Code"] == "INVALID_UPLOAD"
+
+
+@pytest.mark.asyncio
+async def test_malformed_body_is_rejected(client, tmp_path):
+    """Test that a body not matching its boundary is a 400."""
+    response = await client.post(
+        "/upload",
+        content=b"--other\r\nnot a part\r\n",
+        headers={"Content-Type": "multipart/form-data; boundary=boundary"},
+    )
+
+    assert response.status_code == 400
+    assert response.headers["X-Error-Code"] == "INVALID_UPLOAD"
+    assert list(tmp_path.iterdir()) == []
+
+
+def chunked_body(content: bytes, boundary: str = "boundary"):
+    async def body():
+        yield (
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="file"; '
+            'filename="audio.mp3"\r\n'
+            "Content-Type: audio/mpeg\r\n\r\n"
+        ).encode()
+        for start in range(0, len(content), 100):
+            yield content[start : start + 100]
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    return {
+        "content": body(),
+        "headers": {
+            "Content-Type": f"multipart/form-data; boundary={boundary}"
+        },
+    }
+
+
+@pytest.fixture
+def limited_storage(monkeypatch):
+    """600 bytes are left at first, then other uploads take them."""
+    available = iter([600])
+    monkeypatch.setattr(
+        TempStorage, "available", lambda self: next(available, 0)
+    )
+
+
+@pytest.mark.asyncio
+async def test_chunked_upload_fitting_the_storage_is_accepted(
+    client, limited_storage
+):
+    """Test that an upload without a length is checked by what it writes."""
+    response = await client.post("/upload", **chunked_body(b"a" * 500))
+
+    assert response.status_code == 200
+    assert response.json()["size"] == 500
+
+
+@pytest.mark.asyncio
+async def test_chunked_upload_exceeding_the_storage_is_rejected(
+    client, tmp_path, limited_storage
+):
+    """Test that an upload stops with 507 once the storage is full."""
+    response = await client.post("/upload", **chunked_body(b"a" * 1000))
+
+    assert response.status_code == 507
+    assert response.headers["X-Error-Code"] == "INSUFFICIENT_STORAGE"
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_upload_longer_than_the_storage_is_rejected_early(
+    client, limited_storage
+):
+    """Test that a Content-Length over the free space is a 507."""
+    response = await client.post(
+        "/upload",
+        files={"file": ("audio.mp3", b"a" * 1000, "audio/mpeg")},
+    )
+
+    assert response.status_code == 507
@@ -0,0 +1,115 @@
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.users import cache as cache_module
+from src.users.cache import CachedUser, UserCache, user_cache
+from src.users.models import Role, UserModel
+from src.users.services import UserService
+
+
+def make_user(username: str = "user") -> CachedUser:
+    return CachedUser(
+        id=uuid.uuid4(),
+        username=username,
+        role=Role.USER,
+        is_active=True,
+    )
+
+
+def test_users_are_found_until_invalidated():
+    """Test that a cached user is found by ID until invalidated."""
+    cache = UserCache()
+    user = cache.put(make_user())
+
+    assert cache.get(user.id) is user
+
+    cache.invalidate(user.id)
+
+    assert cache.get(user.id) is None
+
+
+def test_expired_user_is_a_miss(monkeypatch):
+    """Test that users older than the TTL are read again."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = UserCache(ttl=30)
+    user = cache.put(make_user())
+
+    now[0] += 31
+
+    assert cache.get(user.id) is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_user_is_evicted():
+    """Test that the cache is bounded and drops its oldest user first."""
+    cache = UserCache(max_entries=2)
+    first = cache.put(make_user("first"))
+    second = cache.put(make_user("second"))
+    cache.get(first.id)
+    cache.put(make_user("third"))
+
+    assert cache.get(first.id) is first
+    assert cache.get(second.id) is None
+    assert len(cache) == 2
+
+
+def test_disabled_cache_stores_nothing():
+    """Test that a cache without entries always misses."""
+    cache = UserCache(max_entries=0)
+    user = cache.put(make_user())
+
+    assert cache.get(user.id) is None
+    assert len(cache) == 0
+
+
+@pytest.fixture
+def service(monkeypatch):
+    user_cache.clear()
+    service = UserService(session=MagicMock())
+    model = UserModel(
+        id=uuid.uuid4(), username="user", password="hash", role=Role.USER
+    )
+    model.is_active = True
+    queries = []
+
+    async def get_one_or_none(**filters):
+        queries.append(filters)
+        return model if filters["id"] == model.id else None
+
+    async def update(data, item_id, auto_commit):
+        model.password = data["password"]
+        return model
+
+    monkeypatch.setattr(service, "get_one_or_none", get_one_or_none)
+    monkeypatch.setattr(service, "update", update)
+    service.queries = queries
+    service.user_id = model.id
+    yield service
+    user_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_service_reads_a_user_once(service):
+    """Test that repeated lookups by ID hit the database once."""
+    first = await service.get_cached(service.user_id)
+    second = await service.get_cached(service.user_id)
+    missing = await service.get_cached(uuid.uuid4())
+
+    assert second is first
+    assert first.username == "user"
+    assert missing is None
+    assert len(service.queries) == 2
+
+
+@pytest.mark.asyncio
+async def test_service_invalidates_updated_users(service):
+    """Test that a user updated through the service is read again."""
+    await service.get_cached(service.user_id)
+
+    await service.update_password_hash(service.user_id, "new-hash")
+    await service.get_cached(service.user_id)
+
+    assert len(service.queries) == 2
@@ -0,0 +1,130 @@
+import json
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from src.auth.security.dependencies import get_current_user
+from src.auth.security.schemas import TokenPayload
+from src.main import app
+from src.users import routes as users_routes
+from src.users.dependencies import provide_user_service
+from src.users.models import Role, UserModel
+from src.users.services import UserService
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_users(count: int) -> list[UserModel]:
+    return [
+        UserModel(
+            id=uuid.uuid4(),
+            username=f"user{index}",
+            password="hash",
+            role=Role.USER,
+            is_active=True,
+            created_at=START + timedelta(seconds=index),
+        )
+        for index in range(count)
+    ]
+
+
+def make_service(users: list[UserModel]) -> UserService:
+    """A service whose repository filters and orders users in memory."""
+    service = UserService(session=MagicMock())
+    service.queries = []
+
+    async def list_after(limit, after=None, **filters):
+        service.queries.append({"limit": limit, "after": after, **filters})
+        return [
+            user
+            for user in users
+            if after is None or (user.created_at, user.id) > after
+        ][:limit]
+
+    service.repository.list_after = list_after
+    return service
+
+
+@pytest.fixture
+async def client():
+    app.dependency_overrides[get_current_user] = lambda: TokenPayload(
+        id=uuid.uuid4(), role=Role.ADMIN
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        yield ac
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.asyncio
+async def test_users_are_listed_page_by_page(client):
+    """Test that following the cursors visits every user once."""
+    service = make_service(make_users(5))
+    app.dependency_overrides[provide_user_service] = lambda: service
+
+    pages = []
+    params = {"limit": 2, "role": "user"}
+    while True:
+        response = await client.get("/users", params=params)
+        assert response.status_code == 200
+        pages.append([user["username"] for user in response.json()["users"]])
+        if response.json()["next_cursor"] is None:
+            break
+        params["cursor"] = response.json()["next_cursor"]
+
+    assert pages == [["user0", "user1"], ["user2", "user3"], ["user4"]]
+    assert all(query["limit"] == 3 for query in service.queries)
+    assert service.queries[0]["role"] == Role.USER
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected(client):
+    """Test that a cursor not issued by the API is a 422."""
+    app.dependency_overrides[provide_user_service] = lambda: make_service([])
+
+    response = await client.get("/users", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 422
+    assert response.headers["X-Error-Code"] == "INVALID_CURSOR"
+
+
+@pytest.mark.asyncio
+async def test_users_are_exported_as_ndjson(client, monkeypatch):
+    """Test that the export streams every matching user."""
+    service = make_service(make_users(5))
+
+    @asynccontextmanager
+    async def open_user_service():
+        yield service
+
+    monkeypatch.setattr(users_routes, "open_user_service", open_user_service)
+
+    response = await client.get("/users/export", params={"is_active": True})
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [line["username"] for line in lines] == [
+        f"user{index}" for index in range(5)
+    ]
+    assert service.queries[0]["is_active"] is True
+
+
+@pytest.mark.asyncio
+async def test_export_reads_users_in_batches():
+    """Test that the export continues each batch after the last user."""
+    users = make_users(5)
+    service = make_service(users)
+
+    exported = [user async for user in service.export(batch_size=2)]
+
+    assert exported == users
+    assert [query["after"] for query in service.queries] == [
+        None,
+        (users[1].created_at, users[1].id),
+        (users[3].created_at, users[3].id),
+    ]